@@ -0,0 +1,59 @@
+"""Benchmark gear lookups by name and the import of common_gear.
+
+Compares utils.lookup_gear, backed by a NameIndex, against the linear scan it
+replaced, then times a fresh interpreter importing osrs_tools.gear.common_gear.
+The tables and the osrsbox items load before the timer starts, so the import
+time is that of building the gear, where the lookups happen.
+
+Run with `python examples/benchmarks/name_index.py [calls]`.
+"""
+
+import subprocess
+import sys
+import timeit
+
+from osrs_tools import utils
+
+_IMPORT_SCRIPT = """
+import time
+
+import osrs_tools.utils
+from osrs_tools import data
+
+data.ITEMS
+start = time.perf_counter()
+import osrs_tools.gear.common_gear
+
+print(time.perf_counter() - start)
+"""
+
+
+def main(calls: int = 2000):
+    df = utils.GEAR_DF
+    names = df["name"].sample(n=calls, replace=True, random_state=0).tolist()
+
+    def scan():
+        for name in names:
+            df.loc[df["name"] == name]
+
+    def index():
+        for name in names:
+            utils.lookup_gear(name)
+
+    utils.gear_index()  # build outside the timing
+    scanned = min(timeit.repeat(scan, number=1, repeat=3)) / calls
+    indexed = min(timeit.repeat(index, number=1, repeat=3)) / calls
+
+    imports = [
+        float(subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT], capture_output=True, text=True).stdout)
+        for _ in range(3)
+    ]
+
+    print(f"scan:    {scanned * 1e6:8.1f} µs / lookup")
+    print(f"index:   {indexed * 1e6:8.1f} µs / lookup")
+    print(f"speedup: {scanned / indexed:8.2f}x")
+    print(f"import common_gear: {min(imports):.3f} s")
+
+
+if __name__ == "__main__":
+    main(*(int(_a) for _a in sys.argv[1:2]))
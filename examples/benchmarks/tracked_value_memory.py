@@ -0,0 +1,68 @@
+"""Measure the memory held by Gear objects and a large PvmAxes grid.
+
+Run with `python examples/benchmarks/tracked_value_memory.py`.
+"""
+
+import time
+import tracemalloc
+from typing import Callable
+
+from osrs_tools.analysis import PvmAxes
+from osrs_tools.boost.boosts import Overload
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.data import Skills
+from osrs_tools.gear import Equipment, Gear
+from osrs_tools.stats import PlayerLevels
+from osrs_tools.tracked_value import Level
+from osrs_tools.utils import GEAR_DF
+
+
+def measure(label: str, func: Callable[[], object]) -> object:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<24} {current / 2**20:8.2f} MiB held {peak / 2**20:8.2f} MiB peak {elapsed:8.2f} s")
+    return result
+
+
+def load_gear_table() -> list[Gear]:
+    gear: list[Gear] = []
+
+    for name in GEAR_DF["name"]:
+        try:
+            gear.append(Gear.from_bb(name))
+        except Exception:  # malformed or duplicate rows
+            continue
+
+    return gear
+
+
+def build_grid(gear: list[Gear]) -> PvmAxes:
+    # one equipment set per item & one levels object per attack/strength pair
+    equipment = [Equipment().equip(_g) for _g in gear]
+    levels: list[PlayerLevels] = []
+
+    for attack in range(1, 100):
+        for strength in range(1, 100, 7):
+            lvl = PlayerLevels.maxed_player()
+            lvl[Skills.ATTACK] = Level(attack)
+            lvl[Skills.STRENGTH] = Level(strength)
+            levels.append(lvl + Overload)
+
+    return PvmAxes.create(Player(), Monster.dummy(), equipment=equipment, levels=levels)
+
+
+def main():
+    gear = measure("gear table", load_gear_table)
+    grid = measure("PvmAxes grid", lambda: build_grid(gear))
+
+    print(f"{len(gear)} gear, grid dims {grid.squeezed_dims}")
+
+
+if __name__ == "__main__":
+    main()
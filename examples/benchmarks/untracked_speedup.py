@@ -0,0 +1,44 @@
+"""Benchmark PvMCalc.get_damage with and without provenance comments.
+
+Run with `python examples/benchmarks/untracked_speedup.py [calls]`.
+"""
+
+import sys
+import timeit
+
+from osrs_tools.boost.boosts import Overload
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.combat import PvMCalc
+from osrs_tools.data import Styles
+from osrs_tools.gear import AbyssalTentacle
+from osrs_tools.gear.equipment import Equipment
+from osrs_tools.prayer.all_prayers import Piety
+from osrs_tools.style.all_weapon_styles import WhipStyles
+from osrs_tools.tracked_value import untracked
+
+
+def main(calls: int = 2000):
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(AbyssalTentacle)
+    player.style = WhipStyles[Styles.LASH]
+    player.boost(Overload)
+    player.pray(Piety)
+
+    calc = PvMCalc(player, Monster.dummy())
+
+    tracked = min(timeit.repeat(calc.get_damage, number=calls, repeat=3)) / calls
+
+    with untracked():
+        fast = min(timeit.repeat(calc.get_damage, number=calls, repeat=3)) / calls
+        fast_damage = calc.get_damage()
+
+    assert fast_damage.mean_hit == calc.get_damage().mean_hit
+
+    print(f"tracked:   {tracked * 1e6:8.1f} µs / call")
+    print(f"untracked: {fast * 1e6:8.1f} µs / call")
+    print(f"speedup:   {tracked / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(_a) for _a in sys.argv[1:2]))
@@ -135,6 +135,7 @@ def mystics_estimates(scale: int, mode: MysticModes, **kwargs) -> tuple[float, i
         "spec_transfer_alts": 6,
         "dwh_target_per_mystic": 3,
         "dwh_health_remaining_ratio_threshold": 0.50,
+        "seed": None,
     }
     options.update(kwargs)
 
@@ -240,6 +241,7 @@ def mystics_estimates(scale: int, mode: MysticModes, **kwargs) -> tuple[float, i
         ticks_per_lad_attack = lad.attack_speed()
         ticks_per_dwh_specialist_action = int(dwh_specialist.attack_speed() + 2)
         thrall_dam = Damage.thrall()
+        rng = np.random.default_rng(options["seed"])
 
         for trial_index in trials:
             trial_ticks = 0
@@ -279,13 +281,11 @@ def mystics_estimates(scale: int, mode: MysticModes, **kwargs) -> tuple[float, i
 
                     else:
                         if tc % ticks_per_lad_attack == 0:
-                            random_hs = cached_dam.random_hits()
-                            assert isinstance(random_hs, int)
+                            random_hs = int(cached_dam.sample_total(rng=rng)[0])
                             mys.damage(lad, random_hs)
 
                         if tc % int(thrall_dam.attack_speed) == 0:
-                            random_hs = thrall_dam.random_hit()
-                            assert isinstance(random_hs, int)
+                            random_hs = int(thrall_dam.sample_total(rng=rng)[0])
                             mys.damage(lad, random_hs)
 
                         if dwh_landed < dwh_target:
@@ -11,3 +11,4 @@ Knights of the Round table, and it's the most maths heavy section.
 
 from .damage_axes import DamageAxes
 from .pvm_axes import PvmAxes
+from .result import AnalysisResult, AnalysisResultError
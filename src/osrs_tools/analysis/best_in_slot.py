@@ -0,0 +1,519 @@
+"""Best-in-slot search over the gear database
+
+galahad_the_pure finds the best loadouts for a player, style & target from
+every equipable item in GEAR_DF. The search is organised in three layers:
+
+    weapons: every (weapon, style) pair gets an optimistic bound, the best
+        bonus in every slot & the largest modifier in every slot, and pairs
+        whose bound can't beat the best loadouts found so far are skipped.
+    modifier gear & sets: gear that changes a roll or damage modifier (salve,
+        slayer helm, magic damage, inquisitor, ...) & whole sets with set
+        effects (void, inquisitor, obsidian, crystal, dharok) are enumerated
+        exhaustively, with a CalcPlan compiled for each combination.
+    bonus-only gear: the remaining slots only change the accuracy & strength
+        bonus. Dominated items are pruned per slot and the slots are merged
+        into a Pareto frontier of bonus pairs, which the plan evaluates in a
+        single vectorized call.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+from copy import copy
+from dataclasses import dataclass, replace
+from functools import cache
+from itertools import product
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+from osrs_tools.boost import Boost, Overload
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import AutocastError, Player
+from osrs_tools.combat import CalcPlan, CalcPlanError, PvMCalc
+from osrs_tools.data import DT, DataMode, Slots
+from osrs_tools.gear import Equipment, Gear, GearColumns, Weapon, common_gear
+from osrs_tools.gear.common_gear import BerserkerNecklace
+from osrs_tools.gear.gear import GearError
+from osrs_tools.prayer import Piety, Prayer, Prayers
+from osrs_tools.strategy import CombatStrategy
+from osrs_tools.style import PlayerStyle
+from osrs_tools.utils import GEAR_DF
+
+from .pareto import non_dominated, pareto_front
+from .utils import (
+    _MODIFIER_SETS,
+    _SWITCH_SCORES,
+    AnalysisError,
+    Loadout,
+    _data_mode_value,
+    _plan_signature,
+    _player_state,
+)
+
+###############################################################################
+# data                                                                        #
+###############################################################################
+
+# sets with set effects, worn whole, the weapons of a set are searched as weapons
+SET_EFFECTS: tuple[list[Gear], ...] = tuple(
+    [_g for _g in _set if _g.slot is not Slots.WEAPON] for _set in _MODIFIER_SETS
+)
+
+# gear whose modifier depends on the weapon, never pruned by dominance
+CONDITIONAL_GEAR: tuple[Gear, ...] = (BerserkerNecklace,)
+
+ARMOUR_SLOTS = tuple(_s for _s in Slots if _s is not Slots.WEAPON)
+
+# what a failed item lookup raises, anything else is a bug & propagates
+_LOOKUP_ERRORS = (ValueError, KeyError, GearError)
+
+logger = logging.getLogger(__name__)
+
+###############################################################################
+# gear database                                                               #
+###############################################################################
+
+
+@dataclass(frozen=True)
+class GearDatabase:
+    """Every equipable item, split by slot, with slot-wise stat columns.
+
+    Attributes
+    ----------
+
+    gear : dict[Slots, list[Gear]]
+        The items of each slot.
+
+    columns : dict[Slots, GearColumns]
+        The stats of each slot's items, row i is gear[slot][i].
+    """
+
+    gear: dict[Slots, list[Gear]]
+    columns: dict[Slots, GearColumns]
+
+    @classmethod
+    def from_gear(cls, gear: Iterable[Gear]) -> GearDatabase:
+        by_slot: dict[Slots, list[Gear]] = {_s: [] for _s in Slots}
+        names: set[str] = set()
+
+        for g in gear:
+            if g.name not in names:
+                names.add(g.name)
+                by_slot[g.slot].append(g)
+
+        columns = {_s: GearColumns.from_gear(_g) for _s, _g in by_slot.items()}
+        return cls(by_slot, columns)
+
+    @classmethod
+    def from_dataframe(cls, gear_df: pd.DataFrame | None = None) -> GearDatabase:
+        """Load every weapon & armour row of a bitterkoekje-style table.
+
+        Items defined in common_gear are used as is, so equality checks such
+        as Equipment.osmumtens_fang keep working, falling back to the row if
+        the common_gear item fails to look up. Rows without a gear slot, like
+        spells, are left out, and rows that fail to look up are skipped &
+        logged.
+        """
+        if gear_df is None:
+            return _default_database()
+
+        gear: list[Gear] = []
+        skipped: list[str] = []
+        slots = {_s.value for _s in Slots}
+
+        for name, slot in zip(gear_df["name"], gear_df["slot"]):
+            if slot not in slots:
+                continue
+
+            try:
+                if isinstance(defined := common_gear.COMMON_GEAR.by_source_name(name), Gear):
+                    gear.append(defined)
+                    continue
+            except _LOOKUP_ERRORS as exc:  # e.g. an item missing from the osrsbox data
+                logger.warning("common_gear failed to build %r, using its row: %r", name, exc)
+
+            try:
+                gear.append(Weapon.from_bb(name) if slot == Slots.WEAPON.value else Gear.from_bb(name))
+            except _LOOKUP_ERRORS as exc:  # duplicate names, weapons without a weapon row, ...
+                logger.debug("skipped %r: %r", name, exc)
+                skipped.append(name)
+
+        if skipped:
+            logger.info("skipped %d rows that failed to load: %s", len(skipped), ", ".join(skipped))
+
+        return cls.from_gear(gear)
+
+    def slot_stats(self, slot: Slots, dt: DT) -> np.ndarray:
+        """An (items, 2) matrix of accuracy & strength bonus for a damage type."""
+        return self.columns[slot].aggressive_bonus(dt)
+
+
+@cache
+def _default_database() -> GearDatabase:
+    return GearDatabase.from_dataframe(GEAR_DF)
+
+
+###############################################################################
+# pareto helpers                                                              #
+###############################################################################
+
+
+def _merge_fronts(
+    left: tuple[np.ndarray, list[tuple[Gear, ...]]], right: tuple[np.ndarray, list[tuple[Gear, ...]]]
+) -> tuple[np.ndarray, list[tuple[Gear, ...]]]:
+    """The Pareto front of every pairwise sum of two fronts."""
+    l_pts, l_gear = left
+    r_pts, r_gear = right
+    sums = (l_pts[:, None, :] + r_pts[None, :, :]).reshape(-1, 2)
+    keep = pareto_front(sums)
+    gear = [l_gear[_k // len(r_pts)] + r_gear[_k % len(r_pts)] for _k in keep]
+    return sums[keep], gear
+
+
+###############################################################################
+# main function                                                               #
+###############################################################################
+
+
+def galahad_the_pure(
+    player: Player,
+    target: Monster,
+    style: PlayerStyle | None = None,
+    *,
+    weapons: Iterable[Weapon] | None = None,
+    database: GearDatabase | None = None,
+    prayers: Prayer | Prayers | None = Piety,
+    boosts: Boost | list[Boost] | None = Overload,
+    data_mode: DataMode = DataMode.DPT,
+    top_k: int = 1,
+    **kwargs,
+) -> list[Loadout]:
+    """Best-in-slot loadouts for a player & target from the gear database.
+
+    Parameters
+    ----------
+    player : Player
+        The player, whose levels are used. The player is restored afterwards.
+
+    target : Monster
+        The target of the attack.
+
+    style : PlayerStyle | None, optional
+        Only weapons with this style are considered. By default every style
+        of every weapon.
+
+    weapons : Iterable[Weapon] | None, optional
+        The candidate weapons, by default every weapon in the database.
+
+    database : GearDatabase | None, optional
+        The candidate gear, by default all of GEAR_DF.
+
+    prayers : Prayer | Prayers | None, optional
+        By default Piety.
+
+    boosts : Boost | list[Boost] | None, optional
+        By default Overload.
+
+    data_mode : DataMode, optional
+        See robin_the_brave, by default DataMode.DPT.
+
+    top_k : int, optional
+        The number of loadouts returned, by default 1.
+
+    **kwargs
+        Passed to PvMCalc.get_damage, e.g. distance or spell.
+
+    Returns
+    -------
+    list[Loadout]
+        Up to top_k loadouts, best first. The gear is every item worn.
+
+    Raises
+    ------
+    AnalysisError
+    """
+    if data_mode not in _SWITCH_SCORES or top_k < 1:
+        raise AnalysisError(f"{data_mode=}, {top_k=}")
+
+    if isinstance(prayers, Prayer):
+        prayers = Prayers(prayers=[prayers])
+
+    database = _default_database() if database is None else database
+    weapons = list(database.gear[Slots.WEAPON] if weapons is None else weapons)
+    state = _player_state(player)
+
+    try:
+        CombatStrategy(player, prayers=prayers, boosts=boosts).activate()
+        search = _BestInSlotSearch(player, target, database, data_mode, top_k, kwargs)
+
+        for weapon in weapons:
+            for sty in weapon.styles.styles:
+                if style is None or sty == style:
+                    search.add_weapon(weapon, sty)
+
+        return search.run()
+    finally:
+        for name, value in state.items():
+            setattr(player, name, value)
+
+
+###############################################################################
+# search                                                                      #
+###############################################################################
+
+
+@dataclass(frozen=True)
+class _Modifier:
+    """A modifier item with its effect relative to the bare weapon."""
+
+    gear: Gear
+    roll_ratio: float
+    damage_ratio: float
+
+
+class _BestInSlotSearch:
+    def __init__(
+        self,
+        player: Player,
+        target: Monster,
+        database: GearDatabase,
+        data_mode: DataMode,
+        top_k: int,
+        pvm_calc_kwargs: dict[str, Any],
+    ):
+        self.player = player
+        self.target = target
+        self.database = database
+        self.data_mode = data_mode
+        self.score_attribute = _SWITCH_SCORES[data_mode]
+        self.top_k = top_k
+        self.pvm_calc_kwargs = pvm_calc_kwargs
+
+        self.candidates: list[tuple[float, int, Weapon, PlayerStyle, CalcPlan, DT]] = []
+        self.modifiers: dict[DT, dict[Slots, list[_Modifier]]] = {}
+        self.fronts: dict[DT, dict[Slots, tuple[np.ndarray, list[tuple[Gear, ...]]]]] = {}
+        self.heap: list[tuple[float, int, tuple[Gear, ...], PlayerStyle]] = []
+        self.pushed = 0
+
+    # plans
+
+    def _compile(self, gear: tuple[Gear, ...], style: PlayerStyle) -> CalcPlan | None:
+        self.player.eqp = Equipment().equip(*gear)
+        self.player.style = style
+
+        try:
+            return CalcPlan.compile(self.player, self.target, **self.pvm_calc_kwargs)
+        except (CalcPlanError, AutocastError):  # e.g. casting styles without a spell
+            return None
+
+    def _dt(self) -> DT:
+        return PvMCalc(self.player, self.target)._get_damage_type(self.pvm_calc_kwargs.get("spell"))
+
+    # classification, once per damage type
+
+    def _classify(self, weapon: Weapon, style: PlayerStyle, plan: CalcPlan, dt: DT):
+        """Split the armour of each unclassified slot into modifier gear & a bonus front.
+
+        Effects are measured with the first weapon of each damage type that
+        can use the slot, shields wait for a one-handed weapon.
+        """
+        conditional = {_g.name for _g in CONDITIONAL_GEAR}
+        base_signature = _plan_signature(plan)
+        modifiers = self.modifiers.setdefault(dt, {})
+        fronts = self.fronts.setdefault(dt, {})
+
+        for slot in self._armour_slots(weapon):
+            if slot in modifiers:
+                continue
+
+            stats = self.database.slot_stats(slot, dt)
+            bonus_rows: list[int] = []
+            modifier_rows: list[int] = []
+            slot_modifiers: list[_Modifier] = []
+            conditional_modifiers: list[_Modifier] = []
+
+            for row, g in enumerate(self.database.gear[slot]):
+                if g.name in conditional:
+                    conditional_modifiers.append(_Modifier(g, 1.0, 1.0))
+                    continue
+
+                # gear that can't be compiled is skipped, e.g. enchanted bolts
+                if (item_plan := self._compile((weapon, g), style)) is None:
+                    continue
+
+                if _plan_signature(item_plan) == base_signature:
+                    bonus_rows.append(row)
+                else:
+                    modifier_rows.append(row)
+                    slot_modifiers.append(_Modifier(g, *_ratios(plan, item_plan)))
+
+            # prune modifier gear no better in bonus & effect than another
+            if slot_modifiers:
+                points = np.column_stack(
+                    [
+                        stats[modifier_rows],
+                        [_m.roll_ratio for _m in slot_modifiers],
+                        [_m.damage_ratio for _m in slot_modifiers],
+                    ]
+                )
+                slot_modifiers = [_m for _m, _k in zip(slot_modifiers, non_dominated(points)) if _k]
+
+            modifiers[slot] = slot_modifiers + conditional_modifiers
+
+            # the bonus front, the empty slot included
+            points = np.vstack([np.zeros((1, 2), dtype=int), stats[bonus_rows]])
+            gear: list[tuple[Gear, ...]] = [()] + [(self.database.gear[slot][_r],) for _r in bonus_rows]
+            keep = pareto_front(points)
+            fronts[slot] = (points[keep], [gear[_k] for _k in keep])
+
+    # weapons
+
+    def add_weapon(self, weapon: Weapon, style: PlayerStyle):
+        plan = self._compile((weapon,), style)
+
+        if plan is None:
+            return
+
+        dt = self._dt()
+        self._classify(weapon, style, plan, dt)
+        self.candidates.append((self._bound(weapon, style, plan, dt), len(self.candidates), weapon, style, plan, dt))
+
+    def _bound(self, weapon: Weapon, style: PlayerStyle, plan: CalcPlan, dt: DT) -> float:
+        """An optimistic score: the best bonus & modifier of every slot."""
+        acc, stg = plan.accuracy_bonus, plan.strength_bonus
+        roll_ratio, damage_ratio = 1.0, 1.0
+
+        for slot in self._armour_slots(weapon):
+            stats = self.database.slot_stats(slot, dt)
+
+            if len(stats):
+                acc += max(int(stats[:, 0].max()), 0)
+                stg += max(int(stats[:, 1].max()), 0)
+
+            slot_modifiers = self.modifiers[dt][slot]
+            roll_ratio *= max([1.0] + [_m.roll_ratio for _m in slot_modifiers])
+            damage_ratio *= max([1.0] + [_m.damage_ratio for _m in slot_modifiers])
+
+        # weapon dependent effects, sets & conditional gear
+        best_roll, best_damage = 1.0, 1.0
+
+        for gear_set in [*SET_EFFECTS, *([_g] for _g in CONDITIONAL_GEAR)]:
+            if (set_plan := self._compile((weapon, *gear_set), style)) is not None:
+                roll, damage = _ratios(plan, set_plan)
+                best_roll, best_damage = max(best_roll, roll), max(best_damage, damage)
+
+        optimistic = replace(
+            plan,
+            roll_multipliers=plan.roll_multipliers + (roll_ratio * best_roll,),
+            damage_multipliers=plan.damage_multipliers + (damage_ratio * best_damage,),
+        )
+        ev = optimistic.evaluate(accuracy_bonus=acc, strength_bonus=stg)
+        return float(getattr(ev, self.score_attribute))
+
+    def _armour_slots(self, weapon: Weapon) -> list[Slots]:
+        return [_s for _s in ARMOUR_SLOTS if not (_s is Slots.SHIELD and weapon.two_handed)]
+
+    # search
+
+    def _threshold(self) -> float:
+        return self.heap[0][0] if len(self.heap) == self.top_k else -math.inf
+
+    def _push(self, score: float, gear: tuple[Gear, ...], style: PlayerStyle):
+        entry = (score, -self.pushed, gear, style)
+        self.pushed += 1
+
+        if len(self.heap) < self.top_k:
+            heapq.heappush(self.heap, entry)
+        elif score > self.heap[0][0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def run(self) -> list[Loadout]:
+        for bound, _, weapon, style, plan, dt in sorted(self.candidates, key=lambda _c: (-_c[0], _c[1])):
+            if bound <= self._threshold():
+                break
+
+            self._search_weapon(weapon, style, dt)
+
+        results: list[Loadout] = []
+
+        for _, _, gear, style in sorted(self.heap, key=lambda _h: (-_h[0], _h[1])):
+            eqp = Equipment().equip(*gear)
+            self.player.eqp = copy(eqp)
+            self.player.style = style
+            dam = PvMCalc(self.player, self.target).get_damage(**self.pvm_calc_kwargs)
+            value = _data_mode_value(dam, self.target, self.data_mode)
+            results.append(Loadout(tuple(eqp.equipped_gear), eqp, value, style))
+
+        return results
+
+    def _search_weapon(self, weapon: Weapon, style: PlayerStyle, dt: DT):
+        slots = self._armour_slots(weapon)
+        set_options: list[tuple[Gear, ...]] = [()]
+
+        for gear_set in SET_EFFECTS:
+            if all(_g.slot in slots for _g in gear_set):
+                set_options.append(tuple(gear_set))
+
+        merged: dict[tuple[Slots, ...], tuple[np.ndarray, list[tuple[Gear, ...]]]] = {}
+
+        for gear_set in set_options:
+            set_slots = {_g.slot for _g in gear_set}
+            free = [_s for _s in slots if _s not in set_slots]
+            choices = [[None, *self.modifiers[dt][_s]] for _s in free]
+
+            for choice in product(*choices):
+                fixed = (weapon, *gear_set, *(_m.gear for _m in choice if _m is not None))
+                bonus_slots = tuple(_s for _s, _m in zip(free, choice) if _m is None)
+                plan = self._compile(fixed, style)
+
+                if plan is None:
+                    continue
+
+                if bonus_slots not in merged:
+                    front = (np.zeros((1, 2), dtype=int), [()])
+
+                    for slot in bonus_slots:
+                        front = _merge_fronts(front, self.fronts[dt][slot])
+
+                    merged[bonus_slots] = front
+
+                points, gear = merged[bonus_slots]
+                ev = plan.evaluate(
+                    accuracy_bonus=plan.accuracy_bonus + points[:, 0],
+                    strength_bonus=plan.strength_bonus + points[:, 1],
+                )
+                scores = np.asarray(getattr(ev, self.score_attribute), dtype=float)
+
+                for idx in np.argsort(-scores, kind="stable")[: self.top_k]:
+                    if scores[idx] <= self._threshold():
+                        break
+
+                    self._push(float(scores[idx]), fixed + gear[idx], style)
+
+
+###############################################################################
+# helpers                                                                     #
+###############################################################################
+
+
+def _ratios(before: CalcPlan, after: CalcPlan) -> tuple[float, float]:
+    """The roll & damage modifier gain of after over before."""
+    roll = math.prod(after.roll_multipliers) / math.prod(before.roll_multipliers)
+    damage = math.prod(after.damage_multipliers) / math.prod(before.damage_multipliers)
+
+    # levels & base damage change like modifiers
+    roll *= after.accuracy_level / max(before.accuracy_level, 1)
+    damage *= max(after.strength_level, 1) / max(before.strength_level, 1)
+
+    if after.base_damage is not None and before.base_damage:
+        damage *= after.base_damage / before.base_damage
+
+    return roll, damage
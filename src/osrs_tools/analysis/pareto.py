@@ -0,0 +1,430 @@
+"""Pareto fronts of loadouts
+
+lancelot_the_brave finds the loadouts of a candidate gear pool that trade
+damage against defence & prayer bonus without waste: no other loadout is at
+least as good in all three. Every loadout is scored in numpy arrays, damage
+with one vectorized CalcPlan evaluation per combination of modifier gear, and
+the front is found by non-dominated sorting of the objective array.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+from osrs_tools.boost import Boost, Overload
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import AutocastError, Player
+from osrs_tools.combat import CalcPlan, CalcPlanError, PvMCalc
+from osrs_tools.data import DT, DataMode, MagicDamageTypes, MeleeDamageTypes, RangedDamageTypes, Slots
+from osrs_tools.gear import Equipment, Gear, GearColumns
+from osrs_tools.prayer import Piety, Prayer, Prayers
+from osrs_tools.strategy import CombatStrategy
+from osrs_tools.style import PlayerStyle
+
+from .utils import (
+    _MODIFIER_SETS,
+    _SWITCH_SCORES,
+    AnalysisError,
+    Loadout,
+    _data_mode_value,
+    _plan_signature,
+    _player_state,
+)
+
+###############################################################################
+# non-dominated sorting                                                       #
+###############################################################################
+
+# the number of points compared against the front at once
+_BLOCK_SIZE = 1024
+
+# the damage types with a defence bonus
+DEFENCE_TYPES = (*MeleeDamageTypes, *RangedDamageTypes, *MagicDamageTypes)
+
+
+def non_dominated(points: np.ndarray) -> np.ndarray:
+    """A mask of the rows of an (n, d) array that no other row dominates.
+
+    A row is dominated if another row is at least as large in every column.
+    Of equal rows, the first is kept. Rows are sorted lexicographically, so a
+    row can only be dominated by rows before it, and compared in blocks
+    against the front found so far & the rows before them in their block.
+    """
+    points = np.asarray(points)
+    keep = np.zeros(len(points), dtype=bool)
+
+    if len(points) == 0:
+        return keep
+
+    # lexicographically descending, ties in input order
+    order = np.lexsort((np.arange(len(points)), *(-points[:, ::-1].T)))
+    front = np.empty((0, points.shape[1]), dtype=points.dtype)
+
+    for start in range(0, len(order), _BLOCK_SIZE):
+        block_idx = order[start : start + _BLOCK_SIZE]
+
+        # drop rows dominated by the front found so far
+        dominated = np.all(front[None, :, :] >= points[block_idx][:, None, :], axis=2).any(axis=1)
+        block_idx = block_idx[~dominated]
+        block = points[block_idx]
+
+        # & rows dominated by an earlier row of the block
+        ge = np.all(block[None, :, :] >= block[:, None, :], axis=2)
+        dominated = (ge & np.tri(len(block), k=-1, dtype=bool)).any(axis=1)
+
+        keep[block_idx[~dominated]] = True
+        front = np.vstack([front, block[~dominated]])
+
+    return keep
+
+
+def pareto_front(points: np.ndarray) -> np.ndarray:
+    """Indices of the rows of an (n, 2) array that no other row dominates.
+
+    The two-column case of non_dominated, in a single sorted pass.
+    """
+    if len(points) == 0:
+        return np.zeros(0, dtype=int)
+
+    # sort by the first column descending, then the second descending
+    order = np.lexsort((np.arange(len(points)), -points[:, 1], -points[:, 0]))
+    sorted_second = points[order, 1]
+    running_max = np.maximum.accumulate(sorted_second)
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = sorted_second[1:] > running_max[:-1]
+    return np.sort(order[keep])
+
+
+###############################################################################
+# results                                                                     #
+###############################################################################
+
+
+@dataclass(frozen=True)
+class ParetoLoadout(Loadout):
+    """A Pareto-optimal loadout
+
+    Attributes
+    ----------
+
+    defence : int
+        The summed defence bonus over the requested damage types.
+
+    prayer : int
+        The prayer bonus.
+    """
+
+    defence: int
+    prayer: int
+
+
+###############################################################################
+# main function                                                               #
+###############################################################################
+
+
+def lancelot_the_brave(
+    player: Player,
+    target: Monster,
+    pool: Equipment | Iterable[Gear],
+    *,
+    defence_types: DT | Iterable[DT] | None = None,
+    prayers: Prayer | Prayers | None = Piety,
+    boosts: Boost | list[Boost] | None = Overload,
+    active_style: PlayerStyle | None = None,
+    data_mode: DataMode = DataMode.DPS,
+    **kwargs,
+) -> list[ParetoLoadout]:
+    """The Pareto-optimal loadouts of a gear pool by damage, defence & prayer.
+
+    Every slot with candidates in the pool takes one of them or the gear the
+    player already wears there; the remaining slots keep the player's gear.
+    Two-handed weapons leave the shield slot empty.
+
+    Parameters
+    ----------
+    player : Player
+        The player, wearing the gear of the slots outside the pool. The
+        player is restored afterwards.
+
+    target : Monster
+        The target of the attack.
+
+    pool : Equipment | Iterable[Gear]
+        The candidate gear. Several pieces may share a slot.
+
+    defence_types : DT | Iterable[DT] | None, optional
+        The damage types whose defence bonus is summed into the defence
+        objective, e.g. DT.MAGIC & DT.RANGED for Olm. By default all.
+
+    prayers : Prayer | Prayers | None, optional
+        By default Piety.
+
+    boosts : Boost | list[Boost] | None, optional
+        By default Overload.
+
+    active_style : PlayerStyle | None, optional
+        The style to use, for weapons without it their default style is
+        used. By default the player's style.
+
+    data_mode : DataMode, optional
+        The damage statistic, see robin_the_brave. By default DataMode.DPS.
+
+    **kwargs
+        Passed to PvMCalc.get_damage, e.g. distance or spell.
+
+    Returns
+    -------
+    list[ParetoLoadout]
+        The front, best damage first. Of loadouts with equal objectives only
+        one is returned.
+
+    Raises
+    ------
+    AnalysisError
+    """
+    if data_mode not in _SWITCH_SCORES:
+        raise AnalysisError(f"{data_mode} isn't supported")
+
+    if isinstance(pool, Equipment):
+        pool = pool.equipped_gear
+
+    if isinstance(defence_types, DT):
+        defence_types = [defence_types]
+
+    if isinstance(prayers, Prayer):
+        prayers = Prayers(prayers=[prayers])
+
+    state = _player_state(player)
+
+    try:
+        CombatStrategy(player, prayers=prayers, boosts=boosts).activate()
+        search = _ParetoSearch(
+            player,
+            target,
+            list(pool),
+            list(DEFENCE_TYPES if defence_types is None else defence_types),
+            active_style,
+            data_mode,
+            kwargs,
+        )
+        return search.run()
+    finally:
+        for name, value in state.items():
+            setattr(player, name, value)
+
+
+###############################################################################
+# search                                                                      #
+###############################################################################
+
+
+class _ParetoSearch:
+    """The state of one lancelot_the_brave search."""
+
+    def __init__(
+        self,
+        player: Player,
+        target: Monster,
+        pool: list[Gear],
+        defence_types: list[DT],
+        active_style: PlayerStyle | None,
+        data_mode: DataMode,
+        pvm_calc_kwargs: dict,
+    ):
+        self.player = player
+        self.target = target
+        self.defence_types = defence_types
+        self.active_style = player.style if active_style is None else active_style
+        self.data_mode = data_mode
+        self.score_attribute = _SWITCH_SCORES[data_mode]
+        self.pvm_calc_kwargs = pvm_calc_kwargs
+        self.base = copy(player.eqp)
+        self.set_members = {_g.name for _set in _MODIFIER_SETS for _g in _set}
+
+        # the options of each pool slot, the worn gear first, one per name
+        self.options: dict[Slots, list[Gear]] = {}
+
+        for g in pool:
+            if g.slot not in self.options:
+                worn = next((_w for _w in self.base.equipped_gear if _w.slot is g.slot), None)
+                self.options[g.slot] = [] if worn is None else [worn]
+
+            if all(_o.name != g.name for _o in self.options[g.slot]):
+                self.options[g.slot].append(g)
+
+        self.plans: dict[frozenset[str], CalcPlan | None] = {}
+
+    # loadouts
+
+    def _fixed(self, weapon: Gear) -> tuple[Gear, ...]:
+        """The weapon & worn gear outside the pool."""
+        fixed = [
+            _g
+            for _g in self.base.equipped_gear
+            if _g.slot not in self.options
+            and _g.slot is not Slots.WEAPON
+            and not (_g.slot is Slots.SHIELD and weapon.two_handed)
+        ]
+        return (weapon, *fixed)
+
+    def _equipment(self, gear: tuple[Gear, ...]) -> Equipment:
+        return Equipment().equip(*gear)
+
+    def _wear(self, eqp: Equipment):
+        styles = eqp[Slots.WEAPON].styles
+        self.player.eqp = eqp
+        self.player.style = self.active_style if self.active_style in styles else styles.default
+
+    def _plan(self, gear: tuple[Gear, ...]) -> CalcPlan | None:
+        """The memoized plan of a loadout, None if it can't be compiled."""
+        key = frozenset(_g.name for _g in gear)
+
+        if key not in self.plans:
+            self._wear(self._equipment(gear))
+
+            try:
+                self.plans[key] = CalcPlan.compile(self.player, self.target, **self.pvm_calc_kwargs)
+            except (CalcPlanError, AutocastError):
+                self.plans[key] = None
+
+        return self.plans[key]
+
+    # main method
+
+    def run(self) -> list[ParetoLoadout]:
+        weapons = self.options.get(Slots.WEAPON, [self.base[Slots.WEAPON]])
+        loadouts: list[tuple[tuple[Gear, ...], list[Slots], np.ndarray]] = []
+        objective_blocks: list[np.ndarray] = []
+
+        for weapon in weapons:
+            fixed, slots, choices, objectives = self._score_weapon(weapon)
+            loadouts.append((fixed, slots, choices))
+            objective_blocks.append(objectives)
+
+        objectives = np.vstack(objective_blocks)
+        offsets = np.cumsum([0] + [len(_o) for _o in objective_blocks])
+        front = np.flatnonzero(non_dominated(objectives))
+        front = front[np.argsort(-objectives[front, 0], kind="stable")]
+
+        results: list[ParetoLoadout] = []
+
+        for idx in front:
+            block = int(np.searchsorted(offsets, idx, side="right")) - 1
+            fixed, slots, choices = loadouts[block]
+            row = choices[idx - offsets[block]]
+            eqp = self._equipment(fixed + tuple(self.options[_s][_i] for _s, _i in zip(slots, row)))
+            self._wear(eqp)
+            dam = PvMCalc(self.player, self.target).get_damage(**self.pvm_calc_kwargs)
+            value = _data_mode_value(dam, self.target, self.data_mode)
+            defence, prayer = int(objectives[idx, 1]), int(objectives[idx, 2])
+            results.append(ParetoLoadout(tuple(eqp.equipped_gear), eqp, value, self.player.style, defence, prayer))
+
+        return results
+
+    def _score_weapon(self, weapon: Gear) -> tuple[tuple[Gear, ...], list[Slots], np.ndarray, np.ndarray]:
+        """Every loadout with a weapon & its (damage, defence, prayer) array.
+
+        Loadouts are rows of option indices into the returned slots, worn
+        with the returned fixed gear.
+        """
+        fixed = self._fixed(weapon)
+        base_plan = self._plan(fixed)
+        self._wear(self._equipment(fixed))
+        dt = self._damage_type()
+
+        slots = [_s for _s in self.options if _s is not Slots.WEAPON]
+
+        if weapon.two_handed:
+            slots = [_s for _s in slots if _s is not Slots.SHIELD]
+
+        # per option stats, with a modifier id or -1 for bonus-only gear
+        acc, stg, defence, prayer, modifier = [], [], [], [], []
+
+        for slot in slots:
+            options = self.options[slot]
+            columns = GearColumns.from_gear(options)
+            bonus = columns.aggressive_bonus(dt)
+            acc.append(bonus[:, 0])
+            stg.append(bonus[:, 1])
+            defence.append(columns.defensive_bonus(*self.defence_types))
+            prayer.append(columns.prayer)
+            modifier.append(
+                np.array([_i if self._is_modifier(base_plan, fixed, _g) else -1 for _i, _g in enumerate(options)])
+            )
+
+        shape = tuple(len(self.options[_s]) for _s in slots)
+        choices = np.stack(np.unravel_index(np.arange(int(np.prod(shape))), shape), axis=1).reshape(-1, len(slots))
+        fixed_eqp = self._equipment(fixed)
+        defence_sum = np.full(len(choices), sum(int(fixed_eqp.defensive_bonus[_dt]) for _dt in self.defence_types))
+        prayer_sum = np.full(len(choices), int(fixed_eqp.prayer_bonus))
+        extra_acc = np.zeros(len(choices), dtype=int)
+        extra_stg = np.zeros(len(choices), dtype=int)
+        keys = np.zeros(len(choices), dtype=np.int64)
+
+        for col, slot in enumerate(slots):
+            chosen = choices[:, col]
+            defence_sum += defence[col][chosen]
+            prayer_sum += prayer[col][chosen]
+
+            # bonus-only gear is added to the plan of its modifier combination
+            bonus_only = modifier[col][chosen] < 0
+            extra_acc += acc[col][chosen] * bonus_only
+            extra_stg += stg[col][chosen] * bonus_only
+            keys = keys * (len(self.options[slot]) + 1) + modifier[col][chosen] + 1
+
+        damage = np.empty(len(choices), dtype=float)
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        groups = np.argsort(inverse, kind="stable")
+        bounds = np.cumsum([0, *np.bincount(inverse, minlength=len(unique_keys))])
+
+        for group, row in enumerate(first):
+            members = groups[bounds[group] : bounds[group + 1]]
+            modifier_key = [modifier[_c][choices[row, _c]] for _c in range(len(slots))]
+            modifier_gear = tuple(self.options[_s][_k] for _s, _k in zip(slots, modifier_key) if _k >= 0)
+            plan = self._plan(fixed + modifier_gear)
+
+            if plan is None:
+                damage[members] = [self._exact_score(fixed, slots, choices[_m]) for _m in members]
+                continue
+
+            ev = plan.evaluate(
+                accuracy_bonus=plan.accuracy_bonus + extra_acc[members],
+                strength_bonus=plan.strength_bonus + extra_stg[members],
+            )
+            damage[members] = getattr(ev, self.score_attribute)
+
+        return fixed, slots, choices, np.column_stack([damage, defence_sum, prayer_sum])
+
+    # helpers
+
+    def _damage_type(self) -> DT:
+        try:
+            return PvMCalc(self.player, self.target)._get_damage_type(self.pvm_calc_kwargs.get("spell"))
+        except AutocastError as exc:
+            raise AnalysisError(f"{self.player.wpn.name} needs a spell") from exc
+
+    def _is_modifier(self, base_plan: CalcPlan | None, fixed: tuple[Gear, ...], g: Gear) -> bool:
+        """True if wearing g changes more of the plan than its bonuses."""
+        if g.name in self.set_members:
+            return True
+
+        plan = self._plan((*fixed, g))
+
+        if base_plan is None or plan is None:
+            return True
+
+        return _plan_signature(base_plan) != _plan_signature(plan)
+
+    def _exact_score(self, fixed: tuple[Gear, ...], slots: list[Slots], row: np.ndarray) -> float:
+        self._wear(self._equipment(fixed + tuple(self.options[_s][_i] for _s, _i in zip(slots, row))))
+        dam = PvMCalc(self.player, self.target).get_damage(**self.pvm_calc_kwargs)
+        return float(getattr(dam, self.score_attribute))
@@ -0,0 +1,285 @@
+"""Labelled N-dimensional results of an analysis
+
+AnalysisResult wraps the data array of bedevere_the_wise with the name and
+coordinate values of each axis, and the DataMode that produced it. Basic
+slicing & reductions keep the labels in step with the data, and pandas export
+reuses the underlying buffer.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+from osrs_tools.data import DataMode
+from osrs_tools.exceptions import OsrsException
+
+from .damage_axes import DamageAxes
+
+###############################################################################
+# errors                                                                      #
+###############################################################################
+
+
+class AnalysisResultError(OsrsException):
+    ...
+
+
+###############################################################################
+# helpers                                                                     #
+###############################################################################
+
+# modes where a smaller value is the better one
+_MINIMIZED_MODES = (
+    DataMode.TICKS_TO_KILL,
+    DataMode.SECONDS_TO_KILL,
+    DataMode.MINUTES_TO_KILL,
+    DataMode.HOURS_TO_KILL,
+    DataMode.MEDIAN_TICKS_TO_KILL,
+    DataMode.P90_TICKS_TO_KILL,
+)
+
+
+def coordinate_label(__value: Any, /) -> str:
+    """A short, human readable label for an axis coordinate."""
+    if isinstance(__value, tuple):
+        return ", ".join(coordinate_label(_v) for _v in __value)
+
+    if isinstance(__value, Enum):
+        return str(__value.value)
+
+    if isinstance(__value, (bool, int, float, str)) or __value is None:
+        return str(__value)
+
+    name = getattr(__value, "name", None)
+
+    if isinstance(name, Enum):
+        return str(name.value)
+
+    if isinstance(name, str) and name:
+        return name
+
+    # unnamed collections are labelled by their members
+    if (equipped := getattr(__value, "equipped_gear", None)) is not None:
+        return ", ".join(_g.name for _g in equipped) or "none"
+
+    if isinstance(prayers := getattr(__value, "prayers", None), list):
+        return ", ".join(_p.name for _p in prayers) or "none"
+
+    return str(__value)
+
+
+def _safe_eq(left: Any, right: Any) -> bool:
+    try:
+        return bool(left == right)
+    except (TypeError, ValueError):
+        return False
+
+
+###############################################################################
+# main class                                                                  #
+###############################################################################
+
+
+@dataclass(frozen=True, eq=False)
+class AnalysisResult(np.lib.mixins.NDArrayOperatorsMixin):
+    """A labelled N-dimensional data array
+
+    Arithmetic & numpy ufuncs operate on the data and return plain arrays.
+
+    Attributes
+    ----------
+
+    data : np.ndarray
+        The data array, one dimension per axis.
+
+    dims : tuple[str, ...]
+        The name of each axis, the DamageAxes field it came from.
+
+    coords : dict[str, list[Any]]
+        The coordinate values of each axis, in order.
+
+    data_mode : DataMode
+        The statistic held in data.
+    """
+
+    data: np.ndarray
+    dims: tuple[str, ...]
+    coords: dict[str, list[Any]]
+    data_mode: DataMode
+
+    def __post_init__(self):
+        if self.data.ndim != len(self.dims):
+            raise AnalysisResultError(f"{self.data.shape=} doesn't match {self.dims=}")
+
+        for dim, size in zip(self.dims, self.data.shape):
+            if len(self.coords[dim]) != size:
+                raise AnalysisResultError(f"{dim} has {len(self.coords[dim])} coordinates, expected {size}")
+
+    # class methods ###########################################################
+
+    @classmethod
+    def from_axes(cls, axes_container: DamageAxes, data: np.ndarray, data_mode: DataMode) -> AnalysisResult:
+        """Label a squeezed data array with the squeezed axes of its container."""
+        dims = tuple(_axis.name for _axis in axes_container.squeezed_axes)
+        coords = {_d: list(getattr(axes_container, _d)) for _d in dims}
+        return cls(data, dims, coords, data_mode)
+
+    # properties ##############################################################
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.data.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.data.ndim
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.data
+
+    @property
+    def labels(self) -> dict[str, list[str]]:
+        """Human readable coordinate labels of each axis."""
+        return {_d: [coordinate_label(_c) for _c in self.coords[_d]] for _d in self.dims}
+
+    @property
+    def maximize(self) -> bool:
+        """True if larger values of this result's DataMode are better."""
+        return self.data_mode not in _MINIMIZED_MODES
+
+    # indexing ################################################################
+
+    def axis_num(self, dim: str) -> int:
+        try:
+            return self.dims.index(dim)
+        except ValueError as exc:
+            raise AnalysisResultError(f"{dim} not in {self.dims}") from exc
+
+    def isel(self, **indexers: int | slice) -> AnalysisResult | Any:
+        """Index by axis name & position, an int drops the axis."""
+        key: list[int | slice] = [slice(None)] * self.ndim
+
+        for dim, idx in indexers.items():
+            key[self.axis_num(dim)] = idx
+
+        return self[tuple(key)]
+
+    def sel(self, **indexers: Any) -> AnalysisResult | Any:
+        """Index by axis name & coordinate value, matched by equality or label."""
+        positions: dict[str, int] = {}
+
+        for dim, value in indexers.items():
+            self.axis_num(dim)
+
+            for idx, coord in enumerate(self.coords[dim]):
+                if coord is value or coordinate_label(coord) == value or _safe_eq(coord, value):
+                    positions[dim] = idx
+                    break
+            else:
+                raise AnalysisResultError(f"{value} not in {dim}")
+
+        return self.isel(**positions)
+
+    # reductions ##############################################################
+
+    def reduce(self, func: Callable[..., np.ndarray], dim: str) -> AnalysisResult:
+        """Apply a numpy reduction, such as np.max, over one axis."""
+        axis = self.axis_num(dim)
+        data = func(self.data, axis=axis)
+        dims = self.dims[:axis] + self.dims[axis + 1 :]
+        coords = {_d: self.coords[_d] for _d in dims}
+        return AnalysisResult(np.asarray(data), dims, coords, self.data_mode)
+
+    def best(self, dim: str, maximize: bool | None = None) -> AnalysisResult:
+        """The best value over an axis, by default judged by the DataMode."""
+        maximize = self.maximize if maximize is None else maximize
+        return self.reduce(np.max if maximize else np.min, dim)
+
+    def argbest(self, dim: str, maximize: bool | None = None) -> np.ndarray:
+        """The coordinate of the best value over an axis, per remaining cell."""
+        maximize = self.maximize if maximize is None else maximize
+        axis = self.axis_num(dim)
+        positions = np.argmax(self.data, axis=axis) if maximize else np.argmin(self.data, axis=axis)
+
+        coords = np.empty(len(self.coords[dim]), dtype=object)
+        coords[:] = self.coords[dim]
+        return coords[positions]
+
+    # conversion ##############################################################
+
+    def to_pandas(self) -> pd.Series:
+        """A Series indexed by the coordinate labels, sharing the data buffer.
+
+        Multi-dimensional results use a MultiIndex in C order. Non-contiguous
+        slices can't be flattened in place and are copied.
+        """
+        labels = self.labels
+
+        if self.ndim == 0:
+            index = pd.RangeIndex(1)
+        elif self.ndim == 1:
+            index = pd.Index(labels[self.dims[0]], name=self.dims[0])
+        else:
+            index = pd.MultiIndex.from_product([labels[_d] for _d in self.dims], names=list(self.dims))
+
+        return pd.Series(self.data.reshape(-1), index=index, name=self.data_mode.value.key, copy=False)
+
+    # dunder methods ##########################################################
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        if dtype is not None and dtype != self.data.dtype:
+            return self.data.astype(dtype)
+
+        return self.data.copy() if copy else self.data
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        inputs = tuple(_i.data if isinstance(_i, AnalysisResult) else _i for _i in inputs)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.data)
+
+    def __getitem__(self, __key: int | slice | Sequence[int | slice]) -> AnalysisResult | Any:
+        """Positional indexing with ints & slices, an int drops the axis."""
+        key = __key if isinstance(__key, tuple) else (__key,)
+
+        if len(key) > self.ndim:
+            raise AnalysisResultError(f"too many indices for {self.dims}")
+
+        dims: list[str] = []
+        coords: dict[str, list[Any]] = {}
+
+        for dim, idx in zip(self.dims, key + (slice(None),) * (self.ndim - len(key))):
+            if isinstance(idx, slice):
+                dims.append(dim)
+                coords[dim] = self.coords[dim][idx]
+            elif not isinstance(idx, (int, np.integer)):
+                raise AnalysisResultError(f"only ints & slices are supported: {idx}")
+
+        data = self.data[key]
+
+        if not dims:
+            return data
+
+        return AnalysisResult(data, tuple(dims), coords, self.data_mode)
+
+    def __repr__(self) -> str:
+        _dims = ", ".join(f"{_d}: {_n}" for _d, _n in zip(self.dims, self.shape))
+        return f"{self.__class__.__name__}({self.data_mode.value.key}, {{{_dims}}})"
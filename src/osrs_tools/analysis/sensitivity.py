@@ -0,0 +1,223 @@
+"""Marginal damage of levels & bonuses
+
+arthur_king_of_the_britons answers "what is one more strength bonus, or one
+more ranged level, worth against this boss?" for every level & aggressive
+bonus the attack depends on. The configuration is compiled into a CalcPlan
+once, and every stat is raised by 1 to horizon points in a single vectorized
+evaluation, so each answer also says how far the next max hit is.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass, replace
+
+import numpy as np
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import AutocastError, Player
+from osrs_tools.combat import CalcPlan, CalcPlanError, PvMCalc
+from osrs_tools.data import MagicDamageTypes, MeleeDamageTypes, Skills
+from osrs_tools.tracked_value import Level
+
+from .utils import AnalysisError
+
+###############################################################################
+# results                                                                     #
+###############################################################################
+
+
+@dataclass(frozen=True)
+class StatSensitivity:
+    """The marginal damage of one level or bonus
+
+    Attributes
+    ----------
+
+    stat : str
+        The level or bonus, e.g. "strength level" or "strength bonus".
+
+    value : int
+        The stat's current value, visible (boosted) for levels.
+
+    delta : int
+        The increase the deltas are measured at.
+
+    dps_delta : float
+        The gain in damage per second.
+
+    max_hit_delta : int
+        The gain in max hit.
+
+    accuracy_delta : float
+        The gain in the probability an attack succeeds.
+
+    max_hit_breakpoint : bool
+        True if the increase raises the max hit.
+
+    accuracy_breakpoint : bool
+        True if the increase raises the attack roll. Modifiers floor the
+        roll, so small increases can be lost entirely.
+
+    to_next_max_hit : int | None
+        The smallest increase that raises the max hit, None if none within
+        the horizon does.
+    """
+
+    stat: str
+    value: int
+    delta: int
+    dps_delta: float
+    max_hit_delta: int
+    accuracy_delta: float
+    max_hit_breakpoint: bool
+    accuracy_breakpoint: bool
+    to_next_max_hit: int | None
+
+
+###############################################################################
+# main function                                                               #
+###############################################################################
+
+
+def arthur_king_of_the_britons(
+    player: Player,
+    target: Monster,
+    delta: int = 1,
+    horizon: int = 64,
+    **kwargs,
+) -> list[StatSensitivity]:
+    """The marginal damage of each level & bonus of the player's attack.
+
+    Levels are visible (boosted) levels, so +1 ranged level under an
+    overload is one more level after the boost. Melee attacks depend on the
+    attack & strength levels, ranged on the ranged level, magic on the
+    magic level, and each on the accuracy & strength bonus of its damage
+    type. Magic strength, a percentage, isn't included.
+
+    Parameters
+    ----------
+    player : Player
+        The player, with prayers & boosts active.
+
+    target : Monster
+        The target of the attack.
+
+    delta : int, optional
+        The increase each stat is measured at, by default 1.
+
+    horizon : int, optional
+        The largest increase searched for the next max hit, by default 64.
+
+    **kwargs
+        Passed to CalcPlan.compile, e.g. special_attack or spell.
+
+    Returns
+    -------
+    list[StatSensitivity]
+        One per level & bonus, best damage gain first.
+
+    Raises
+    ------
+    AnalysisError
+        If the attack can't be compiled, see CalcPlan.compile, or a staff has no spell.
+    """
+    if not 1 <= delta <= horizon:
+        raise AnalysisError(f"{delta=}, {horizon=}")
+
+    try:
+        plan = CalcPlan.compile(player, target, **kwargs)
+        dt = PvMCalc(player, target)._get_damage_type(kwargs.get("spell"))
+    except (CalcPlanError, AutocastError) as exc:
+        raise AnalysisError(f"{player.wpn.name} can't be compiled") from exc
+    steps = np.arange(horizon + 1)
+
+    # each stat's (accuracy level, strength level, accuracy bonus, strength bonus) rows
+    rows: dict[str, tuple[int, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]] = {}
+    acc_lvl = np.full_like(steps, plan.accuracy_level)
+    str_lvl = np.full_like(steps, plan.strength_level)
+    acc_bonus = np.full_like(steps, plan.accuracy_bonus)
+    str_bonus = np.full_like(steps, plan.strength_bonus)
+
+    if dt in MeleeDamageTypes:
+        attack, strength = int(player.visible_attack), int(player.visible_strength)
+        rows["attack level"] = (attack, (plan.accuracy_level_transform(attack + steps), str_lvl, acc_bonus, str_bonus))
+        rows["strength level"] = (
+            strength,
+            (acc_lvl, plan.strength_level_transform(strength + steps), acc_bonus, str_bonus),
+        )
+    elif dt in MagicDamageTypes:
+        magic = int(player.visible_magic)
+        rows["magic level"] = (magic, (plan.accuracy_level_transform(magic + steps), str_lvl, acc_bonus, str_bonus))
+    else:
+        ranged = int(player.visible_ranged)
+        rows["ranged level"] = (
+            ranged,
+            (
+                plan.accuracy_level_transform(ranged + steps),
+                plan.strength_level_transform(ranged + steps),
+                acc_bonus,
+                str_bonus,
+            ),
+        )
+
+    rows["accuracy bonus"] = (plan.accuracy_bonus, (acc_lvl, str_lvl, plan.accuracy_bonus + steps, str_bonus))
+
+    if dt not in MagicDamageTypes:
+        rows["strength bonus"] = (plan.strength_bonus, (acc_lvl, str_lvl, acc_bonus, plan.strength_bonus + steps))
+
+    # one (stats, steps) evaluation
+    acc_lvls, str_lvls, acc_bonuses, str_bonuses = (np.stack(_a) for _a in zip(*(_r for _, _r in rows.values())))
+    ev = plan.evaluate(acc_lvls, str_lvls, accuracy_bonus=acc_bonuses, strength_bonus=str_bonuses)
+    per_second, max_hit, accuracy, attack_roll = ev.per_second, ev.max_hit, ev.accuracy, ev.attack_roll
+
+    # powered staves scale their base damage with magic level
+    if "magic level" in rows:
+        row = list(rows).index("magic level")
+        base_damages = _magic_base_damages(player, magic + steps, kwargs.get("spell"))
+
+        if len(set(base_damages)) > 1:
+            for step, base_damage in enumerate(base_damages):
+                step_ev = replace(plan, base_damage=base_damage).evaluate(acc_lvls[row, step])
+                per_second[row, step] = step_ev.per_second
+                max_hit[row, step] = step_ev.max_hit
+
+    results: list[StatSensitivity] = []
+
+    for row, (stat, (value, _)) in enumerate(rows.items()):
+        raised = np.flatnonzero(max_hit[row, 1:] > max_hit[row, 0])
+        results.append(
+            StatSensitivity(
+                stat=stat,
+                value=value,
+                delta=delta,
+                dps_delta=float(per_second[row, delta] - per_second[row, 0]),
+                max_hit_delta=int(max_hit[row, delta] - max_hit[row, 0]),
+                accuracy_delta=float(accuracy[row, delta] - accuracy[row, 0]),
+                max_hit_breakpoint=bool(max_hit[row, delta] > max_hit[row, 0]),
+                accuracy_breakpoint=bool(attack_roll[row, delta] > attack_roll[row, 0]),
+                to_next_max_hit=int(raised[0]) + 1 if len(raised) else None,
+            )
+        )
+
+    return sorted(results, key=lambda _r: -_r.dps_delta)
+
+
+def _magic_base_damages(player: Player, magic_levels: np.ndarray, spell=None) -> list[int]:
+    """The spell base damage at each visible magic level, see CalcPlan.compile."""
+    levels = player.levels
+    base_damages: list[int] = []
+
+    try:
+        for magic in magic_levels:
+            player.levels = copy(levels)
+            player.levels[Skills.MAGIC] = Level(int(magic))
+            base_damages.append(int(player.max_hit(spell=spell)))
+    finally:
+        player.levels = levels
+
+    return base_damages
@@ -0,0 +1,321 @@
+"""Incremental, resumable storage for streamed analysis records
+
+Each sink writes AnalysisRecords as they arrive and can report which cells a
+previous run already completed, so write_bedevere_the_wise can pick up an
+interrupted sweep where it left off.
+
+    CsvSink: one row per cell, appended to a single file.
+    ParquetSink: a directory of part files, one per batch of records.
+    NpySink: a memory-mapped .npy of values & a companion mask of completed
+        cells.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Container
+
+import numpy as np
+import pandas as pd
+from osrs_tools.combat import DamageCache, DiskDamageCache
+from osrs_tools.data import DataMode
+from osrs_tools.exceptions import OsrsException
+
+from .damage_axes import DamageAxes
+from .result import AnalysisResult, coordinate_label
+from .utils import AnalysisRecord, iter_bedevere_the_wise
+
+###############################################################################
+# errors                                                                      #
+###############################################################################
+
+
+class SinkError(OsrsException):
+    ...
+
+
+###############################################################################
+# abstract class                                                              #
+###############################################################################
+
+
+class RecordSink(ABC):
+    """Base class for sinks of AnalysisRecords.
+
+    Records are buffered and flushed every flush_every records, a flushed
+    record survives the process dying.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Where the records are written.
+
+    axes_container : DamageAxes
+        The grid the records belong to.
+
+    data_mode : DataMode
+        The statistic held in each record.
+
+    flush_every : int, optional
+        The number of records per flush, by default 1000.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        axes_container: DamageAxes,
+        data_mode: DataMode,
+        flush_every: int = 1000,
+    ):
+        self.path = Path(path)
+        self.dims = tuple(_axis.name for _axis in axes_container.squeezed_axes)
+        self.shape = axes_container.squeezed_dims
+        self.coords = {_d: list(getattr(axes_container, _d)) for _d in self.dims}
+        self.data_mode = data_mode
+        self.flush_every = flush_every
+        self._buffer: list[AnalysisRecord] = []
+
+    @abstractmethod
+    def completed(self) -> Container[tuple[int, ...]]:
+        """The squeezed indices already stored at path, for `index in completed`."""
+
+    @abstractmethod
+    def _write_batch(self, records: list[AnalysisRecord]):
+        ...
+
+    def write(self, record: AnalysisRecord):
+        self._buffer.append(record)
+
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> RecordSink:
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    # helpers
+
+    def _row(self, record: AnalysisRecord) -> dict[str, Any]:
+        """A flat row of index columns, label columns & the value."""
+        row: dict[str, Any] = {f"{_d}_index": _i for _d, _i in zip(self.dims, record.index)}
+        row.update({_d: coordinate_label(record.params[_d]) for _d in self.dims})
+        row["value"] = record.value
+        return row
+
+    @property
+    def _index_columns(self) -> list[str]:
+        return [f"{_d}_index" for _d in self.dims]
+
+    def _mark(self, mask: np.ndarray, df: pd.DataFrame):
+        """Mark the cells of a frame of index columns in a mask of the grid shape."""
+        if len(df):
+            mask[tuple(df[_c].to_numpy(dtype=np.intp) for _c in self._index_columns)] = True
+
+
+class MaskIndices(Container[tuple[int, ...]]):
+    """The indices of a boolean mask's True cells, checked cell by cell.
+
+    A grid of millions of cells costs a byte per cell, rather than a set of
+    index tuples.
+    """
+
+    def __init__(self, mask: np.ndarray):
+        self.mask = mask
+
+    def __contains__(self, __index: object) -> bool:
+        return bool(self.mask[__index])
+
+
+###############################################################################
+# sinks                                                                       #
+###############################################################################
+
+
+class CsvSink(RecordSink):
+    """Append records to a single CSV file.
+
+    On resume, a trailing partial line left by a crash is truncated.
+    """
+
+    def completed(self) -> MaskIndices:
+        mask = np.zeros(self.shape, dtype=bool)
+
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return MaskIndices(mask)
+
+        self._truncate_partial_line()
+
+        for chunk in pd.read_csv(self.path, usecols=self._index_columns, chunksize=2**16):
+            self._mark(mask, chunk)
+
+        return MaskIndices(mask)
+
+    def _write_batch(self, records: list[AnalysisRecord]):
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        rows = [self._row(_r) for _r in records]
+
+        with open(self.path, mode="a", newline="", encoding="UTF-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+
+            if new_file:
+                writer.writeheader()
+
+            writer.writerows(rows)
+
+    def _truncate_partial_line(self):
+        with open(self.path, mode="rb+") as f:
+            content = f.read()
+
+            if content and not content.endswith(b"\n"):
+                f.truncate(content.rfind(b"\n") + 1)
+
+
+class ParquetSink(RecordSink):
+    """Write each batch of records as a part file in a directory.
+
+    A part is written to a temporary name and renamed once complete, so an
+    interrupted batch leaves no readable part behind. Requires a parquet
+    engine for pandas, such as pyarrow.
+    """
+
+    def completed(self) -> MaskIndices:
+        mask = np.zeros(self.shape, dtype=bool)
+
+        for part in self._parts():
+            self._mark(mask, pd.read_parquet(part, columns=self._index_columns))
+
+        return MaskIndices(mask)
+
+    def read(self) -> pd.DataFrame:
+        """All stored records as one DataFrame."""
+        return pd.concat([pd.read_parquet(_p) for _p in self._parts()], ignore_index=True)
+
+    def _write_batch(self, records: list[AnalysisRecord]):
+        self.path.mkdir(parents=True, exist_ok=True)
+        parts = self._parts()
+        number = int(parts[-1].stem.split("-")[-1]) + 1 if parts else 0
+
+        part = self.path / f"part-{number:06d}.parquet"
+        tmp = part.with_suffix(".tmp")
+        pd.DataFrame([self._row(_r) for _r in records]).to_parquet(tmp, index=False)
+        os.replace(tmp, part)
+
+    def _parts(self) -> list[Path]:
+        if not self.path.exists():
+            return []
+
+        return sorted(self.path.glob("part-*.parquet"))
+
+
+class NpySink(RecordSink):
+    """Write values into a memory-mapped .npy of the squeezed grid shape.
+
+    A boolean .npy next to it marks completed cells. Values are flushed to
+    disk before the mask, so a cell marked complete always holds its value.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        axes_container: DamageAxes,
+        data_mode: DataMode,
+        flush_every: int = 1000,
+    ):
+        super().__init__(path, axes_container, data_mode, flush_every)
+        self.mask_path = self.path.with_name(f"{self.path.stem}.done.npy")
+        dtype = np.dtype(data_mode.value.dtype)
+
+        if self.path.exists() and self.mask_path.exists():
+            self.data = np.lib.format.open_memmap(self.path, mode="r+")
+            self.mask = np.lib.format.open_memmap(self.mask_path, mode="r+")
+
+            if self.data.shape != self.shape or self.data.dtype != dtype:
+                raise SinkError(f"{self.path} holds {self.data.shape} {self.data.dtype}, not {self.shape} {dtype}")
+        else:
+            self.data = np.lib.format.open_memmap(self.path, mode="w+", dtype=dtype, shape=self.shape)
+            self.mask = np.lib.format.open_memmap(self.mask_path, mode="w+", dtype=bool, shape=self.shape)
+
+    def completed(self) -> MaskIndices:
+        return MaskIndices(self.mask)
+
+    def result(self) -> AnalysisResult:
+        """The memory-mapped values as an AnalysisResult, unfinished cells are undefined."""
+        return AnalysisResult(self.data, self.dims, self.coords, self.data_mode)
+
+    def _write_batch(self, records: list[AnalysisRecord]):
+        for record in records:
+            self.data[record.index] = record.value
+
+        self.data.flush()
+
+        for record in records:
+            self.mask[record.index] = True
+
+        self.mask.flush()
+
+
+###############################################################################
+# main function                                                               #
+###############################################################################
+
+
+def write_bedevere_the_wise(
+    axes_container: DamageAxes,
+    sink: RecordSink,
+    data_mode: DataMode = DataMode.DPT,
+    cache: DamageCache | DiskDamageCache | None = None,
+) -> int:
+    """Stream a grid into a sink, skipping the cells it already holds.
+
+    Parameters
+    ----------
+    axes_container : DamageAxes
+        See bedevere_the_wise.
+
+    sink : RecordSink
+        The sink, closed when the grid is done or evaluation fails.
+
+    data_mode : DataMode, optional
+        Must match the sink's DataMode, by default DataMode.DPT
+
+    cache : DamageCache | DiskDamageCache | None, optional
+        See bedevere_the_wise, by default None
+
+    Returns
+    -------
+    int
+        The number of newly computed cells.
+
+    Raises
+    ------
+    SinkError
+    """
+    if data_mode is not sink.data_mode:
+        raise SinkError(f"{sink} stores {sink.data_mode}, not {data_mode}")
+
+    written = 0
+
+    with sink:
+        for record in iter_bedevere_the_wise(axes_container, data_mode, cache, skip=sink.completed()):
+            sink.write(record)
+            written += 1
+
+    return written
@@ -8,27 +8,38 @@ All time values are in ticks unless otherwise noted.
 ###############################################################################
 """
 
+import heapq
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy
-from dataclasses import Field
+from dataclasses import Field, dataclass
 from functools import wraps
-from itertools import combinations
-from typing import Any, Callable, ParamSpec, TypeVar
+from itertools import product
+from typing import Any, Callable, Container, Iterable, Iterator, NamedTuple, ParamSpec, TypeVar
 
 import numpy as np
 import pandas as pd
 from osrs_tools.analysis.damage_axes import DamageAxes
 from osrs_tools.analysis.pvm_axes import PvmAxes, PvmAxesEquipmentStyle, PvmAxesPlayerEquipmentStyle
+from osrs_tools.analysis.result import AnalysisResult
 from osrs_tools.boost import Boost, Overload
-from osrs_tools.character import Character
 from osrs_tools.character.monster import Monster
 from osrs_tools.character.player import Player
-from osrs_tools.combat import PvMCalc
+from osrs_tools.combat import CalcPlan, CalcPlanError, Damage, DamageCache, DiskDamageCache, PvMCalc
 from osrs_tools.data import DEFAULT_FLOAT_FMT, DEFAULT_TABLE_FMT
-from osrs_tools.data import DataAxes
 from osrs_tools.data import DataAxes as DA
 from osrs_tools.data import DataMode, Slots
 from osrs_tools.exceptions import OsrsException
-from osrs_tools.gear import Equipment, Gear
+from osrs_tools.gear import Equipment, Gear, GearColumns
+from osrs_tools.gear.common_gear import (
+    CrystalArmorSet,
+    DharoksSet,
+    EliteVoidSet,
+    InquisitorsArmourSet,
+    NormalVoidSet,
+    ObsidianArmorSet,
+)
 from osrs_tools.prayer import Piety, Prayer, Prayers
 from osrs_tools.strategy import CombatStrategy
 from osrs_tools.style import PlayerStyle
@@ -41,6 +52,15 @@ from tabulate import tabulate
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# axes that don't change the player, evaluated against an activated strategy
+_STATELESS_AXES = (
+    DA.TARGET.value,
+    DA.SPECIAL_ATTACK.value,
+    DA.DISTANCE.value,
+    DA.SPELL.value,
+    DA.ADDITIONAL_TARGETS.value,
+)
+
 ###############################################################################
 # main functions                                                              #
 ###############################################################################
@@ -61,6 +81,9 @@ def tabulate_enhanced(
     if tablefmt is None:
         tablefmt = DEFAULT_TABLE_FMT
 
+    if isinstance(data, AnalysisResult):
+        data = data.data
+
     if isinstance(data, np.ndarray):
         try:
             m, n = data.shape
@@ -244,7 +267,12 @@ def table_2d(func: Callable) -> Callable:
 def bedevere_the_wise(
     axes_container: DamageAxes,
     data_mode: DataMode = DataMode.DPT,
-) -> np.ndarray:
+    cache: DamageCache | DiskDamageCache | None = None,
+    *,
+    workers: int | None = None,
+    executor: ProcessPoolExecutor | None = None,
+    chunksize: int | None = None,
+) -> AnalysisResult:
     """Smart comparison interface for a generic PvM damage calculation
 
     Parameters
@@ -256,208 +284,786 @@ def bedevere_the_wise(
         The datatype of the values in the return data array, see the DataMode
         enum for more information, by default DataMode.DPT
 
+    cache : DamageCache | DiskDamageCache | None, optional
+        Memoize damage calculations of identical states, by default None. In
+        parallel runs each worker process keeps a DamageCache of the same
+        size, while a DiskDamageCache is shared by every process.
+
+    workers : int | None, optional
+        Evaluate chunks of the index space in a ProcessPoolExecutor with
+        this many processes. The axes are shipped once per process. None or
+        1 evaluates serially, by default None.
+
+    executor : ProcessPoolExecutor | None, optional
+        Evaluate chunks in a caller-managed process pool instead. The axes
+        are shipped with every chunk, so prefer workers where possible.
+        Threads would share & mutate one copy of the axes and cache, so
+        other executors are rejected. By default None.
+
+    chunksize : int | None, optional
+        The approximate number of cells per task, by default about four
+        tasks per worker. Cells sharing a strategy are never split.
+
     Returns
     -------
-    tuple[Iterator[tuple[int]], dict[DataAxes, list], np.ndarray]
-        Return an iterator of the complete series indices, a dictionary with
-        DataAxes keys and axes values, and the data array.
+    AnalysisResult
+        The squeezed data, labelled by the squeezed axes of the container.
+        Any number of axes may vary. Serial & parallel evaluation return
+        identical arrays.
 
     Raises
     ------
+    AnalysisError
+        If executor isn't a ProcessPoolExecutor.
     NotImplementedError
     """
-
-    # if isinstance(pvm_axes, PvmAxes):
-    #     axes = pvm_axes.squeezed_axes
-    #     dims = pvm_axes.squeezed_dims
-    # elif isinstance(pvm_axes, PvmAxesEquipmentStyle):
-    #     axes = pvm_axes.squeezed_axes
-    #     dims = pvm_axes.squeezed_dims
-    # elif isinstance(pvm_axes, PvmAxesPlayerEquipmentStyle):
-    #     axes = pvm_axes.squeezed_axes
-    #     dims = pvm_axes.squeezed_dims
-    # else:
-    #     raise ValueError(pvm_axes)
+    if executor is not None and not isinstance(executor, ProcessPoolExecutor):
+        raise AnalysisError(f"{executor.__class__.__name__} shares state between workers, use a ProcessPoolExecutor")
 
     wide_dims = axes_container.dims
-    squeezed_dims = axes_container.squeezed_dims
+    data_ary = np.empty(shape=wide_dims, dtype=data_mode.value.dtype)
 
-    if len(squeezed_dims) > 2:
-        raise ValueError(axes_container)
+    # cells sharing a strategy are evaluated against one activation
+    groups = _iter_groups(axes_container)
 
-    data_ary = np.empty(shape=wide_dims, dtype=data_mode.value.dtype)
+    if executor is None and (workers is None or workers <= 1):
+        for group in groups:
+            for _indices, value in zip(group, _evaluate_group(axes_container, group, data_mode, cache)):
+                data_ary[_indices] = value
 
-    for _indices in axes_container.indices:
-        # iterate through all possible indices combinations
-        params = axes_container[_indices]
+        return AnalysisResult.from_axes(axes_container, data_ary.squeeze(), data_mode)
 
-        # TODO: Rework this shitty code
-        if isinstance(axes_container, PvmAxesEquipmentStyle):
-            ply, tgt, (eqp, sty), pry, bst, lvl, spc, dst, spl, adt = params
-            assert isinstance(ply, Player)
-            assert isinstance(tgt, Monster)
+    worker_cache = None if cache is None else cache.worker_copy()
 
-            strategy_params = (eqp, sty, pry, bst, lvl)
-            pvm_calc_params = (spc, dst, spl, adt)
+    if chunksize is None:
+        n_workers = workers if workers is not None else (os.cpu_count() or 1)
+        chunksize = max(1, math.ceil(math.prod(wide_dims) / (4 * n_workers)))
 
-        elif isinstance(axes_container, PvmAxesPlayerEquipmentStyle):
-            (ply, eqp, sty), tgt, pry, bst, lvl, spc, dst, spl, adt = params
-            assert isinstance(ply, Player)
-            assert isinstance(tgt, Monster)
+    chunks = _chunk_groups(groups, chunksize)
 
-            strategy_params = (eqp, sty, pry, bst, lvl)
-            pvm_calc_params = (spc, dst, spl, adt)
+    if executor is None:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(axes_container, data_mode.name, worker_cache),
+        ) as pool:
+            results = list(pool.map(_evaluate_chunk, chunks))
+    else:
+        payload = (axes_container, data_mode.name, worker_cache)
+        results = list(executor.map(_evaluate_chunk_with_payload, [payload] * len(chunks), chunks))
 
-        elif isinstance(axes_container, PvmAxes):
-            ply, tgt = params[0:2]
-            strategy_params = params[2:7]
-            pvm_calc_params = params[7:11]
+    # map preserves submission order, so reassembly is deterministic
+    for chunk, chunk_values in zip(chunks, results):
+        for group, values in zip(chunk, chunk_values):
+            for _indices, value in zip(group, values):
+                data_ary[_indices] = value
 
-            assert isinstance(ply, Player)
-            assert isinstance(tgt, Monster)
+    return AnalysisResult.from_axes(axes_container, data_ary.squeeze(), data_mode)
 
-            eqp, sty, pry, bst, lvl = strategy_params
-            spc, dst, spl, adt = pvm_calc_params
 
-            if isinstance(sty, PlayerStyle):
-                if isinstance(eqp, Equipment):
-                    try:
-                        weapon = eqp.weapon
-                    except AssertionError:
-                        weapon = ply.wpn
-                else:
-                    weapon = ply.wpn
+class AnalysisRecord(NamedTuple):
+    """One evaluated cell of an analysis grid.
 
-                if sty not in weapon.styles:
-                    data_ary[_indices] = 0
-                    continue
+    Attributes
+    ----------
 
-        else:
-            raise ValueError(axes_container)
-
-        strat_kwargs = {
-            DA.EQUIPMENT.value: eqp,
-            DA.STYLE.value: sty,
-            DA.PRAYERS.value: pry,
-            DA.BOOSTS.value: bst,
-            DA.LEVELS.value: lvl,
-        }
-        pvm_calc_kwargs = {
-            DA.SPECIAL_ATTACK.value: spc,
-            DA.DISTANCE.value: dst,
-            DA.SPELL.value: spl,
-            DA.ADDITIONAL_TARGETS.value: adt,
-        }
-
-        if any(_sp is not None for _sp in strat_kwargs.values()):
-            # if the player must be modified directly
-            old_eqp = copy(ply.eqp)
-            old_sty = copy(ply.style)
-
-            strat = CombatStrategy(ply, **strat_kwargs)
-            dam = strat.activate().damage_distribution(tgt, **pvm_calc_kwargs)
-
-            ply.eqp = old_eqp
-            ply.style = old_sty
-        else:
-            # if the player does not need to be modified directly
-            dam = PvMCalc(ply, tgt).get_damage(**pvm_calc_kwargs)
+    index : tuple[int, ...]
+        The squeezed index of the cell, as in AnalysisResult.
 
-        if data_mode.value.attribute is not None:
-            value = getattr(dam, data_mode.value.attribute)
+    params : dict[str, Any]
+        The value of each squeezed axis at the cell.
 
-        else:
-            hp = tgt.levels.hitpoints
-
-            if data_mode is DataMode.TICKS_TO_KILL:
-                value = hp / dam.per_tick
-            elif data_mode is DataMode.SECONDS_TO_KILL:
-                value = hp / dam.per_second
-            elif data_mode is DataMode.MINUTES_TO_KILL:
-                value = hp / dam.per_minute
-            elif data_mode is DataMode.HOURS_TO_KILL:
-                value = hp / dam.per_hour
+    value : Any
+        The statistic of the cell's DataMode.
+    """
+
+    index: tuple[int, ...]
+    params: dict[str, Any]
+    value: Any
+
+
+def iter_bedevere_the_wise(
+    axes_container: DamageAxes,
+    data_mode: DataMode = DataMode.DPT,
+    cache: DamageCache | DiskDamageCache | None = None,
+    *,
+    skip: Container[tuple[int, ...]] | None = None,
+) -> Iterator[AnalysisRecord]:
+    """Lazily evaluate a grid, one record per cell.
+
+    Cells are yielded as they're computed, in strategy order rather than
+    index order, and no data array is allocated. This suits grids too large
+    to hold in memory, see the sinks in osrs_tools.analysis.sinks.
+
+    Parameters
+    ----------
+    axes_container : DamageAxes
+        See bedevere_the_wise.
+
+    data_mode : DataMode, optional
+        See bedevere_the_wise, by default DataMode.DPT
+
+    cache : DamageCache | DiskDamageCache | None, optional
+        See bedevere_the_wise, by default None
+
+    skip : Container[tuple[int, ...]] | None, optional
+        Squeezed indices that were already computed, e.g. by a previous run.
+        Strategies whose cells are all skipped aren't activated. By default
+        None.
+
+    Yields
+    ------
+    AnalysisRecord
+    """
+    axes = axes_container.axes
+    squeezed = [_idx for _idx, _axis in enumerate(axes) if _axis in axes_container.squeezed_axes]
+
+    for group in _iter_groups(axes_container):
+        records: list[tuple[tuple[int, ...], tuple[int, ...]]] = []
+
+        for _indices in group:
+            index = tuple(_indices[_idx] for _idx in squeezed)
+
+            if skip is None or index not in skip:
+                records.append((_indices, index))
+
+        if not records:
+            continue
+
+        values = _evaluate_group(axes_container, [_r[0] for _r in records], data_mode, cache)
+
+        for (_indices, index), value in zip(records, values):
+            params = {axes[_idx].name: getattr(axes_container, axes[_idx].name)[_indices[_idx]] for _idx in squeezed}
+            yield AnalysisRecord(index, params, value)
+
+
+def _unpack_cell(axes_container: DamageAxes, indices: tuple[int, ...]):
+    """Split the parameters of one cell into player, target & kwargs.
+
+    Returns None if the cell's style is incompatible with its weapon.
+    """
+    params = axes_container[indices]
+
+    # TODO: Rework this shitty code
+    if isinstance(axes_container, PvmAxesEquipmentStyle):
+        ply, tgt, (eqp, sty), pry, bst, lvl, spc, dst, spl, adt = params
+        assert isinstance(ply, Player)
+        assert isinstance(tgt, Monster)
+
+    elif isinstance(axes_container, PvmAxesPlayerEquipmentStyle):
+        (ply, eqp, sty), tgt, pry, bst, lvl, spc, dst, spl, adt = params
+        assert isinstance(ply, Player)
+        assert isinstance(tgt, Monster)
+
+    elif isinstance(axes_container, PvmAxes):
+        ply, tgt = params[0:2]
+        strategy_params = params[2:7]
+        pvm_calc_params = params[7:11]
+
+        assert isinstance(ply, Player)
+        assert isinstance(tgt, Monster)
+
+        eqp, sty, pry, bst, lvl = strategy_params
+        spc, dst, spl, adt = pvm_calc_params
+
+        if isinstance(sty, PlayerStyle):
+            if isinstance(eqp, Equipment):
+                try:
+                    weapon = eqp.weapon
+                except AssertionError:
+                    weapon = ply.wpn
             else:
-                raise NotImplementedError
+                weapon = ply.wpn
+
+            if sty not in weapon.styles:
+                return None
+
+    else:
+        raise ValueError(axes_container)
+
+    strat_kwargs = {
+        DA.EQUIPMENT.value: eqp,
+        DA.STYLE.value: sty,
+        DA.PRAYERS.value: pry,
+        DA.BOOSTS.value: bst,
+        DA.LEVELS.value: lvl,
+    }
+    pvm_calc_kwargs = {
+        DA.SPECIAL_ATTACK.value: spc,
+        DA.DISTANCE.value: dst,
+        DA.SPELL.value: spl,
+        DA.ADDITIONAL_TARGETS.value: adt,
+    }
+
+    return ply, tgt, strat_kwargs, pvm_calc_kwargs
+
+
+def _player_state(ply: Player) -> dict[str, Any]:
+    """Snapshot everything CombatStrategy.activate may change."""
+    return {
+        "equipment": copy(ply.eqp),
+        "_active_style": ply._active_style,
+        "_levels": copy(ply._levels),
+        "levels": copy(ply.levels),
+        "_prayers": Prayers(ply.prayers.name, list(ply.prayers.prayers)),
+        "_timers": list(ply._timers),
+    }
+
+
+def _iter_groups(axes_container: DamageAxes) -> Iterator[list[tuple[int, ...]]]:
+    """Lazily group the full index space by strategy.
+
+    Cells that differ only in their target or damage distribution parameters
+    share the activated player state, so they are grouped by the indices of
+    every other axis. Only one group is held in memory at a time.
+    """
+    dims = axes_container.dims
+    names = [_axis.name for _axis in axes_container.axes]
+    key_axes = [_idx for _idx, _name in enumerate(names) if _name not in _STATELESS_AXES]
+    inner_axes = [_idx for _idx, _name in enumerate(names) if _name in _STATELESS_AXES]
+
+    for key in product(*(range(dims[_idx]) for _idx in key_axes)):
+        group: list[tuple[int, ...]] = []
+
+        for inner in product(*(range(dims[_idx]) for _idx in inner_axes)):
+            _indices = [0] * len(dims)
+
+            for _idx, _val in zip(key_axes, key):
+                _indices[_idx] = _val
+            for _idx, _val in zip(inner_axes, inner):
+                _indices[_idx] = _val
+
+            group.append(tuple(_indices))
+
+        yield group
+
+
+def _chunk_groups(groups: Iterable[list[tuple[int, ...]]], chunksize: int) -> list[list[list[tuple[int, ...]]]]:
+    """Batch whole groups into chunks of roughly chunksize cells."""
+    chunks: list[list[list[tuple[int, ...]]]] = []
+    chunk: list[list[tuple[int, ...]]] = []
+    size = 0
+
+    for group in groups:
+        chunk.append(group)
+        size += len(group)
+
+        if size >= chunksize:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def _evaluate_group(
+    axes_container: DamageAxes, group: list[tuple[int, ...]], data_mode: DataMode, cache: DamageCache | None
+) -> list[Any]:
+    """Evaluate the cells of one strategy group of bedevere_the_wise.
+
+    The strategy is activated once for the whole group and the player is
+    restored afterwards, so a cell's value doesn't depend on which cells were
+    evaluated before it.
+    """
+    if (unpacked := _unpack_cell(axes_container, group[0])) is None:
+        return [0] * len(group)
+
+    ply, _, strat_kwargs, _ = unpacked
+    activate = any(_sp is not None for _sp in strat_kwargs.values())
+
+    # if the player must be modified directly
+    state = _player_state(ply) if activate else None
+    values: list[Any] = []
+
+    try:
+        if activate:
+            CombatStrategy(ply, **strat_kwargs).activate()
+
+        for _indices in group:
+            _, tgt, _, pvm_calc_kwargs = _unpack_cell(axes_container, _indices)
+            dam = PvMCalc(ply, tgt, cache).get_damage(**pvm_calc_kwargs)
+            values.append(_data_mode_value(dam, tgt, data_mode))
+    finally:
+        if state is not None:
+            for name, value in state.items():
+                setattr(ply, name, value)
+
+    return values
+
+
+def _data_mode_value(dam: Damage, tgt: Monster, data_mode: DataMode) -> Any:
+    """Reduce a damage distribution to the statistic of a DataMode."""
+    if data_mode.value.attribute is not None:
+        return getattr(dam, data_mode.value.attribute)
+
+    hp = tgt.levels.hitpoints
+
+    if data_mode is DataMode.TICKS_TO_KILL:
+        value = hp / dam.per_tick
+    elif data_mode is DataMode.SECONDS_TO_KILL:
+        value = hp / dam.per_second
+    elif data_mode is DataMode.MINUTES_TO_KILL:
+        value = hp / dam.per_minute
+    elif data_mode is DataMode.HOURS_TO_KILL:
+        value = hp / dam.per_hour
+    elif data_mode is DataMode.MEDIAN_TICKS_TO_KILL:
+        value = dam.kill_time_distribution(hp).ticks_quantile(0.50)
+    elif data_mode is DataMode.P90_TICKS_TO_KILL:
+        value = dam.kill_time_distribution(hp).ticks_quantile(0.90)
+    else:
+        raise NotImplementedError
 
-        data_ary[_indices] = value
+    return value
 
-    # final squeezing
-    ary_squeezed = data_ary.squeeze()
 
-    return ary_squeezed
+# worker processes ############################################################
+
+# set once per process by _initialize_worker
+_worker_state: dict[str, Any] = {}
+
+# DataMode values are namedtuples that don't pickle, modes are sent by name
+
+
+def _initialize_worker(axes_container: DamageAxes, data_mode_name: str, cache: DamageCache | None):
+    _worker_state["axes_container"] = axes_container
+    _worker_state["data_mode"] = DataMode[data_mode_name]
+    _worker_state["cache"] = cache
+
+
+def _evaluate_chunk(chunk: list[list[tuple[int, ...]]]) -> list[list[Any]]:
+    axes_container = _worker_state["axes_container"]
+    data_mode = _worker_state["data_mode"]
+    cache = _worker_state["cache"]
+    return [_evaluate_group(axes_container, _group, data_mode, cache) for _group in chunk]
+
+
+def _evaluate_chunk_with_payload(
+    payload: tuple[DamageAxes, str, DamageCache | None], chunk: list[list[tuple[int, ...]]]
+) -> list[list[Any]]:
+    axes_container, data_mode_name, cache = payload
+    data_mode = DataMode[data_mode_name]
+    return [_evaluate_group(axes_container, _group, data_mode, cache) for _group in chunk]
 
 
 # bedevere_2d = table_2d(bedevere_the_wise)
 
 
+@dataclass(frozen=True)
+class SwitchSet:
+    """A set of gear switches & the statistic they achieve
+
+    Attributes
+    ----------
+
+    gear : tuple[Gear, ...]
+        The switches, in slot order.
+
+    equipment : Equipment
+        The player's equipment with the switches equipped.
+
+    value : Any
+        The statistic of the DataMode, calculated with PvMCalc.
+    """
+
+    gear: tuple[Gear, ...]
+    equipment: Equipment
+    value: Any
+
+
+@dataclass(frozen=True)
+class Loadout(SwitchSet):
+    """A complete loadout, the style it attacks with & the statistic it achieves
+
+    Attributes
+    ----------
+
+    style : PlayerStyle
+        The attack style of the loadout's weapon.
+    """
+
+    style: PlayerStyle
+
+
 def robin_the_brave(
     player: Player,
-    target: Character,
-    switches: Equipment | tuple[Gear],
+    target: Monster,
+    switches: Equipment | Iterable[Gear],
     num_switches_allowed: int,
     *,
-    prayers: Prayer | Prayers = Piety,
-    boosts: Boost = Overload,
-    active_style: PlayerStyle = None,  # type: ignore
+    prayers: Prayer | Prayers | None = Piety,
+    boosts: Boost | list[Boost] | None = Overload,
+    active_style: PlayerStyle | None = None,
     data_mode: DataMode = DataMode.DPT,
+    top_k: int = 1,
     **kwargs,
-) -> tuple[dict[DataAxes, list], tuple[int], np.ndarray]:
-    """Returns a 1-D data array comparing data_mode under every possible combination of gear in switches, limited to num_switches_allowed.
+) -> list[SwitchSet]:
+    """Find the best sets of at most num_switches_allowed gear switches.
+
+    Weapons, gear that changes a modifier (salve, slayer helm, magic damage,
+    ...) & members of gear sets with set effects are enumerated exhaustively.
+    The remaining switches only change the accuracy & strength bonus, which
+    the damage is monotonic in, so they're searched with branch-and-bound:
+    a partial loadout is pruned when adding the largest per-slot bonus gains
+    to its bonuses can't beat the top_k found so far. Loadouts are scored
+    with a CalcPlan compiled once per weapon & modifier combination, and
+    scores are memoized by bonus. The winners are re-evaluated with PvMCalc.
 
-    Args:
-            player (Player): Player performing the attack. Player should be initialized with as much gear as can be assumed. For example,
-            if you know you're always bringing a torva set, equip it to the player.
-            target (Character): Target of the attack.
-            switches (Equipment | tuple[Gear]): An equipment or tuple[Gear] with the the optional switches.
-            num_switches_allowed (int): The limit of Gear items in switches to use concurrently. The use case for this is in situations where
-                    for inventory limitations you're only able to fit in a few switches, like Olm or TOB.
-            prayers (Prayer | PrayerCollection, optional): Any prayers. Defaults to Piety.
-            boosts (Boost, optional): Any boosts. Defaults to Overload.
-            active_style (PlayerStyle, optional): Any style overrides. Defaults to None.
-            data_mode (DataMode, optional): The statistic in question. Defaults to DataMode.DPT.
+    Parameters
+    ----------
+    player : Player
+        The player, wearing the gear that is always worn. The player is
+        restored afterwards.
 
-    Raises:
-            TypeError: If some of the internal logic goes wrong with wrapper classes.
-            AnalysisError: If you ask a question that doesn't make sense.
+    target : Monster
+        The target of the attack.
 
-    Returns:
-            axes_dict (dict[DataAxes, tuple]): A dictionary for looking up axes indices.
-            indices (tuple[int]): An iterable list of all indices of the data array.
-            data_ary (np.ndarray): The data array.
-    """
-    return NotImplemented
+    switches : Equipment | Iterable[Gear]
+        The candidate switches. Several may share a slot.
+
+    num_switches_allowed : int
+        The maximum number of switches used at once, typically limited by
+        inventory space at Olm, ToB, etc.
+
+    prayers : Prayer | Prayers | None, optional
+        By default Piety.
+
+    boosts : Boost | list[Boost] | None, optional
+        By default Overload.
+
+    active_style : PlayerStyle | None, optional
+        The style to use, for weapons without it their default style is
+        used. By default the player's style.
 
-    # error checking
+    data_mode : DataMode, optional
+        The statistic in question, one of the damage per time or time to kill
+        modes, max hit or mean hit. By default DataMode.DPT.
+
+    top_k : int, optional
+        The number of switch sets returned, by default 1.
+
+    **kwargs
+        Passed to PvMCalc.get_damage, e.g. special_attack or distance.
+
+    Returns
+    -------
+    list[SwitchSet]
+        Up to top_k switch sets, best first. The empty set is a candidate.
+
+    Raises
+    ------
+    AnalysisError
+        If the request doesn't make sense.
+    """
     if isinstance(switches, Equipment):
-        switches_tup = switches.equipped_gear
-    elif isinstance(switches, tuple):
-        assert all(isinstance(g, Gear) for g in switches)
-        switches_tup = switches
+        switches_tup = tuple(switches.equipped_gear)
     else:
+        switches_tup = tuple(switches)
+
+    if not all(isinstance(_g, Gear) for _g in switches_tup):
         raise TypeError(switches)
 
-    if num_switches_allowed >= len(switches_tup):
-        raise AnalysisError()
-
-    # generate every combination of gear switches under the limitations
-    switch_combos = []
-    for combo in combinations(switches_tup, num_switches_allowed):
-        switch_dict = {g.slot.name: g for g in combo}
-        switch_combos.append(switch_dict)
-
-    equipments = [Equipment(**switch_dict) for switch_dict in switch_combos]
-
-    # return bedevere_the_wise(
-    #     player,
-    #     target,
-    #     equipment=equipments,
-    #     prayers=prayers,
-    #     boosts=boosts,
-    #     active_style=active_style,
-    #     data_mode=data_mode,
-    #     **kwargs,
-    # )
+    if num_switches_allowed < 0 or top_k < 1:
+        raise AnalysisError(f"{num_switches_allowed=}, {top_k=}")
+
+    if data_mode not in _SWITCH_SCORES:
+        raise AnalysisError(f"{data_mode} isn't supported")
+
+    if isinstance(prayers, Prayer):
+        prayers = Prayers(prayers=[prayers])
+
+    state = _player_state(player)
+
+    try:
+        CombatStrategy(player, prayers=prayers, boosts=boosts).activate()
+        search = _SwitchSearch(player, target, switches_tup, data_mode, top_k, active_style, kwargs)
+        return search.run(num_switches_allowed)
+    finally:
+        for name, value in state.items():
+            setattr(player, name, value)
+
+
+# sets whose members change modifiers together, so they're never bonus-only
+_MODIFIER_SETS = (
+    InquisitorsArmourSet,
+    NormalVoidSet,
+    EliteVoidSet,
+    ObsidianArmorSet,
+    CrystalArmorSet,
+    DharoksSet,
+)
+
+# the score robin_the_brave maximizes for each DataMode, from a plan or Damage
+_SWITCH_SCORES: dict[DataMode, str] = {
+    DataMode.DPT: "per_tick",
+    DataMode.DPS: "per_tick",
+    DataMode.DPM: "per_tick",
+    DataMode.DPH: "per_tick",
+    DataMode.TICKS_TO_KILL: "per_tick",
+    DataMode.SECONDS_TO_KILL: "per_tick",
+    DataMode.MINUTES_TO_KILL: "per_tick",
+    DataMode.HOURS_TO_KILL: "per_tick",
+    DataMode.MAX_HIT: "max_hit",
+    DataMode.MEAN_HIT: "mean_hit",
+}
+
+
+class _SwitchSearch:
+    """The state of one robin_the_brave search."""
+
+    def __init__(
+        self,
+        player: Player,
+        target: Monster,
+        switches: tuple[Gear, ...],
+        data_mode: DataMode,
+        top_k: int,
+        active_style: PlayerStyle | None,
+        pvm_calc_kwargs: dict[str, Any],
+    ):
+        self.player = player
+        self.target = target
+        self.data_mode = data_mode
+        self.score_attribute = _SWITCH_SCORES[data_mode]
+        self.top_k = top_k
+        self.active_style = player.style if active_style is None else active_style
+        self.pvm_calc_kwargs = pvm_calc_kwargs
+        self.base = copy(player.eqp)
+
+        # candidates that differ from the base loadout, one per name
+        unique: dict[str, Gear] = {}
+
+        for g in switches:
+            if g.name not in unique and not self._worn(self.base, g):
+                unique[g.name] = g
+
+        self.switches = list(unique.values())
+        self.plans: dict[frozenset[str], CalcPlan | None] = {}
+        self.heap: list[tuple[float, int, tuple[Gear, ...]]] = []
+        self.pushed = 0
+
+    # main method
+
+    def run(self, limit: int) -> list[SwitchSet]:
+        modifier_gear, bonus_gear = self._classify()
+
+        for combo in self._modifier_combos(modifier_gear, limit):
+            self._search_bonus_gear(combo, bonus_gear, limit - len(combo))
+
+        results: list[SwitchSet] = []
+
+        for _, _, gear_set in sorted(self.heap, key=lambda _h: (-_h[0], _h[1])):
+            eqp = self._equipment(gear_set)
+            self._wear(eqp)
+            dam = PvMCalc(self.player, self.target).get_damage(**self.pvm_calc_kwargs)
+            results.append(SwitchSet(gear_set, eqp, _data_mode_value(dam, self.target, self.data_mode)))
+
+        return results
+
+    # loadouts
+
+    @staticmethod
+    def _worn(eqp: Equipment, g: Gear) -> bool:
+        return g in eqp.equipped_gear
+
+    def _equipment(self, gear_set: tuple[Gear, ...]) -> Equipment:
+        return copy(self.base).equip(*gear_set)
+
+    def _style(self, eqp: Equipment) -> PlayerStyle:
+        styles = eqp[Slots.WEAPON].styles
+        return self.active_style if self.active_style in styles else styles.default
+
+    def _wear(self, eqp: Equipment):
+        self.player.eqp = eqp
+        self.player.style = self._style(eqp)
+
+    def _plan(self, gear_set: tuple[Gear, ...]) -> CalcPlan | None:
+        """The memoized plan of a loadout, None if it can't be compiled."""
+        key = frozenset(_g.name for _g in gear_set)
+
+        if key not in self.plans:
+            self._wear(self._equipment(gear_set))
+
+            try:
+                self.plans[key] = CalcPlan.compile(self.player, self.target, **self.pvm_calc_kwargs)
+            except CalcPlanError:
+                self.plans[key] = None
+
+        return self.plans[key]
+
+    # classification
+
+    def _classify(self) -> tuple[list[Gear], list[Gear]]:
+        """Split switches into modifier gear & bonus-only gear.
+
+        Gear is bonus-only if, with the base weapon & every weapon switch,
+        equipping it changes nothing in the compiled plan but the bonuses.
+        """
+        weapons = [_g for _g in self.switches if _g.slot is Slots.WEAPON]
+        set_members = {_g.name for _set in _MODIFIER_SETS for _g in _set}
+        modifier_gear: list[Gear] = list(weapons)
+        bonus_gear: list[Gear] = []
+
+        for g in self.switches:
+            if g.slot is Slots.WEAPON:
+                continue
+
+            if g.name in set_members or any(self._changes_modifiers(_w, g) for _w in [None, *weapons]):
+                modifier_gear.append(g)
+            else:
+                bonus_gear.append(g)
+
+        return modifier_gear, bonus_gear
+
+    def _changes_modifiers(self, weapon: Gear | None, g: Gear) -> bool:
+        without = () if weapon is None else (weapon,)
+
+        if g.slot is Slots.SHIELD and self._equipment(without)[Slots.WEAPON].two_handed:
+            return False
+
+        before = self._plan(without)
+        after = self._plan((*without, g))
+
+        if before is None or after is None:
+            return True
+
+        return _plan_signature(before) != _plan_signature(after)
+
+    def _modifier_combos(self, modifier_gear: list[Gear], limit: int) -> Iterator[tuple[Gear, ...]]:
+        """Every valid combination of at most limit modifier switches."""
+        by_slot: dict[Slots, list[Gear | None]] = {}
+
+        for g in modifier_gear:
+            by_slot.setdefault(g.slot, [None]).append(g)
+
+        for choice in product(*by_slot.values()):
+            combo = tuple(_g for _g in choice if _g is not None)
+
+            if len(combo) > limit:
+                continue
+
+            # a shield switch can't be worn with a two-handed weapon
+            if any(_g.slot is Slots.SHIELD for _g in combo) and self._equipment(combo)[Slots.WEAPON].two_handed:
+                continue
+
+            yield combo
+
+    # search
+
+    def _push(self, score: float, gear_set: tuple[Gear, ...]):
+        entry = (score, -self.pushed, gear_set)
+        self.pushed += 1
+
+        if len(self.heap) < self.top_k:
+            heapq.heappush(self.heap, entry)
+        elif score > self.heap[0][0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def _threshold(self) -> float:
+        return self.heap[0][0] if len(self.heap) == self.top_k else -math.inf
+
+    def _search_bonus_gear(self, combo: tuple[Gear, ...], bonus_gear: list[Gear], budget: int):
+        eqp = self._equipment(combo)
+        plan = self._plan(combo)
+        self._wear(eqp)
+        dt = PvMCalc(self.player, self.target)._get_damage_type(self.pvm_calc_kwargs.get("spell"))
+
+        two_handed = eqp[Slots.WEAPON].two_handed
+        combo_slots = {_g.slot for _g in combo}
+        options_by_slot: dict[Slots, list[tuple[Gear, int, int]]] = {}
+
+        # magic strength is a modifier, GearColumns leaves it out of the bonus
+        worn = eqp.equipped_gear
+        worn_bonus = dict(zip((_w.slot for _w in worn), GearColumns.from_gear(worn).aggressive_bonus(dt).tolist()))
+        bonuses = GearColumns.from_gear(bonus_gear).aggressive_bonus(dt).tolist()
+
+        for g, (acc, stg) in zip(bonus_gear, bonuses):
+            if g.slot in combo_slots or (g.slot is Slots.SHIELD and two_handed):
+                continue
+
+            if g.slot in worn_bonus:
+                cur_acc, cur_stg = worn_bonus[g.slot]
+                acc, stg = acc - cur_acc, stg - cur_stg
+
+            # gear that gains nothing can't beat leaving the slot alone
+            if acc > 0 or stg > 0:
+                options_by_slot.setdefault(g.slot, []).append((g, acc, stg))
+
+        slots = list(options_by_slot.values())
+
+        if plan is None:
+            self._exhaustive(combo, slots, budget)
+        else:
+            self._branch_and_bound(plan, combo, slots, budget)
+
+    def _branch_and_bound(
+        self, plan: CalcPlan, combo: tuple[Gear, ...], slots: list[list[tuple[Gear, int, int]]], budget: int
+    ):
+        scores: dict[tuple[int, int], float] = {}
+
+        def score(acc: int, stg: int) -> float:
+            if (acc, stg) not in scores:
+                ev = plan.evaluate(accuracy_bonus=acc, strength_bonus=stg)
+                scores[acc, stg] = float(getattr(ev, self.score_attribute))
+
+            return scores[acc, stg]
+
+        # the best gain each slot can contribute, for optimistic bounds
+        best_acc = [max(max(_o[1] for _o in _s), 0) for _s in slots]
+        best_stg = [max(max(_o[2] for _o in _s), 0) for _s in slots]
+
+        def bound(start: int, budget: int, acc: int, stg: int) -> float:
+            acc_gain = sum(sorted(best_acc[start:], reverse=True)[:budget])
+            stg_gain = sum(sorted(best_stg[start:], reverse=True)[:budget])
+            return score(acc + acc_gain, stg + stg_gain)
+
+        def visit(start: int, budget: int, acc: int, stg: int, chosen: tuple[Gear, ...]):
+            self._push(score(acc, stg), combo + chosen)
+
+            if budget == 0 or start == len(slots) or bound(start, budget, acc, stg) <= self._threshold():
+                return
+
+            for idx in range(start, len(slots)):
+                for g, d_acc, d_stg in slots[idx]:
+                    visit(idx + 1, budget - 1, acc + d_acc, stg + d_stg, chosen + (g,))
+
+        visit(0, budget, plan.accuracy_bonus, plan.strength_bonus, ())
+
+    def _exhaustive(self, combo: tuple[Gear, ...], slots: list[list[tuple[Gear, int, int]]], budget: int):
+        """Evaluate every completion with PvMCalc, for loadouts without a plan."""
+
+        def visit(start: int, budget: int, chosen: tuple[Gear, ...]):
+            gear_set = combo + chosen
+            self._wear(self._equipment(gear_set))
+            dam = PvMCalc(self.player, self.target).get_damage(**self.pvm_calc_kwargs)
+            self._push(float(getattr(dam, self.score_attribute)), gear_set)
+
+            if budget == 0:
+                return
+
+            for idx in range(start, len(slots)):
+                for g, _, _ in slots[idx]:
+                    visit(idx + 1, budget - 1, chosen + (g,))
+
+        visit(0, budget, ())
+
+
+def _plan_signature(plan: CalcPlan) -> tuple[Any, ...]:
+    """Everything in a plan except its bonuses."""
+    return (
+        plan.kind,
+        plan.attack_speed,
+        plan.roll_multipliers,
+        plan.damage_multipliers,
+        plan.flat_damage_bonus,
+        plan.base_damage,
+        plan.double_accuracy_roll,
+        plan.accuracy_level,
+        plan.strength_level,
+        plan.defence_roll,
+    )
 
 
 class AnalysisError(OsrsException):
@@ -5,6 +5,8 @@
 # created:  2022-05-02                                                        #
 ###############################################################################
 """
+from functools import partial
+
 from osrs_tools.data import Skills
 from osrs_tools.tracked_value import (
     Level,
@@ -16,6 +18,16 @@ from osrs_tools.tracked_value import (
 from .skill_modifier import SkillModifier, SkillModifierCallableType
 
 
+def _boost_level(lvl: Level, base: int, ratio: float, negative: bool | None, comment: str | None) -> Level:
+    ratio_mod = LevelModifier(float(ratio), comment)
+    diffval = (lvl * ratio_mod) + base
+
+    new_lvl = lvl - diffval if negative is True else lvl + diffval
+    new_lvl = min([max([MinimumVisibleLevel, new_lvl]), MaximumVisibleLevel])
+
+    return new_lvl
+
+
 class BoostBuilder:
     """Builder for Boost, SkillModifier, etc.
 
@@ -62,16 +74,8 @@ class BoostBuilder:
         CallableLevelsModifierType
         """
 
-        def inner_builder(lvl: Level) -> Level:
-            ratio_mod = LevelModifier(float(ratio), comment)
-            diffval = (lvl * ratio_mod) + base
-
-            new_lvl = lvl - diffval if negative is True else lvl + diffval
-            new_lvl = min([max([MinimumVisibleLevel, new_lvl]), MaximumVisibleLevel])
-
-            return new_lvl
-
-        return inner_builder
+        # a partial of a module-level function pickles, which lets boosts travel to worker processes
+        return partial(_boost_level, base=base, ratio=ratio, negative=negative, comment=comment)
 
     def create_skill_modifier(
         self,
@@ -314,7 +314,7 @@ class Player(Character):
                 bonus = ab.ranged_strength
 
             base_damage = cmb.base_damage(effective_level, bonus)
-            return DamageValue(math.floor(base_damage))
+            return cmb.max_hit(base_damage, *damage_modifiers)
 
         # magic is a little less simple
         if spell is None:
@@ -18,5 +18,8 @@ will come to find out eventually.
 ###############################################################################
 """
 
-from .damage import Damage, Hitsplat
+from .damage import Damage, Hitsplat, HitsplatBatch, KillTimeDistribution, UniformHitsplat
+from .cache import DamageCache, FingerprintError, fingerprint
+from .disk_cache import DiskDamageCache, cache_version, code_version, data_version, stable_hash
 from .player import PvMCalc
+from .plan import CalcPlan, CalcPlanError, LevelTransform, PlanEvaluation, PlanKind
@@ -0,0 +1,344 @@
+"""Table-driven enchanted bolt effects and their damage distributions.
+
+Every enchanted bolt effect falls into one of a few kinds: a larger max hit
+(diamond, onyx), a flat bonus on top of the normal roll (opal, pearl,
+dragonstone), or a fixed amount of damage (ruby). An effect that procs always
+hits, so the distribution of a crossbow attack is the mixture of the normal
+accuracy-gated hitsplat and the effect hitsplat, built with array operations.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+import math
+from dataclasses import dataclass
+from enum import Enum, auto
+
+import numpy as np
+from numpy.typing import NDArray
+from osrs_tools.data import (
+    ARMADYL_CROSSBOW_SPECIAL_BOLT_PROC_BOOST,
+    DIAMOND_BOLTS_DMG,
+    DIAMOND_BOLTS_PROC,
+    DRAGONSTONE_BOLTS_PROC,
+    DRAGONSTONE_BOLTS_RANGED_RATIO,
+    KANDARIN_HARD_DIARY_BOLT_PROC_BOOST,
+    ONYX_BOLTS_DMG,
+    ONYX_BOLTS_PROC,
+    OPAL_BOLTS_PROC,
+    OPAL_BOLTS_RANGED_RATIO,
+    PEARL_BOLTS_FIERY_RANGED_RATIO,
+    PEARL_BOLTS_PROC,
+    PEARL_BOLTS_RANGED_RATIO,
+    RUBY_BOLTS_HP_CAP,
+    RUBY_BOLTS_HP_RATIO,
+    RUBY_BOLTS_PROC,
+    ZARYTE_CROSSBOW_BOLT_EFFECT_BOOST,
+    MonsterTypes,
+    Slots,
+)
+from osrs_tools.gear import Equipment
+
+from .damage import Damage, Hitsplat
+
+###############################################################################
+# bolt effect table                                                           #
+###############################################################################
+
+
+class BoltEffectKind(Enum):
+    NONE = auto()  # no effect on damage
+    MULTIPLIER = auto()  # max hit is multiplied by magnitude
+    FLAT = auto()  # magnitude * visible ranged level is added to the roll
+    FIXED = auto()  # magnitude * target hitpoints, capped
+
+
+@dataclass(frozen=True)
+class BoltEffect:
+    """An enchanted bolt effect.
+
+    Attributes
+    ----------
+
+    name : str
+        The name of the effect.
+
+    ammunition : tuple[str, ...]
+        The names of the ammunition with this effect.
+
+    kind : BoltEffectKind, optional
+        How the effect changes damage, by default BoltEffectKind.NONE.
+
+    proc_chance : float, optional
+        The base activation chance, by default 0.
+
+    magnitude : float, optional
+        The kind-specific strength of the effect, by default 0.
+
+    fiery_magnitude : float | None, optional
+        Overrides magnitude against fiery targets, by default None.
+
+    immune : tuple[MonsterTypes, ...], optional
+        Targets of these types are immune to the effect, by default ().
+    """
+
+    name: str
+    ammunition: tuple[str, ...]
+    kind: BoltEffectKind = BoltEffectKind.NONE
+    proc_chance: float = 0.0
+    magnitude: float = 0.0
+    fiery_magnitude: float | None = None
+    immune: tuple[MonsterTypes, ...] = ()
+
+    def activation_chance(
+        self,
+        *,
+        kandarin_hard_diary: bool = False,
+        armadyl_special: bool = False,
+        zaryte_special: bool = False,
+    ) -> float:
+        """The probability that the effect activates on an attack.
+
+        Parameters
+        ----------
+        kandarin_hard_diary : bool, optional
+            The Kandarin hard diary boosts base activation by 10%, by default False.
+        armadyl_special : bool, optional
+            The armadyl crossbow special attack doubles activation, by default False.
+        zaryte_special : bool, optional
+            The zaryte crossbow special attack guarantees activation, by default False.
+
+        Returns
+        -------
+        float
+        """
+        if self.kind is BoltEffectKind.NONE:
+            return 0.0
+
+        if zaryte_special:
+            return 1.0
+
+        chance = self.proc_chance
+
+        if kandarin_hard_diary:
+            chance *= KANDARIN_HARD_DIARY_BOLT_PROC_BOOST
+
+        if armadyl_special:
+            chance *= ARMADYL_CROSSBOW_SPECIAL_BOLT_PROC_BOOST
+
+        return min(chance, 1.0)
+
+    def effect_pmf(
+        self,
+        max_hit: int,
+        ranged_level: int,
+        target_hitpoints: int,
+        target_types: list[MonsterTypes] | None = None,
+        zaryte: bool = False,
+    ) -> NDArray[np.float_] | None:
+        """The dense damage PMF of an attack on which the effect activated.
+
+        Parameters
+        ----------
+        max_hit : int
+            The normal max hit.
+        ranged_level : int
+            The attacker's visible ranged level.
+        target_hitpoints : int
+            The target's current hitpoints.
+        target_types : list[MonsterTypes] | None, optional
+            The target's special attributes, by default None.
+        zaryte : bool, optional
+            The zaryte crossbow boosts effects by 10%, by default False.
+
+        Returns
+        -------
+        NDArray[np.float_] | None
+            None if the effect does nothing against the target.
+        """
+        target_types = [] if target_types is None else target_types
+
+        if self.kind is BoltEffectKind.NONE or any(_t in self.immune for _t in target_types):
+            return None
+
+        boost = ZARYTE_CROSSBOW_BOLT_EFFECT_BOOST if zaryte else 1.0
+
+        if self.kind is BoltEffectKind.MULTIPLIER:
+            effect_max_hit = math.floor(max_hit * self.magnitude * boost)
+            return np.full(effect_max_hit + 1, 1 / (effect_max_hit + 1))
+
+        if self.kind is BoltEffectKind.FLAT:
+            if self.fiery_magnitude is not None and MonsterTypes.FIERY in target_types:
+                magnitude = self.fiery_magnitude
+            else:
+                magnitude = self.magnitude
+
+            bonus = math.floor(ranged_level * magnitude * boost)
+            pmf = np.zeros(max_hit + bonus + 1)
+            pmf[bonus:] = 1 / (max_hit + 1)
+            return pmf
+
+        if self.kind is BoltEffectKind.FIXED:
+            ratio = self.magnitude * boost
+            damage = min(math.floor(target_hitpoints * ratio), math.floor(RUBY_BOLTS_HP_CAP * ratio))
+            pmf = np.zeros(damage + 1)
+            pmf[damage] = 1.0
+            return pmf
+
+        raise NotImplementedError(self.kind)
+
+
+class BoltEffects(Enum):
+    OPAL = BoltEffect(
+        "lucky lightning",
+        ("opal bolts (e)", "opal dragon bolts (e)"),
+        BoltEffectKind.FLAT,
+        OPAL_BOLTS_PROC,
+        OPAL_BOLTS_RANGED_RATIO,
+    )
+    JADE = BoltEffect("earth's fury", ("jade bolts (e)", "jade dragon bolts (e)"))
+    PEARL = BoltEffect(
+        "sea curse",
+        ("pearl bolts (e)", "pearl dragon bolts (e)"),
+        BoltEffectKind.FLAT,
+        PEARL_BOLTS_PROC,
+        PEARL_BOLTS_RANGED_RATIO,
+        fiery_magnitude=PEARL_BOLTS_FIERY_RANGED_RATIO,
+    )
+    TOPAZ = BoltEffect("down to earth", ("topaz bolts (e)", "topaz dragon bolts (e)"))
+    SAPPHIRE = BoltEffect("clear mind", ("sapphire bolts (e)", "sapphire dragon bolts (e)"))
+    # poison is damage over time, not part of the hit
+    EMERALD = BoltEffect("magical poison", ("emerald bolts (e)", "emerald dragon bolts (e)"))
+    RUBY = BoltEffect(
+        "blood forfeit",
+        ("ruby bolts (e)", "ruby dragon bolts (e)"),
+        BoltEffectKind.FIXED,
+        RUBY_BOLTS_PROC,
+        RUBY_BOLTS_HP_RATIO,
+    )
+    DIAMOND = BoltEffect(
+        "armour piercing",
+        ("diamond bolts (e)", "diamond dragon bolts (e)"),
+        BoltEffectKind.MULTIPLIER,
+        DIAMOND_BOLTS_PROC,
+        DIAMOND_BOLTS_DMG,
+    )
+    DRAGONSTONE = BoltEffect(
+        "dragon's breath",
+        ("dragonstone bolts (e)", "dragonstone dragon bolts (e)"),
+        BoltEffectKind.FLAT,
+        DRAGONSTONE_BOLTS_PROC,
+        DRAGONSTONE_BOLTS_RANGED_RATIO,
+        immune=(MonsterTypes.FIERY, MonsterTypes.DRACONIC),
+    )
+    ONYX = BoltEffect(
+        "life leech",
+        ("onyx bolts (e)", "onyx dragon bolts (e)"),
+        BoltEffectKind.MULTIPLIER,
+        ONYX_BOLTS_PROC,
+        ONYX_BOLTS_DMG,
+        immune=(MonsterTypes.UNDEAD,),
+    )
+
+
+_EFFECTS_BY_AMMUNITION = {name: be.value for be in BoltEffects for name in be.value.ammunition}
+
+###############################################################################
+# main functions                                                              #
+###############################################################################
+
+
+def bolt_effect(equipment: Equipment) -> BoltEffect | None:
+    """Look up the effect of the equipped ammunition.
+
+    Parameters
+    ----------
+    equipment : Equipment
+        The equipment.
+
+    Returns
+    -------
+    BoltEffect | None
+        None if no enchanted bolts are equipped.
+    """
+    try:
+        ammunition = equipment[Slots.AMMUNITION]
+    except AssertionError:
+        return None
+
+    return _EFFECTS_BY_AMMUNITION.get(ammunition.name.lower())
+
+
+def bolt_damage(
+    effect: BoltEffect,
+    attack_speed: int,
+    max_hit: int,
+    accuracy: float,
+    ranged_level: int,
+    target_hitpoints: int,
+    target_types: list[MonsterTypes] | None = None,
+    *,
+    kandarin_hard_diary: bool = False,
+    armadyl_special: bool = False,
+    zaryte: bool = False,
+    zaryte_special: bool = False,
+) -> Damage:
+    """The damage distribution of a crossbow firing enchanted bolts.
+
+    The PMF is (1 - p) * normal + p * effect, where p is the activation chance,
+    normal is the accuracy-gated uniform hitsplat, and effect is the always
+    hitting effect hitsplat. The result is clamped to the target's hitpoints.
+
+    Parameters
+    ----------
+    effect : BoltEffect
+        The bolt effect.
+    attack_speed : int
+        The attack speed in ticks.
+    max_hit : int
+        The normal max hit.
+    accuracy : float
+        The probability a normal attack will succeed.
+    ranged_level : int
+        The attacker's visible ranged level.
+    target_hitpoints : int
+        The target's current hitpoints.
+    target_types : list[MonsterTypes] | None, optional
+        The target's special attributes, by default None.
+    kandarin_hard_diary : bool, optional
+        Boosts activation chance, by default False.
+    armadyl_special : bool, optional
+        Armadyl crossbow special attack, by default False.
+    zaryte : bool, optional
+        Zaryte crossbow effect boost, by default False.
+    zaryte_special : bool, optional
+        Zaryte crossbow special attack, by default False.
+
+    Returns
+    -------
+    Damage
+    """
+    max_hit = int(max_hit)
+    hp = int(target_hitpoints)
+
+    normal = np.full(max_hit + 1, accuracy / (max_hit + 1))
+    normal[0] += 1 - accuracy
+
+    chance = effect.activation_chance(
+        kandarin_hard_diary=kandarin_hard_diary,
+        armadyl_special=armadyl_special,
+        zaryte_special=zaryte_special,
+    )
+    effect_pmf = effect.effect_pmf(max_hit, ranged_level, hp, target_types, zaryte)
+
+    if effect_pmf is None or chance == 0:
+        pmf = normal
+    else:
+        pmf = np.zeros(max(normal.size, effect_pmf.size))
+        pmf[: normal.size] += (1 - chance) * normal
+        pmf[: effect_pmf.size] += chance * effect_pmf
+
+    hitsplat = Hitsplat.clamp_to_hitpoints_cap(np.arange(pmf.size), pmf, hp)
+    return Damage(attack_speed, [hitsplat])
@@ -0,0 +1,350 @@
+"""Canonical state fingerprints and a bounded cache for damage calculations.
+
+Player, Monster and Equipment are mutable, unhashable dataclasses, so they
+can't key a cache directly. A fingerprint walks such an object and reduces it
+to nested tuples of primitives: dataclasses become (class name, fields),
+TrackedValues become their value, and enums become their name. Two objects
+with equal fingerprints are indistinguishable to a damage calculation.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+import functools
+import types
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from typing import Any, Callable, Hashable
+
+import numpy as np
+from osrs_tools.exceptions import OsrsException
+from osrs_tools.tracked_value import TrackedValue
+
+from .damage import Damage
+
+###############################################################################
+# errors 'n such                                                              #
+###############################################################################
+
+
+class FingerprintError(OsrsException):
+    pass
+
+
+DEFAULT_CACHE_SIZE = 4096
+
+# bookkeeping that has no bearing on damage
+_IGNORED_FIELDS = frozenset(["_timers"])
+# references to other characters are reduced to a name so cycles are avoided
+_REFERENCE_FIELDS = frozenset(["last_attacked", "last_attacked_by"])
+_MEMO_ATTRIBUTE = "_fingerprint"
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+###############################################################################
+# fingerprints                                                                #
+###############################################################################
+
+
+def fingerprint(obj: Any) -> Hashable:
+    """Reduce an object to a canonical, hashable fingerprint.
+
+    Frozen dataclasses (Gear, Prayer, Spell, ...) are fingerprinted once and
+    the result is memoized on the instance.
+
+    Parameters
+    ----------
+    obj : Any
+        Any combination of dataclasses, TrackedValues, enums, containers,
+        arrays, callables & primitives.
+
+    Returns
+    -------
+    Hashable
+
+    Raises
+    ------
+    FingerprintError
+    """
+    return _handler(obj.__class__)(obj)
+
+
+def _primitive(obj: Any) -> Hashable:
+    return obj
+
+
+def _tracked_value(obj: TrackedValue) -> Hashable:
+    return obj.value
+
+
+def _enum(obj: Enum) -> Hashable:
+    return (obj.__class__.__name__, obj.name)
+
+
+def _ndarray(obj: np.ndarray) -> Hashable:
+    return (obj.dtype.str, obj.shape, obj.tobytes())
+
+
+def _sequence(obj: list | tuple) -> Hashable:
+    return tuple(fingerprint(_o) for _o in obj)
+
+
+def _set(obj: set | frozenset) -> Hashable:
+    return frozenset(fingerprint(_o) for _o in obj)
+
+
+def _mapping(obj: dict) -> Hashable:
+    return tuple(sorted((repr(_k), fingerprint(_v)) for _k, _v in obj.items()))
+
+
+def _callable(obj: Any) -> Hashable:
+    """Fingerprint a callable by its definition and the state bound to it.
+
+    Closures, defaults, bound instances & partial arguments are part of the
+    fingerprint, so two callables of one definition with different state
+    differ. Callables whose state can't be seen, e.g. instances with a
+    __call__ method, raise a FingerprintError.
+    """
+    if isinstance(obj, functools.partial):
+        return ("partial", fingerprint(obj.func), fingerprint(obj.args), fingerprint(obj.keywords))
+
+    if isinstance(obj, types.MethodType):
+        return ("method", fingerprint(obj.__self__), _callable(obj.__func__))
+
+    name = (getattr(obj, "__module__", None), getattr(obj, "__qualname__", None))
+
+    if isinstance(obj, types.FunctionType):
+        try:
+            # a recursive closure holds itself
+            closure = tuple(
+                name if _c.cell_contents is obj else fingerprint(_c.cell_contents) for _c in obj.__closure__ or ()
+            )
+        except ValueError as exc:  # an empty cell
+            raise FingerprintError(f"{obj.__qualname__} has an unbound closure") from exc
+
+        return (*name, fingerprint(obj.__defaults__), fingerprint(obj.__kwdefaults__), closure)
+
+    if isinstance(obj, type):
+        return name
+
+    # builtins bound to an object, e.g. [].append, carry its state
+    if isinstance(obj, types.BuiltinFunctionType) and isinstance(obj.__self__, (types.ModuleType, type(None))):
+        return name
+
+    raise FingerprintError(f"{obj.__class__.__name__} can't be fingerprinted")
+
+
+def _dataclass_handler(cls: type) -> Callable[[Any], Hashable]:
+    names = tuple(_f.name for _f in fields(cls) if _f.name not in _IGNORED_FIELDS)
+    qualname = cls.__qualname__
+    frozen = cls.__dataclass_params__.frozen
+
+    def _dataclass(obj: Any) -> Hashable:
+        if frozen and (memo := obj.__dict__.get(_MEMO_ATTRIBUTE)) is not None:
+            return memo
+
+        items = []
+
+        for name in names:
+            value = getattr(obj, name, None)
+
+            if name in _REFERENCE_FIELDS:
+                items.append((name, None if value is None else (value.__class__.__name__, value.name)))
+            else:
+                items.append((name, fingerprint(value)))
+
+        fp = (qualname, tuple(items))
+
+        if frozen:
+            object.__setattr__(obj, _MEMO_ATTRIBUTE, fp)
+
+        return fp
+
+    return _dataclass
+
+
+def _other(obj: Any) -> Hashable:
+    if callable(obj):
+        return _callable(obj)
+
+    raise FingerprintError(f"{obj.__class__.__name__} can't be fingerprinted")
+
+
+@functools.cache
+def _handler(cls: type) -> Callable[[Any], Hashable]:
+    """Resolve (once per class) how instances of a class are fingerprinted."""
+    if cls is type(None) or issubclass(cls, (bool, int, float, str)):
+        return _primitive
+
+    if issubclass(cls, TrackedValue):
+        return _tracked_value
+
+    if issubclass(cls, Enum):
+        return _enum
+
+    if issubclass(cls, np.generic):
+        return np.generic.item
+
+    if issubclass(cls, np.ndarray):
+        return _ndarray
+
+    if issubclass(cls, (list, tuple)):
+        return _sequence
+
+    if issubclass(cls, (set, frozenset)):
+        return _set
+
+    if issubclass(cls, dict):
+        return _mapping
+
+    if is_dataclass(cls):
+        return _dataclass_handler(cls)
+
+    return _other
+
+
+###############################################################################
+# cache                                                                       #
+###############################################################################
+
+
+@dataclass
+class DamageCache:
+    """A size-bounded LRU cache of Damage keyed on state fingerprints.
+
+    Keys are (attacker, defender, arguments) fingerprints, see DamageCache.key.
+    Cached Damage objects are shared between hits and must not be mutated.
+
+    Attributes
+    ----------
+
+    maxsize : int | None, optional
+        The maximum number of entries, None for an unbounded cache. Defaults
+        to DEFAULT_CACHE_SIZE.
+
+    hits : int
+        The number of lookups answered from the cache.
+
+    misses : int
+        The number of lookups that had to be computed.
+
+    evictions : int
+        The number of entries dropped to respect maxsize.
+    """
+
+    maxsize: int | None = DEFAULT_CACHE_SIZE
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    evictions: int = field(init=False, default=0)
+    _store: OrderedDict[Hashable, Damage] = field(init=False, repr=False, default_factory=OrderedDict)
+
+    def __post_init__(self):
+        if self.maxsize is not None and self.maxsize < 1:
+            raise ValueError(self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, __key: Hashable, /) -> bool:
+        return __key in self._store
+
+    # basic methods
+
+    @staticmethod
+    def key(attacker: Any, defender: Any, **kwargs) -> tuple[Hashable, Hashable, Hashable]:
+        """Create the cache key of a damage calculation.
+
+        Parameters
+        ----------
+        attacker : Any
+            The attacker, typically a Player.
+        defender : Any
+            The defender, typically a Monster.
+        **kwargs
+            The arguments of the calculation.
+
+        Returns
+        -------
+        tuple[Hashable, Hashable, Hashable]
+        """
+        return (fingerprint(attacker), fingerprint(defender), fingerprint(kwargs))
+
+    def get(self, key: Hashable) -> Damage | None:
+        """Look up a key, counting the hit or miss."""
+        try:
+            value = self._store[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._store.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Damage):
+        """Store a value, evicting the least recently used entries as needed."""
+        self._store[key] = value
+        self._store.move_to_end(key)
+
+        if self.maxsize is not None:
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, func: Callable[[], Damage]) -> Damage:
+        """Return the cached value of key, computing & storing it on a miss."""
+        if (value := self.get(key)) is None:
+            value = func()
+            self.put(key, value)
+
+        return value
+
+    def worker_copy(self) -> "DamageCache":
+        """The cache a worker process uses, empty & of the same size."""
+        return DamageCache(self.maxsize)
+
+    def invalidate(self, *, attacker: Any = None, defender: Any = None) -> int:
+        """Drop every entry computed for the given attacker and/or defender.
+
+        Parameters
+        ----------
+        attacker : Any, optional
+            Drop entries whose attacker state matches this one, by default None.
+        defender : Any, optional
+            Drop entries whose defender state matches this one, by default None.
+
+        Returns
+        -------
+        int
+            The number of dropped entries.
+        """
+        if attacker is None and defender is None:
+            raise ValueError("specify an attacker and/or defender, or use clear")
+
+        atk_fp = None if attacker is None else fingerprint(attacker)
+        def_fp = None if defender is None else fingerprint(defender)
+
+        stale = [
+            _k
+            for _k in self._store
+            if (atk_fp is None or _k[0] == atk_fp) and (def_fp is None or _k[1] == def_fp)
+        ]
+
+        for _k in stale:
+            del self._store[_k]
+
+        return len(stale)
+
+    def clear(self):
+        """Drop every entry and reset statistics."""
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Report hit, miss & eviction statistics."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._store))
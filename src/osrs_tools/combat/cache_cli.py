@@ -0,0 +1,96 @@
+"""Inspect & prune a DiskDamageCache from the command line.
+
+    python -m osrs_tools.combat.cache_cli info PATH
+    python -m osrs_tools.combat.cache_cli prune PATH [--stale] [--older-than DAYS]
+        [--max-entries N] [--max-bytes N] [--vacuum]
+    python -m osrs_tools.combat.cache_cli clear PATH
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Sequence
+
+from .disk_cache import DiskDamageCache
+
+SECONDS_PER_DAY = 86400
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
+
+        size /= 1024
+
+    raise AssertionError
+
+
+def _info(cache: DiskDamageCache) -> str:
+    info = cache.info()
+    return "\n".join(
+        [
+            f"path:         {cache.path}",
+            f"entries:      {info.entries}",
+            f"size:         {_format_bytes(info.bytes)}",
+            f"stale:        {info.stale}",
+            f"version:      {info.version[:16]}",
+        ]
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m osrs_tools.combat.cache_cli", description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    info = commands.add_parser("info", help="show the size of a cache")
+    info.add_argument("path")
+
+    prune = commands.add_parser("prune", help="drop stale, old or least recently used entries")
+    prune.add_argument("path")
+    prune.add_argument("--stale", action="store_true", help="drop entries of other data or code versions")
+    prune.add_argument("--older-than", type=float, metavar="DAYS", help="drop entries unused for DAYS")
+    prune.add_argument("--max-entries", type=int, help="evict down to N entries")
+    prune.add_argument("--max-bytes", type=int, help="evict down to N bytes")
+    prune.add_argument("--vacuum", action="store_true", help="shrink the file afterwards")
+
+    clear = commands.add_parser("clear", help="drop every entry")
+    clear.add_argument("path")
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+
+    with DiskDamageCache(args.path, max_bytes=None) as cache:
+        if args.command == "prune":
+            older_than = None if args.older_than is None else args.older_than * SECONDS_PER_DAY
+            dropped = cache.prune(stale=args.stale, older_than=older_than)
+
+            if args.max_entries is not None or args.max_bytes is not None:
+                dropped += cache.evict(args.max_entries, args.max_bytes)
+
+            if args.vacuum:
+                cache.vacuum()
+
+            print(f"dropped {dropped} entries")
+        elif args.command == "clear":
+            entries = len(cache)
+            cache.clear()
+            cache.vacuum()
+            print(f"dropped {entries} entries")
+
+        print(_info(cache))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,11 @@
 """
 
 import functools
+import math
 from dataclasses import dataclass, field
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 from osrs_tools.data import TICKS_PER_HOUR, TICKS_PER_MINUTE, TICKS_PER_SECOND
 from osrs_tools.exceptions import OsrsException
 from osrs_tools.tracked_value import DamageValue, Level
@@ -20,12 +21,103 @@ from osrs_tools.tracked_value import DamageValue, Level
 ###############################################################################
 
 HS_TOLERANCE = 1e-6
+KT_TOLERANCE = 1e-9
+KT_MAX_ATTACKS = 10_000
+FFT_CONVOLUTION_THRESHOLD = 256
 
 
 class DamageError(OsrsException):
     pass
 
 
+###############################################################################
+# sampling                                                                    #
+###############################################################################
+
+
+def _generator(rng: np.random.Generator | int | None = None) -> np.random.Generator:
+    return np.random.default_rng(rng)
+
+
+@dataclass(frozen=True)
+class AliasTable:
+    """Walker/Vose alias table for O(1) sampling from a discrete distribution.
+
+    Attributes
+    ----------
+
+    values : NDArray[np.int_]
+        The values to be sampled.
+
+    threshold : NDArray[np.float_]
+        The probability of keeping column i rather than taking its alias.
+
+    alias : NDArray[np.int_]
+        The alias column of column i.
+    """
+
+    values: NDArray[np.int_] = field(repr=False)
+    threshold: NDArray[np.float_] = field(repr=False)
+    alias: NDArray[np.int_] = field(repr=False)
+
+    def sample(self, size: int | tuple[int, ...] = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
+        """Draw samples, each draw costs one integer and one uniform variate.
+
+        Parameters
+        ----------
+        size : int | tuple[int, ...], optional
+            The output shape, by default 1.
+        rng : np.random.Generator | int | None, optional
+            A generator or seed, by default None.
+
+        Returns
+        -------
+        NDArray[np.int_]
+        """
+        gen = _generator(rng)
+        column = gen.integers(0, self.values.size, size=size)
+        keep = gen.random(size=size) < self.threshold[column]
+        return self.values[np.where(keep, column, self.alias[column])]
+
+    @classmethod
+    def from_pmf(cls, values: NDArray[np.int_], probability: NDArray[np.float_]):
+        """Build an alias table with Vose's method.
+
+        Parameters
+        ----------
+        values : NDArray[np.int_]
+            The values to be sampled.
+        probability : NDArray[np.float_]
+            The probability of each value.
+
+        Returns
+        -------
+        AliasTable
+        """
+        n = values.size
+        scaled = np.asarray(probability, dtype=float) * n / np.sum(probability)
+        threshold = np.ones(n)
+        alias = np.arange(n)
+
+        small = [idx for idx in range(n) if scaled[idx] < 1]
+        large = [idx for idx in range(n) if scaled[idx] >= 1]
+
+        while small and large:
+            lo = small.pop()
+            hi = large.pop()
+            threshold[lo] = scaled[lo]
+            alias[lo] = hi
+            scaled[hi] -= 1 - scaled[lo]
+
+            if scaled[hi] < 1:
+                small.append(hi)
+            else:
+                large.append(hi)
+
+        # leftover columns are full up to floating point error
+        return cls(np.asarray(values), threshold, alias)
+
+
 ###############################################################################
 # Hitsplat & Damage classes                                                   #
 ###############################################################################
@@ -52,7 +144,33 @@ class Hitsplat:
         self.mean_hit = np.dot(self.damage, self.probability)
         self.probability_nonzero_damage = 1 - self.probability[0]
 
-    def random_hit(self, k: int = 1) -> NDArray[np.int_]:
+    @property
+    def pmf(self) -> NDArray[np.float_]:
+        """The dense damage PMF, where pmf[d] is the probability of d damage."""
+        return np.bincount(self.damage, weights=self.probability)
+
+    @functools.cached_property
+    def alias_table(self) -> AliasTable:
+        """The cached alias table used for sampling."""
+        return AliasTable.from_pmf(self.damage, self.probability)
+
+    def sample(self, size: int | tuple[int, ...] = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
+        """Draw random hits with the cached alias table.
+
+        Parameters
+        ----------
+        size : int | tuple[int, ...], optional
+            The output shape, by default 1.
+        rng : np.random.Generator | int | None, optional
+            A generator or seed for reproducible draws, by default None.
+
+        Returns
+        -------
+        NDArray[np.int_]
+        """
+        return self.alias_table.sample(size, rng)
+
+    def random_hit(self, k: int = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
         """Return a 1D array of random hits.
 
         Parameters
@@ -61,12 +179,15 @@ class Hitsplat:
         k : int, optional
             Attempts made by the attacker, Defaults to 1
 
+        rng : np.random.Generator | int | None, optional
+            A generator or seed, Defaults to None.
+
         Returns
         -------
 
         NDArray[np.int_]
         """
-        return np.random.choice(self.damage, size=(k,), replace=False, p=self.probability)
+        return self.sample(k, rng)
 
     @classmethod
     def basic_constructor(
@@ -94,7 +215,7 @@ class Hitsplat:
         Hitsplat
         """
         damage = np.arange(0, int(max_hit) + 1)
-        probability = np.asarray([accuracy * (1 / (int(max_hit) + 1)) for _ in damage])
+        probability = np.full(damage.shape, accuracy / damage.size)
         probability[0] += 1 - accuracy
 
         if hitpoints_cap is not None:
@@ -106,6 +227,30 @@ class Hitsplat:
 
         return cls(damage, probability)
 
+    @classmethod
+    def basic_batch(
+        cls,
+        max_hit: ArrayLike,
+        accuracy: ArrayLike,
+        hitpoints_cap: ArrayLike | None = None,
+    ) -> "HitsplatBatch":
+        """Many basic hit distributions at once, see HitsplatBatch.
+
+        Parameters
+        ----------
+        max_hit : ArrayLike
+            The maximum damage values.
+        accuracy : ArrayLike
+            The probabilities that each attack will succeed.
+        hitpoints_cap : ArrayLike | None, optional
+            Optionally specify hitpoints caps, by default None.
+
+        Returns
+        -------
+        HitsplatBatch
+        """
+        return HitsplatBatch(max_hit, accuracy, hitpoints_cap)
+
     @classmethod
     def clamp_to_hitpoints_cap(cls, damage: np.ndarray, probability: np.ndarray, hitpoints_cap: int | Level):
         hp_cap = int(hitpoints_cap)
@@ -133,10 +278,194 @@ class Hitsplat:
         return cls(dmg, prb)
 
 
+@dataclass
+class UniformHitsplat:
+    """A parametric hitsplat: miss mass at 0 plus uniform damage on success.
+
+    Successful attacks deal damage uniformly distributed from low to high,
+    optionally clamped to a hitpoints cap. Summary statistics are computed in
+    closed form, the dense damage & probability arrays are only built (and
+    cached) when asked for, so this is a drop-in replacement for Hitsplat.
+
+    Attributes
+    ----------
+
+    high : int
+        The largest damage value of a successful attack.
+
+    accuracy : float
+        The probability an attack will succeed.
+
+    hitpoints_cap : int | None, optional
+        Optionally specify a hitpoints cap, excess damage is aggregated in the
+        largest allowed damage value. Defaults to None.
+
+    low : int, optional
+        The smallest damage value of a successful attack. Defaults to 0.
+    """
+
+    high: int
+    accuracy: float
+    hitpoints_cap: int | None = None
+    low: int = 0
+    min_hit: int = field(init=False)
+    max_hit: int = field(init=False)
+    mean_hit: float = field(init=False)
+    probability_nonzero_damage: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.high = int(self.high)
+        self.low = int(self.low)
+
+        if self.hitpoints_cap is not None:
+            self.hitpoints_cap = int(self.hitpoints_cap)
+
+        if not 0 <= self.low <= self.high or not 0 <= self.accuracy <= 1:
+            raise ValueError(self)
+
+        if self.cap < 0:
+            raise ValueError(self.hitpoints_cap)
+
+        p = self.accuracy
+        n = self.high - self.low + 1
+        low, cap = self.low, self.cap
+
+        self.max_hit = cap if p > 0 else 0
+        self.min_hit = min(low, cap) if p == 1 else 0
+
+        if cap < low:
+            self.mean_hit = p * cap
+        else:
+            self.mean_hit = p * ((low + cap - 1) * (cap - low) / 2 + cap * (self.high - cap + 1)) / n
+
+        nonzero_successes = n - (low == 0)
+        self.probability_nonzero_damage = p * nonzero_successes / n if cap > 0 else 0.0
+
+    @property
+    def cap(self) -> int:
+        """The largest damage value after capping."""
+        return self.high if self.hitpoints_cap is None else min(self.high, self.hitpoints_cap)
+
+    @functools.cached_property
+    def damage(self) -> NDArray[np.int_]:
+        return np.arange(0, self.cap + 1)
+
+    @functools.cached_property
+    def probability(self) -> NDArray[np.float_]:
+        return self.pmf
+
+    @property
+    def pmf(self) -> NDArray[np.float_]:
+        """The dense damage PMF, where pmf[d] is the probability of d damage."""
+        n = self.high - self.low + 1
+        pmf = np.zeros(self.cap + 1)
+        pmf[min(self.low, self.cap) : self.cap] = self.accuracy / n
+        pmf[self.cap] += self.accuracy * (self.high - max(self.low, self.cap) + 1) / n
+        pmf[0] += 1 - self.accuracy
+        return pmf
+
+    @property
+    def variance(self) -> float:
+        """The variance of the hitsplat, in closed form."""
+        n = self.high - self.low + 1
+        low, cap = self.low, self.cap
+
+        def _sum_squares(k: int) -> int:
+            return k * (k + 1) * (2 * k + 1) // 6
+
+        if cap < low:
+            second_moment = cap**2
+        else:
+            second_moment = (_sum_squares(cap - 1) - _sum_squares(low - 1) + cap**2 * (self.high - cap + 1)) / n
+
+        return self.accuracy * second_moment - self.mean_hit**2
+
+    def cdf(self, __damage: int, /) -> float:
+        """The probability of dealing at most the given damage."""
+        if __damage < 0:
+            return 0.0
+
+        if __damage >= self.cap:
+            return 1.0
+
+        n = self.high - self.low + 1
+        successes = max(__damage - self.low + 1, 0)
+        return 1 - self.accuracy + self.accuracy * successes / n
+
+    def quantile(self, q: float) -> int:
+        """The smallest damage d such that P(damage <= d) >= q, in closed form.
+
+        Parameters
+        ----------
+        q : float
+            The quantile, in the interval [0, 1].
+
+        Returns
+        -------
+        int
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(q)
+
+        if q <= self.cdf(0) + HS_TOLERANCE:
+            return 0
+
+        n = self.high - self.low + 1
+        successes = math.ceil((q - (1 - self.accuracy)) / self.accuracy * n - HS_TOLERANCE)
+        return min(max(self.low + successes - 1, 1), self.cap)
+
+    @functools.cached_property
+    def alias_table(self) -> AliasTable:
+        """The cached alias table of the dense representation."""
+        return AliasTable.from_pmf(self.damage, self.probability)
+
+    def sample(self, size: int | tuple[int, ...] = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
+        """Draw random hits directly from the parameters.
+
+        Parameters
+        ----------
+        size : int | tuple[int, ...], optional
+            The output shape, by default 1.
+        rng : np.random.Generator | int | None, optional
+            A generator or seed for reproducible draws, by default None.
+
+        Returns
+        -------
+        NDArray[np.int_]
+        """
+        gen = _generator(rng)
+        success = gen.random(size=size) < self.accuracy
+        damage = np.minimum(gen.integers(self.low, self.high + 1, size=size), self.cap)
+        return np.where(success, damage, 0)
+
+    def random_hit(self, k: int = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
+        """Return a 1D array of random hits.
+
+        Parameters
+        ----------
+
+        k : int, optional
+            Attempts made by the attacker, Defaults to 1
+
+        rng : np.random.Generator | int | None, optional
+            A generator or seed, Defaults to None.
+
+        Returns
+        -------
+
+        NDArray[np.int_]
+        """
+        return self.sample(k, rng)
+
+    def to_hitsplat(self) -> Hitsplat:
+        """Materialize the dense Hitsplat."""
+        return Hitsplat(self.damage, self.probability)
+
+
 @dataclass
 class Damage:
     attack_speed: int
-    hitsplats: list[Hitsplat] = field(repr=False)
+    hitsplats: list[Hitsplat | UniformHitsplat] = field(repr=False)
     min_hit: int = field(init=False)
     max_hit: int = field(init=False)
     mean_hit: float = field(init=False)
@@ -145,15 +474,18 @@ class Damage:
     per_second: float = field(init=False, repr=False)
     per_minute: float = field(init=False, repr=False)
     per_hour: float = field(init=False, repr=False)
+    total_probability: NDArray[np.float_] | None = field(default=None, repr=False)
 
     def __post_init__(self):
         self.min_hit = sum(hs.min_hit for hs in self.hitsplats)
         self.max_hit = sum(hs.max_hit for hs in self.hitsplats)
         self.mean_hit = sum(hs.mean_hit for hs in self.hitsplats)
-        zero_probs = [hs.probability[0] for hs in self.hitsplats]
+        zero_probs = [1 - hs.probability_nonzero_damage for hs in self.hitsplats]
 
         if len(zero_probs) == 0:
             raise ValueError(zero_probs)
+        elif self.total_probability is not None:  # correlated hitsplats, e.g. dragon claws
+            self.probability_nonzero_damage = 1 - float(self.total_probability[0])
         elif len(zero_probs) == 1:
             self.probability_nonzero_damage = 1 - zero_probs[0]
         else:
@@ -168,29 +500,131 @@ class Damage:
     def __iter__(self):
         return iter(self.hitsplats)
 
-    def random_hit(self, k: int = 1) -> NDArray[np.int_]:
-        """Return a 1D array representing a random hit from the Damage object.
+    @functools.cached_property
+    def total_pmf(self) -> NDArray[np.float_]:
+        """The PMF of total damage per attack, summed over all hitsplats.
+
+        Hitsplats are treated as independent and their PMFs are convolved,
+        using FFT convolution once the result is longer than
+        FFT_CONVOLUTION_THRESHOLD. Distributions with correlated hitsplats
+        (dragon claws) provide the exact result via total_probability.
+
+        Returns
+        -------
+        NDArray[np.float_]
+            total_pmf[d] is the probability of dealing d damage in one attack.
+        """
+        if self.total_probability is not None:
+            return self.total_probability
+
+        pmfs = [hs.pmf for hs in self.hitsplats]
+        size = sum(pmf.size for pmf in pmfs) - len(pmfs) + 1
+
+        if len(pmfs) == 1 or size <= FFT_CONVOLUTION_THRESHOLD:
+            return functools.reduce(np.convolve, pmfs)
+
+        n_fft = 1 << (size - 1).bit_length()
+        spectrum = functools.reduce(np.multiply, (np.fft.rfft(pmf, n_fft) for pmf in pmfs))
+        total = np.clip(np.fft.irfft(spectrum, n_fft)[:size], 0, None)
+        return total / total.sum()
+
+    @property
+    def total_cdf(self) -> NDArray[np.float_]:
+        """The CDF of total damage per attack."""
+        return np.cumsum(self.total_pmf)
+
+    @property
+    def variance(self) -> float:
+        """The variance of total damage per attack."""
+        pmf = self.total_pmf
+        damage = np.arange(pmf.size)
+        mean = np.dot(damage, pmf)
+        return np.dot((damage - mean) ** 2, pmf)
+
+    @property
+    def std(self) -> float:
+        """The standard deviation of total damage per attack."""
+        return np.sqrt(self.variance)
+
+    def quantile(self, q: float) -> int:
+        """The smallest total damage per attack d such that P(damage <= d) >= q.
 
         Parameters
         ----------
+        q : float
+            The quantile, in the interval [0, 1].
+
+        Returns
+        -------
+        int
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(q)
+
+        cdf = self.total_cdf
+        return min(int(np.searchsorted(cdf, q - HS_TOLERANCE)), cdf.size - 1)
+
+    @functools.cached_property
+    def alias_table(self) -> AliasTable:
+        """The cached alias table of total damage per attack."""
+        pmf = self.total_pmf
+        return AliasTable.from_pmf(np.arange(pmf.size), pmf)
 
+    def sample(self, k: int = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
+        """Draw the hitsplats of k random attacks.
+
+        Hitsplats are drawn independently, see sample_total for distributions
+        with correlated hitsplats.
+
+        Parameters
+        ----------
         k : int, optional
-            Attack attempts, Defaults to 1.
+            Attack attempts, by default 1.
+        rng : np.random.Generator | int | None, optional
+            A generator or seed for reproducible draws, by default None.
 
         Returns
         -------
+        NDArray[np.int_]
+            An array with shape (k, number of hitsplats).
+        """
+        gen = _generator(rng)
+        return np.stack([hs.sample(k, gen) for hs in self.hitsplats], axis=1)
+
+    def sample_total(self, k: int = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
+        """Draw the total damage of k random attacks from total_pmf.
 
+        Parameters
+        ----------
+        k : int, optional
+            Attack attempts, by default 1.
+        rng : np.random.Generator | int | None, optional
+            A generator or seed for reproducible draws, by default None.
+
+        Returns
+        -------
         NDArray[np.int_]
         """
+        return self.alias_table.sample(k, rng)
+
+    def random_hit(self, k: int = 1, rng: np.random.Generator | int | None = None) -> NDArray[np.int_]:
+        """Return a 1D array representing a random hit from the Damage object.
+
+        Parameters
+        ----------
 
-        n = len(self.hitsplats)
-        hits = np.empty(shape=(k, n), dtype=int)
+        k : int, optional
+            Attack attempts, Defaults to 1.
 
-        for idx, hs in enumerate(self.hitsplats):
-            hits[:, idx] = hs.random_hit(k)
+        rng : np.random.Generator | int | None, optional
+            A generator or seed, Defaults to None.
+
+        Returns
+        -------
 
-        hits: NDArray[np.int_] = hits.reshape(k * n)
-        return hits
+        NDArray[np.int_]
+        """
+        return self.sample(k, rng).ravel()
 
     @classmethod
     def basic_constructor(
@@ -216,7 +650,7 @@ class Damage:
         Returns:
             Damage: A Damage object
         """
-        hs = Hitsplat.basic_constructor(max_hit, accuracy, hitpoints_cap)
+        hs = UniformHitsplat(int(max_hit), accuracy, None if hitpoints_cap is None else int(hitpoints_cap))
         return cls(attack_speed, [hs])
 
     @classmethod
@@ -230,6 +664,248 @@ class Damage:
         hs = Hitsplat.thrall()
         return cls(attack_speed, [hs])
 
+    def kill_time_distribution(self, hitpoints: int | Level, **kwargs) -> "KillTimeDistribution":
+        """Return the exact distribution of attacks & ticks to kill a target.
+
+        Parameters
+        ----------
+        hitpoints : int | Level
+            The target's hitpoints.
+
+        Returns
+        -------
+        KillTimeDistribution
+        """
+        return KillTimeDistribution(self, hitpoints, **kwargs)
+
+
+@dataclass
+class HitsplatBatch:
+    """Many basic hitsplats, built with one vectorized call.
+
+    Each row is equivalent to Hitsplat.basic_constructor(max_hit, accuracy,
+    hitpoints_cap) for the corresponding elements of the (broadcast) inputs.
+    The PMFs are stored in one matrix padded with zeros to the largest capped
+    max hit, alongside per-row summary statistics computed in closed form.
+
+    Attributes
+    ----------
+
+    max_hit : ArrayLike
+        The maximum damage values.
+
+    accuracy : ArrayLike
+        The probabilities that each attack will succeed.
+
+    hitpoints_cap : ArrayLike | None, optional
+        Optionally specify hitpoints caps, excess damage is aggregated in the
+        largest allowed damage value. Defaults to None.
+
+    probability : NDArray[np.float_]
+        probability[i, d] is the chance that hitsplat i deals d damage.
+
+    capped_max_hit : NDArray[np.int_]
+        The largest damage value each hitsplat can deal after capping.
+
+    mean_hit : NDArray[np.float_]
+        The mean of each hitsplat.
+
+    probability_nonzero_damage : NDArray[np.float_]
+        The chance that each hitsplat deals positive damage.
+    """
+
+    max_hit: ArrayLike
+    accuracy: ArrayLike
+    hitpoints_cap: ArrayLike | None = None
+    probability: NDArray[np.float_] = field(init=False, repr=False)
+    capped_max_hit: NDArray[np.int_] = field(init=False, repr=False)
+    mean_hit: NDArray[np.float_] = field(init=False, repr=False)
+    probability_nonzero_damage: NDArray[np.float_] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.hitpoints_cap is None:
+            max_hit, accuracy = np.broadcast_arrays(np.asarray(self.max_hit), np.asarray(self.accuracy))
+            cap = max_hit
+        else:
+            max_hit, accuracy, cap = np.broadcast_arrays(
+                np.asarray(self.max_hit), np.asarray(self.accuracy), np.asarray(self.hitpoints_cap)
+            )
+
+        max_hit = max_hit.ravel().astype(int)
+        accuracy = accuracy.ravel().astype(float)
+        capped = np.minimum(max_hit, cap.ravel().astype(int))
+
+        if max_hit.min(initial=0) < 0 or capped.min(initial=0) < 0:
+            raise ValueError(self.max_hit, self.hitpoints_cap)
+
+        if np.any((accuracy < 0) | (accuracy > 1)):
+            raise ValueError(self.accuracy)
+
+        self.max_hit = max_hit
+        self.accuracy = accuracy
+        self.capped_max_hit = capped
+
+        # uniform mass over 0..capped, excess damage lumped at the cap
+        n = max_hit + 1
+        density = accuracy / n
+        damage = np.arange(capped.max(initial=0) + 1)
+        probability = np.where(damage[None, :] <= capped[:, None], density[:, None], 0.0)
+        rows = np.arange(max_hit.size)
+        probability[rows, capped] += density * (max_hit - capped)
+        probability[:, 0] += 1 - accuracy
+        self.probability = probability
+
+        self.mean_hit = density * (capped * (capped - 1) / 2 + capped * (max_hit - capped + 1))
+        self.probability_nonzero_damage = np.where(capped > 0, density * max_hit, 0.0)
+
+    def __len__(self) -> int:
+        return self.probability.shape[0]
+
+    def __getitem__(self, __key: int, /) -> Hitsplat:
+        size = int(self.capped_max_hit[__key]) + 1
+        return Hitsplat(np.arange(size), self.probability[__key, :size].copy())
+
+    def __iter__(self):
+        return (self[idx] for idx in range(len(self)))
+
+
+###############################################################################
+# kill time distribution                                                      #
+###############################################################################
+
+
+@dataclass
+class KillTimeDistribution:
+    """The exact distribution of attacks (and ticks) required to kill a target.
+
+    Rather than approximating time to kill as hitpoints / mean damage, the
+    distribution of damage dealt so far is propagated attack by attack. Each
+    step convolves the vector of surviving hitpoints states with the per-attack
+    damage PMF and moves any mass at or above the target's hitpoints into the
+    kill probability for that attack, which accounts for overkill & variance.
+
+    Attributes
+    ----------
+
+    damage : Damage
+        The damage distribution of one attack.
+
+    hitpoints : int | Level
+        The hitpoints of the target.
+
+    tolerance : float, optional
+        Propagation stops once the probability that the target is still alive
+        drops below this value, by default KT_TOLERANCE.
+
+    max_attacks : int, optional
+        The maximum number of attacks to propagate before giving up, by default
+        KT_MAX_ATTACKS.
+
+    probability : NDArray[np.float_]
+        probability[i] is the chance that the target dies on attack i + 1.
+
+    mean_attacks : float
+        The expected number of attacks to kill.
+
+    mean_ticks : float
+        The expected number of ticks to kill.
+
+    Raises
+    ------
+    DamageError
+    """
+
+    damage: Damage
+    hitpoints: int | Level
+    tolerance: float = KT_TOLERANCE
+    max_attacks: int = KT_MAX_ATTACKS
+    probability: NDArray[np.float_] = field(init=False, repr=False)
+    mean_attacks: float = field(init=False)
+    mean_ticks: float = field(init=False)
+
+    def __post_init__(self):
+        hp = int(self.hitpoints)
+
+        if hp < 1:
+            raise DamageError(f"{self.hitpoints=} must be positive")
+
+        if self.damage.probability_nonzero_damage <= 0:
+            raise DamageError(f"{self.damage} can never deal damage")
+
+        # per-attack damage pmf, damage at or above hp is lumped at hp
+        pmf = self.damage.total_pmf
+
+        if pmf.size > hp + 1:
+            pmf = np.append(pmf[:hp], pmf[hp:].sum())
+
+        # alive[d] is the probability that d damage has been dealt so far & the target lives
+        alive = np.zeros(hp)
+        alive[0] = 1.0
+        kill_probabilities: list[float] = []
+        remaining = 1.0
+
+        while remaining > self.tolerance:
+            if len(kill_probabilities) >= self.max_attacks:
+                raise DamageError(f"{remaining=} after {self.max_attacks=}")
+
+            propagated = np.convolve(alive, pmf)
+            alive = propagated[:hp]
+            kill = propagated[hp:].sum()
+            kill_probabilities.append(kill)
+            remaining -= kill
+
+        probability = np.asarray(kill_probabilities)
+        self.probability = probability / probability.sum()
+        self.mean_attacks = np.dot(self.attacks, self.probability)
+        self.mean_ticks = self.mean_attacks * self.damage.attack_speed
+
+    @property
+    def attacks(self) -> NDArray[np.int_]:
+        """The number of attacks corresponding to each probability."""
+        return np.arange(1, self.probability.size + 1)
+
+    @property
+    def ticks(self) -> NDArray[np.int_]:
+        """The number of ticks corresponding to each probability."""
+        return self.attacks * self.damage.attack_speed
+
+    @property
+    def cdf(self) -> NDArray[np.float_]:
+        """The probability that the target is dead after each attack."""
+        return np.cumsum(self.probability)
+
+    def attacks_quantile(self, q: float) -> int:
+        """The smallest number of attacks that kill with probability at least q.
+
+        Parameters
+        ----------
+        q : float
+            The quantile, in the interval [0, 1].
+
+        Returns
+        -------
+        int
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(q)
+
+        idx = min(int(np.searchsorted(self.cdf, q - HS_TOLERANCE)), self.probability.size - 1)
+        return int(self.attacks[idx])
+
+    def ticks_quantile(self, q: float) -> int:
+        """The smallest number of ticks that kill with probability at least q.
+
+        Parameters
+        ----------
+        q : float
+            The quantile, in the interval [0, 1].
+
+        Returns
+        -------
+        int
+        """
+        return self.attacks_quantile(q) * self.damage.attack_speed
+
 
 # for clean reference
 ThrallDamage = Damage.thrall()
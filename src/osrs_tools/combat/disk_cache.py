@@ -0,0 +1,435 @@
+"""A persistent, content-addressed cache for damage calculations.
+
+DiskDamageCache is a drop-in replacement for DamageCache that keeps Damage
+objects in a SQLite database, so grids that are re-run with small edits only
+compute the cells that are new or changed. A cell's key is a stable hash of
+its attacker, defender & arguments fingerprints plus a hash of the data files
+the calculation reads and of the osrs_tools source, so editing a CSV or the
+code retires every entry made from it.
+
+The cache is bounded by entries and / or bytes, least recently used entries
+are evicted first. Inspect & prune a cache from the command line with
+`python -m osrs_tools.combat.cache_cli`.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable
+
+from osrs_tools.data import ITEMS_BITTER_BED, MONSTERS_BITTER, MONSTERS_DE0
+from osrs_tools.database import file_digest
+from osrs_tools.exceptions import OsrsException
+
+from .cache import fingerprint
+from .damage import Damage
+
+###############################################################################
+# errors 'n such                                                              #
+###############################################################################
+
+
+class DiskCacheError(OsrsException):
+    pass
+
+
+DEFAULT_DISK_CACHE_BYTES = 2**30
+
+# the CSVs every calculation may read
+DATA_FILES = (ITEMS_BITTER_BED, MONSTERS_BITTER, MONSTERS_DE0)
+
+# the source every calculation may run
+PACKAGE_DIR = Path(__file__).absolute().parents[1]
+
+# the fraction of a limit eviction shrinks to, so it doesn't run on every put
+_LOW_WATER = 0.9
+
+# totals are kept by triggers, so every put checks the limits in constant time
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS cells (
+    key TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cells_accessed ON cells (accessed);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM cells;
+CREATE TRIGGER IF NOT EXISTS cells_insert AFTER INSERT ON cells BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + new.size;
+END;
+CREATE TRIGGER IF NOT EXISTS cells_update AFTER UPDATE OF size ON cells BEGIN
+    UPDATE totals SET bytes = bytes + new.size - old.size;
+END;
+CREATE TRIGGER IF NOT EXISTS cells_delete AFTER DELETE ON cells BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - old.size;
+END;
+COMMIT;
+"""
+
+DiskCacheInfo = namedtuple(
+    "DiskCacheInfo",
+    ["hits", "misses", "evictions", "entries", "bytes", "stale", "max_entries", "max_bytes", "version"],
+)
+
+###############################################################################
+# stable hashes                                                               #
+###############################################################################
+
+
+def stable_hash(obj: Hashable) -> str:
+    """A hex digest of a fingerprint that is stable across processes.
+
+    Fingerprints are nested tuples of primitives, whose repr is canonical &
+    computed in C. Python's hash of strings is salted per process, so the
+    iteration order of sets isn't, and fingerprints with sets are first
+    rewritten with each set sorted by the repr of its members.
+
+    Parameters
+    ----------
+    obj : Hashable
+        A fingerprint, see osrs_tools.combat.fingerprint.
+
+    Returns
+    -------
+    str
+    """
+    text = repr(obj)
+
+    if "frozenset(" in text:
+        text = repr(_canonical(obj))
+
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _canonical(obj: Any) -> Any:
+    if isinstance(obj, tuple):
+        return tuple(_canonical(_o) for _o in obj)
+
+    if isinstance(obj, frozenset):
+        return ("frozenset", tuple(sorted((_canonical(_o) for _o in obj), key=repr)))
+
+    return obj
+
+
+def data_version(paths: Iterable[str | os.PathLike] = DATA_FILES) -> str:
+    """A hex digest of the data files & the osrsbox item database version.
+
+    Files are re-read only when their size or modification time changes.
+    """
+    digest = hashlib.sha256()
+
+    for path in paths:
+        digest.update(file_digest(path).encode())
+
+    try:
+        digest.update(metadata.version("osrsbox").encode())
+    except metadata.PackageNotFoundError:
+        pass
+
+    return digest.hexdigest()
+
+
+def code_version(package_dir: str | os.PathLike = PACKAGE_DIR) -> str:
+    """A hex digest of the package's Python source.
+
+    Files are re-read only when their size or modification time changes.
+    """
+    digest = hashlib.sha256()
+
+    for path in sorted(Path(package_dir).rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(file_digest(path).encode())
+
+    return digest.hexdigest()
+
+
+def cache_version() -> str:
+    """The version of new DiskDamageCache keys, see data_version & code_version."""
+    return hashlib.sha256(f"{data_version()}:{code_version()}".encode()).hexdigest()
+
+
+###############################################################################
+# cache                                                                       #
+###############################################################################
+
+
+class DiskDamageCache:
+    """A size-bounded, persistent LRU cache of Damage keyed on stable hashes.
+
+    Shares the interface of DamageCache, so it can be passed anywhere a
+    DamageCache is accepted, e.g. PvMCalc or bedevere_the_wise. Several
+    processes may share a database; worker processes of bedevere_the_wise
+    share the parent's. Each thread opens its own connection, the hit & miss
+    counts are only exact in single-threaded use.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The SQLite database, created if it doesn't exist.
+
+    max_entries : int | None, optional
+        The maximum number of entries, by default None for no limit.
+
+    max_bytes : int | None, optional
+        The maximum total size of stored values, by default
+        DEFAULT_DISK_CACHE_BYTES. None for no limit.
+
+    version : str | None, optional
+        The version of new keys, by default cache_version(), which changes
+        with the data files & the source code.
+
+    Attributes
+    ----------
+
+    hits : int
+        The number of lookups answered from the cache.
+
+    misses : int
+        The number of lookups that had to be computed.
+
+    evictions : int
+        The number of entries dropped to respect the limits.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        max_entries: int | None = None,
+        max_bytes: int | None = DEFAULT_DISK_CACHE_BYTES,
+        version: str | None = None,
+    ):
+        for limit in (max_entries, max_bytes):
+            if limit is not None and limit < 1:
+                raise ValueError(limit)
+
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version = cache_version() if version is None else version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connections: dict[int, sqlite3.Connection] = {}
+
+    # connection
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The database connection of the calling thread, opened lazily."""
+        if (con := self._connections.get(threading.get_ident())) is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # only this thread uses it, close() may run on another
+            con = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.executescript(_SCHEMA)
+            self._connections[threading.get_ident()] = con
+
+        return con
+
+    def close(self):
+        """Close the connections of every thread."""
+        for con in self._connections.values():
+            con.close()
+
+        self._connections = {}
+
+    def __enter__(self) -> DiskDamageCache:
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # connections don't pickle, each process opens its own
+        state = self.__dict__.copy()
+        state["_connections"] = {}
+        return state
+
+    def __len__(self) -> int:
+        return self._size()[0]
+
+    def __contains__(self, __key: Hashable, /) -> bool:
+        return self.connection.execute("SELECT 1 FROM cells WHERE key = ?", (__key,)).fetchone() is not None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r}, {self.max_entries=}, {self.max_bytes=})"
+
+    # basic methods
+
+    def key(self, attacker: Any, defender: Any, **kwargs) -> str:
+        """Create the cache key of a damage calculation.
+
+        Parameters
+        ----------
+        attacker : Any
+            The attacker, typically a Player.
+        defender : Any
+            The defender, typically a Monster.
+        **kwargs
+            The arguments of the calculation.
+
+        Returns
+        -------
+        str
+        """
+        return stable_hash((self.version, fingerprint(attacker), fingerprint(defender), fingerprint(kwargs)))
+
+    def get(self, key: Hashable) -> Damage | None:
+        """Look up a key, counting the hit or miss."""
+        row = self.connection.execute("SELECT value FROM cells WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.connection.execute("UPDATE cells SET accessed = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key: Hashable, value: Damage):
+        """Store a value, evicting the least recently used entries as needed."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        self.connection.execute(
+            "INSERT INTO cells VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET version = excluded.version, "
+            "value = excluded.value, size = excluded.size, created = excluded.created, accessed = excluded.accessed",
+            (key, self.version, blob, len(blob), now, now),
+        )
+        self._evict_if_full()
+
+    def get_or_compute(self, key: Hashable, func: Callable[[], Damage]) -> Damage:
+        """Return the cached value of key, computing & storing it on a miss."""
+        if (value := self.get(key)) is None:
+            value = func()
+            self.put(key, value)
+
+        return value
+
+    def worker_copy(self) -> DiskDamageCache:
+        """The cache a worker process uses, the same database."""
+        return self
+
+    # maintenance
+
+    def evict(self, max_entries: int | None = None, max_bytes: int | None = None) -> int:
+        """Drop least recently used entries until the limits are respected.
+
+        Parameters
+        ----------
+        max_entries : int | None, optional
+            By default the cache's limit.
+        max_bytes : int | None, optional
+            By default the cache's limit.
+
+        Returns
+        -------
+        int
+            The number of dropped entries.
+        """
+        max_entries = self.max_entries if max_entries is None else max_entries
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries, size = self._size()
+        stale: list[str] = []
+
+        for key, item_size in self.connection.execute("SELECT key, size FROM cells ORDER BY accessed"):
+            if (max_entries is None or entries <= max_entries) and (max_bytes is None or size <= max_bytes):
+                break
+
+            stale.append(key)
+            entries -= 1
+            size -= item_size
+
+        self._delete(stale)
+        self.evictions += len(stale)
+        return len(stale)
+
+    def prune(self, *, stale: bool = False, older_than: float | None = None) -> int:
+        """Drop entries of other data or code versions and / or not used recently.
+
+        Parameters
+        ----------
+        stale : bool, optional
+            Drop entries made from other data or code versions, by default False.
+        older_than : float | None, optional
+            Drop entries not used in this many seconds, by default None.
+
+        Returns
+        -------
+        int
+            The number of dropped entries.
+        """
+        dropped = 0
+
+        if stale:
+            dropped += self.connection.execute("DELETE FROM cells WHERE version != ?", (self.version,)).rowcount
+
+        if older_than is not None:
+            cutoff = time.time() - older_than
+            dropped += self.connection.execute("DELETE FROM cells WHERE accessed < ?", (cutoff,)).rowcount
+
+        return dropped
+
+    def clear(self):
+        """Drop every entry and reset statistics."""
+        self.connection.execute("DELETE FROM cells")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def vacuum(self):
+        """Return the space of dropped entries to the file system."""
+        self.connection.execute("VACUUM")
+
+    def info(self) -> DiskCacheInfo:
+        """Report statistics & the size of the database."""
+        entries, size = self._size()
+        stale = self.connection.execute("SELECT COUNT(*) FROM cells WHERE version != ?", (self.version,)).fetchone()[0]
+        return DiskCacheInfo(
+            self.hits, self.misses, self.evictions, entries, size, stale, self.max_entries, self.max_bytes, self.version
+        )
+
+    # helpers
+
+    def _size(self) -> tuple[int, int]:
+        return self.connection.execute("SELECT entries, bytes FROM totals").fetchone()
+
+    def _evict_if_full(self):
+        """Shrink an over-full cache a little below its limits."""
+        entries, size = self._size()
+
+        if (self.max_entries is not None and entries > self.max_entries) or (
+            self.max_bytes is not None and size > self.max_bytes
+        ):
+            self.evict(
+                None if self.max_entries is None else int(self.max_entries * _LOW_WATER),
+                None if self.max_bytes is None else int(self.max_bytes * _LOW_WATER),
+            )
+
+    def _delete(self, keys: list[str]):
+        batch = 500  # sqlite's variable limit
+
+        for start in range(0, len(keys), batch):
+            chunk = keys[start : start + batch]
+            self.connection.execute(f"DELETE FROM cells WHERE key IN ({', '.join('?' * len(chunk))})", chunk)
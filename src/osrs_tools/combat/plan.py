@@ -0,0 +1,467 @@
+"""Compiled calc plans, modifier resolution split from numeric evaluation.
+
+Resolving PlayerModifiers, aggressive bonuses and defence rolls through
+TrackedValues dominates the cost of PvMCalc.get_damage, yet in a sweep only
+levels or the target's defence change between calls. A CalcPlan resolves a
+(gear, style, prayer, spell, special) configuration once into plain numbers:
+roll multipliers, damage multipliers, bonuses and a distribution kind. The
+plan is then evaluated against arrays of effective levels, defence rolls and
+hitpoints in one vectorized pass, flooring exactly like utils_combat.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum, auto
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from osrs_tools import gear
+from osrs_tools.character import Character
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.data import TICKS_PER_SECOND, MagicDamageTypes, MeleeDamageTypes, RangedDamageTypes
+from osrs_tools.exceptions import OsrsException
+from osrs_tools.gear import Chinchompas, SpecialWeapon, SpecialWeaponError
+from osrs_tools.modifiers import MonsterModifiers, PlayerModifiers
+from osrs_tools.spell import Spell
+from osrs_tools.tracked_value import LevelModifier, StyleBonus
+from osrs_tools.tracked_value.data import MaximumVisibleLevel, MinimumVisibleLevel
+
+from .bolts import BoltEffectKind, bolt_effect
+from .damage import Damage, UniformHitsplat
+from .player import PvMCalc
+from .specials import SPECIAL_ATTACKS
+
+###############################################################################
+# errors 'n such                                                              #
+###############################################################################
+
+
+class CalcPlanError(OsrsException):
+    pass
+
+
+class PlanKind(Enum):
+    STANDARD = auto()  # one uniform hitsplat
+    SCYTHE = auto()  # hitsplats at 100%, 50% & 25% of the max hit
+    FANG = auto()  # one uniform hitsplat on [15%, 85%] of the max hit
+
+
+###############################################################################
+# level transforms                                                            #
+###############################################################################
+
+
+@dataclass(frozen=True)
+class LevelTransform:
+    """Visible level to effective level, see Player.effective_*_level.
+
+    Attributes
+    ----------
+
+    prayer : float | None
+        The prayer level modifier, if any.
+
+    style_bonus : int
+        The invisible style bonus.
+
+    void : float | None
+        The void level modifier, if any.
+    """
+
+    prayer: float | None
+    style_bonus: int
+    void: float | None = None
+
+    def __call__(self, visible_level: ArrayLike) -> NDArray[np.int_]:
+        """Transform (boosted) visible levels into effective levels."""
+        level = np.clip(np.asarray(visible_level), int(MinimumVisibleLevel), int(MaximumVisibleLevel))
+
+        if self.prayer is not None:
+            level = np.floor(level * self.prayer)
+
+        level = level + 8 + self.style_bonus
+
+        if self.void is not None:
+            level = np.floor(level * self.void)
+
+        return level.astype(int)
+
+    @classmethod
+    def from_tracked(cls, prayer: LevelModifier | None, style_bonus: StyleBonus, void: LevelModifier | None):
+        return cls(
+            float(prayer) if isinstance(prayer, LevelModifier) else None,
+            int(style_bonus),
+            None if void is None else float(void),
+        )
+
+
+###############################################################################
+# main classes                                                                #
+###############################################################################
+
+
+@dataclass(frozen=True)
+class CalcPlan:
+    """A damage calculation resolved into plain numbers.
+
+    Build one with CalcPlan.compile, then call evaluate. Called without
+    arguments, evaluate reproduces the compiled configuration; any argument
+    may be an array and all arguments broadcast against each other.
+
+    Attributes
+    ----------
+
+    kind : PlanKind
+        How the damage distribution is built from accuracy & max hit.
+
+    attack_speed : int
+        The attack speed in ticks.
+
+    accuracy_bonus : int
+        The aggressive accuracy bonus of the damage type.
+
+    strength_bonus : int
+        The aggressive strength bonus, unused by magic plans.
+
+    roll_multipliers : tuple[float, ...]
+        Attack roll modifiers, applied in order with flooring between.
+
+    damage_multipliers : tuple[float, ...]
+        Damage modifiers, applied in order with flooring between.
+
+    flat_damage_bonus : int
+        Damage added after all multipliers (chaos gauntlets).
+
+    base_damage : int | None
+        The spell base damage of magic plans, None otherwise.
+
+    double_accuracy_roll : bool
+        True if an attack only fails if two accuracy rolls fail (fang).
+
+    accuracy_level_transform : LevelTransform
+        Visible to effective accuracy level.
+
+    strength_level_transform : LevelTransform | None
+        Visible to effective strength level, None for magic plans.
+
+    accuracy_level : int
+        The compiled effective accuracy level.
+
+    strength_level : int
+        The compiled effective strength level.
+
+    defence_roll : int
+        The compiled target's defence roll.
+
+    hitpoints : int
+        The compiled target's hitpoints.
+    """
+
+    kind: PlanKind
+    attack_speed: int
+    accuracy_bonus: int
+    strength_bonus: int
+    roll_multipliers: tuple[float, ...]
+    damage_multipliers: tuple[float, ...]
+    flat_damage_bonus: int
+    base_damage: int | None
+    double_accuracy_roll: bool
+    accuracy_level_transform: LevelTransform = field(repr=False)
+    strength_level_transform: LevelTransform | None = field(repr=False)
+    accuracy_level: int
+    strength_level: int
+    defence_roll: int
+    hitpoints: int
+
+    # main methods
+
+    def attack_roll(self, accuracy_level: ArrayLike, accuracy_bonus: ArrayLike) -> NDArray[np.int_]:
+        """Vectorized utils_combat.maximum_roll with the plan's modifiers."""
+        roll = np.floor(np.asarray(accuracy_level) * (np.asarray(accuracy_bonus) + 64))
+
+        for mod in self.roll_multipliers:
+            roll = np.floor(roll * mod)
+
+        return roll.astype(int)
+
+    def max_hit(self, strength_level: ArrayLike, strength_bonus: ArrayLike) -> NDArray[np.int_]:
+        """Vectorized base damage & utils_combat.max_hit with the plan's modifiers."""
+        if self.base_damage is not None:
+            max_hit = np.full(np.broadcast(strength_level, strength_bonus).shape, self.base_damage, dtype=float)
+        else:
+            level = np.asarray(strength_level)
+            max_hit = np.floor(0.5 + level * (np.asarray(strength_bonus) + 64) / 640)
+
+        for mod in self.damage_multipliers:
+            max_hit = np.floor(max_hit * mod)
+
+        return max_hit.astype(int) + self.flat_damage_bonus
+
+    def evaluate(
+        self,
+        accuracy_level: ArrayLike | None = None,
+        strength_level: ArrayLike | None = None,
+        defence_roll: ArrayLike | None = None,
+        hitpoints: ArrayLike | None = None,
+        *,
+        accuracy_bonus: ArrayLike | None = None,
+        strength_bonus: ArrayLike | None = None,
+    ) -> "PlanEvaluation":
+        """Evaluate the plan, vectorized over every argument.
+
+        Parameters
+        ----------
+        accuracy_level : ArrayLike | None, optional
+            Effective accuracy levels, by default the compiled level.
+        strength_level : ArrayLike | None, optional
+            Effective strength levels, by default the compiled level.
+        defence_roll : ArrayLike | None, optional
+            Target defence rolls, by default the compiled roll.
+        hitpoints : ArrayLike | None, optional
+            Target hitpoints, by default the compiled hitpoints.
+        accuracy_bonus : ArrayLike | None, optional
+            Override the accuracy bonus, by default None.
+        strength_bonus : ArrayLike | None, optional
+            Override the strength bonus, by default None.
+
+        Returns
+        -------
+        PlanEvaluation
+            Arrays in the broadcast shape of the arguments.
+        """
+        acc_lvl, str_lvl, def_roll, hp, acc_bonus, str_bonus = np.broadcast_arrays(
+            self.accuracy_level if accuracy_level is None else accuracy_level,
+            self.strength_level if strength_level is None else strength_level,
+            self.defence_roll if defence_roll is None else defence_roll,
+            self.hitpoints if hitpoints is None else hitpoints,
+            self.accuracy_bonus if accuracy_bonus is None else accuracy_bonus,
+            self.strength_bonus if strength_bonus is None else strength_bonus,
+        )
+
+        att_roll = self.attack_roll(acc_lvl, acc_bonus)
+        def_roll = def_roll.astype(int)
+
+        # vectorized utils_combat.accuracy
+        accuracy = np.where(
+            att_roll > def_roll,
+            1 - (def_roll + 2) / (2 * (att_roll + 1)),
+            att_roll / (2 * (def_roll + 1)),
+        )
+
+        if self.double_accuracy_roll:
+            accuracy = 1 - (1 - accuracy) ** 2
+
+        max_hit = self.max_hit(str_lvl, str_bonus)
+        return PlanEvaluation(self, att_roll, accuracy, max_hit, hp.astype(int))
+
+    # class methods
+
+    @classmethod
+    def compile(
+        cls,
+        attacker: Player,
+        defender: Monster,
+        special_attack: bool = False,
+        distance: int | None = None,
+        spell: Spell | None = None,
+        additional_targets: int | Character | list[Character] = 0,
+    ):
+        """Resolve a configuration into a plan, see PvMCalc.get_damage.
+
+        Raises
+        ------
+        CalcPlanError
+            If the attack's distribution isn't a function of accuracy & max
+            hit alone (enchanted bolts, unique special attacks, chinchompa
+            AoE). Use PvMCalc for these.
+        """
+        lad = attacker
+        target = defender
+        eqp = lad.eqp
+        wpn = lad.wpn
+
+        if special_attack and not isinstance(wpn, SpecialWeapon):
+            raise SpecialWeaponError(wpn)
+
+        if eqp.crossbow and (effect := bolt_effect(eqp)) is not None and effect.kind is not BoltEffectKind.NONE:
+            raise CalcPlanError(f"{effect.name} bolts can't be compiled")
+
+        if special_attack and wpn in SPECIAL_ATTACKS:
+            raise CalcPlanError(f"{wpn.name} special attack can't be compiled")
+
+        if eqp.weapon in Chinchompas and additional_targets:
+            raise CalcPlanError("chinchompa AoE can't be compiled")
+
+        dt = PvMCalc(lad, target)._get_damage_type(spell)
+        PMods = PlayerModifiers(lad, target, special_attack, distance, spell, additional_targets, dt)
+        accuracy_bonus, strength_bonus = PMods.aggressive_bonus[dt]
+        arms, dms = PMods.get_modifiers()
+        defence_roll_dt = dt
+
+        if special_attack:
+            assert isinstance(wpn, SpecialWeapon)
+            arms = arms + wpn.special_attack_roll_modifiers
+            dms = dms + wpn.special_damage_modifiers
+
+            try:
+                defence_roll_dt = wpn.special_defence_roll
+            except AssertionError:
+                pass
+
+        prayers = lad.prayers
+        style_bonus = lad.style.combat_bonus
+        void_alm, void_slm = _void if (_void := lad._void_modifiers()) is not None else (None, None)
+
+        if dt in MeleeDamageTypes:
+            acc_transform = LevelTransform.from_tracked(prayers.attack, style_bonus.melee_attack, void_alm)
+            str_transform = LevelTransform.from_tracked(prayers.strength, style_bonus.melee_strength, void_slm)
+            accuracy_level = lad.effective_melee_attack_level
+            strength_level = lad.effective_melee_strength_level
+            base_damage = None
+        elif dt in RangedDamageTypes:
+            acc_transform = LevelTransform.from_tracked(prayers.ranged_attack, style_bonus.ranged_attack, void_alm)
+            # sic, see Player.effective_ranged_strength_level
+            str_transform = LevelTransform.from_tracked(prayers.ranged_strength, style_bonus.ranged_attack, void_slm)
+            accuracy_level = lad.effective_ranged_attack_level
+            strength_level = lad.effective_ranged_strength_level
+            base_damage = None
+        elif dt in MagicDamageTypes:
+            acc_transform = LevelTransform.from_tracked(prayers.magic_attack, style_bonus.magic_attack, void_alm)
+            str_transform = None
+            accuracy_level = lad.effective_magic_attack_level
+            strength_level = 0
+            # the spell base damage, magic damage bonus is a damage modifier
+            base_damage = int(lad.max_hit(spell=spell))
+            strength_bonus = 0
+        else:
+            raise ValueError(dt)
+
+        if (_dam := PMods.chaos_gauntlets_damage_bonus()) is not None:
+            flat_damage_bonus = int(_dam)
+        else:
+            flat_damage_bonus = 0
+
+        if special_attack:
+            kind = PlanKind.STANDARD
+        elif wpn == gear.ScytheOfVitur:
+            kind = PlanKind.SCYTHE
+        elif eqp.osmumtens_fang:
+            kind = PlanKind.FANG
+        else:
+            kind = PlanKind.STANDARD
+
+        defence_roll = MonsterModifiers(target, lad, defence_roll_dt).defence_roll()
+
+        return cls(
+            kind=kind,
+            attack_speed=lad.attack_speed(spell),
+            accuracy_bonus=int(accuracy_bonus),
+            strength_bonus=int(strength_bonus),
+            roll_multipliers=tuple(float(_m) for _m in arms),
+            damage_multipliers=tuple(float(_m) for _m in dms),
+            flat_damage_bonus=flat_damage_bonus,
+            base_damage=base_damage,
+            double_accuracy_roll=bool(eqp.osmumtens_fang),
+            accuracy_level_transform=acc_transform,
+            strength_level_transform=str_transform,
+            accuracy_level=int(accuracy_level),
+            strength_level=int(strength_level),
+            defence_roll=int(defence_roll),
+            hitpoints=int(target.hp),
+        )
+
+
+@dataclass(frozen=True)
+class PlanEvaluation:
+    """The numeric results of evaluating a CalcPlan.
+
+    Attributes
+    ----------
+
+    plan : CalcPlan
+        The evaluated plan.
+
+    attack_roll : NDArray[np.int_]
+        The attack rolls.
+
+    accuracy : NDArray[np.float_]
+        The probabilities that an attack succeeds.
+
+    max_hit : NDArray[np.int_]
+        The max hits, before the distribution kind is applied.
+
+    hitpoints : NDArray[np.int_]
+        The target hitpoints each hit is capped at.
+    """
+
+    plan: CalcPlan = field(repr=False)
+    attack_roll: NDArray[np.int_]
+    accuracy: NDArray[np.float_]
+    max_hit: NDArray[np.int_]
+    hitpoints: NDArray[np.int_]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.accuracy.shape
+
+    def _hitsplat_bounds(self) -> list[tuple[NDArray[np.int_], NDArray[np.int_]]]:
+        """(low, high) arrays of each uniform hitsplat, see PvMCalc."""
+        kind = self.plan.kind
+        zeros = np.zeros_like(self.max_hit)
+
+        if kind is PlanKind.SCYTHE:
+            return [(zeros, self.max_hit // 2**_p) for _p in range(3)]
+
+        if kind is PlanKind.FANG:
+            low = np.floor(0.15 * self.max_hit).astype(int)
+            return [(low, self.max_hit - low)]
+
+        return [(zeros, self.max_hit)]
+
+    @property
+    def mean_hit(self) -> NDArray[np.float_]:
+        """The mean damage per attack, in closed form."""
+        mean = np.zeros(self.shape)
+
+        for low, high in self._hitsplat_bounds():
+            mean += _uniform_mean(low, high, self.accuracy, self.hitpoints)
+
+        return mean
+
+    @property
+    def per_tick(self) -> NDArray[np.float_]:
+        return self.mean_hit / self.plan.attack_speed
+
+    @property
+    def per_second(self) -> NDArray[np.float_]:
+        return self.per_tick * TICKS_PER_SECOND
+
+    def damage(self, index: int | tuple[int, ...] = ()) -> Damage:
+        """Build the full Damage distribution of one element."""
+        accuracy = float(self.accuracy[index])
+        hp = int(self.hitpoints[index])
+        hs = [
+            UniformHitsplat(int(high[index]), accuracy, hp, int(low[index]))
+            for low, high in self._hitsplat_bounds()
+        ]
+        return Damage(self.plan.attack_speed, hs)
+
+
+###############################################################################
+# helper functions                                                            #
+###############################################################################
+
+
+def _uniform_mean(
+    low: NDArray[np.int_], high: NDArray[np.int_], accuracy: NDArray[np.float_], cap: NDArray[np.int_]
+) -> NDArray[np.float_]:
+    """Vectorized UniformHitsplat.mean_hit."""
+    cap = np.minimum(high, cap)
+    n = high - low + 1
+    uncapped = ((low + cap - 1) * (cap - low) / 2 + cap * (high - cap + 1)) / n
+    return accuracy * np.where(cap < low, cap, uncapped)
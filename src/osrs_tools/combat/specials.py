@@ -0,0 +1,246 @@
+"""Registry of special attack damage distribution builders.
+
+Each SpecialWeapon with a non-standard special attack maps to a builder that
+takes the resolved numbers of an attack (accuracy, max hit, ...) and returns
+its Damage. Weapons without a builder use the basic uniform distribution.
+Lookup is a single dictionary access on the weapon's name.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+from osrs_tools import gear
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.data import ABYSSAL_BLUDGEON_DMG_MOD
+from osrs_tools.gear import SpecialWeapon, SpecialWeaponError
+from osrs_tools.spell import Spell
+from osrs_tools.tracked_value import DamageModifier
+
+from .damage import Damage, Hitsplat, UniformHitsplat
+
+###############################################################################
+# registry                                                                    #
+###############################################################################
+
+
+@dataclass(frozen=True)
+class SpecialAttackContext:
+    """The resolved numbers of a special attack, handed to builders.
+
+    Attributes
+    ----------
+
+    attacker : Player
+        The attacker.
+
+    target : Monster
+        The target.
+
+    accuracy : float
+        The special attack accuracy.
+
+    max_hit : int
+        The special attack max hit.
+
+    attack_speed : int
+        The attack speed in ticks.
+
+    damage_modifiers : list[DamageModifier]
+        The damage modifiers before special attack modifiers.
+
+    spell : Spell | None
+        The spell being cast, if any.
+    """
+
+    attacker: Player
+    target: Monster
+    accuracy: float
+    max_hit: int
+    attack_speed: int
+    damage_modifiers: list[DamageModifier]
+    spell: Spell | None = None
+
+    @property
+    def hitpoints(self) -> int:
+        return int(self.target.hp)
+
+
+SpecialAttackBuilder = Callable[[SpecialAttackContext], Damage]
+
+
+class SpecialAttackRegistry:
+    """Maps special weapons to damage distribution builders."""
+
+    def __init__(self):
+        self._builders: dict[str, SpecialAttackBuilder] = {}
+
+    def __contains__(self, __weapon: SpecialWeapon, /) -> bool:
+        return __weapon.name in self._builders
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def register(self, *weapons: SpecialWeapon) -> Callable[[SpecialAttackBuilder], SpecialAttackBuilder]:
+        """Decorator that registers a builder for one or more weapons.
+
+        Raises
+        ------
+        SpecialWeaponError
+            If a weapon already has a builder.
+        """
+
+        def decorator(builder: SpecialAttackBuilder) -> SpecialAttackBuilder:
+            for weapon in weapons:
+                if weapon.name in self._builders:
+                    raise SpecialWeaponError(f"{weapon.name} is already registered")
+
+                self._builders[weapon.name] = builder
+
+            return builder
+
+        return decorator
+
+    def get(self, weapon: SpecialWeapon) -> SpecialAttackBuilder:
+        """Return the builder of a weapon, or the basic builder."""
+        return self._builders.get(weapon.name, basic_special)
+
+    def build(self, weapon: SpecialWeapon, context: SpecialAttackContext) -> Damage:
+        """Build the special attack distribution of a weapon."""
+        return self.get(weapon)(context)
+
+
+SPECIAL_ATTACKS = SpecialAttackRegistry()
+
+###############################################################################
+# builders                                                                    #
+###############################################################################
+
+
+def basic_special(ctx: SpecialAttackContext) -> Damage:
+    """A special attack that only modifies accuracy and/or max hit."""
+    return Damage.basic_constructor(ctx.attack_speed, ctx.max_hit, ctx.accuracy, ctx.hitpoints)
+
+
+@SPECIAL_ATTACKS.register(gear.BoneDagger, gear.DorgeshuunCrossbow)
+def _dorgeshuun(ctx: SpecialAttackContext) -> Damage:
+    """Sneak attack, always hits a target that didn't last attack the player."""
+    accuracy = 1.0 if ctx.target.last_attacked_by is not ctx.attacker else ctx.accuracy
+    return Damage.basic_constructor(ctx.attack_speed, ctx.max_hit, accuracy, ctx.hitpoints)
+
+
+@SPECIAL_ATTACKS.register(gear.Seercull)
+def _seercull(ctx: SpecialAttackContext) -> Damage:
+    """Soulshot, always hits."""
+    _pry = ctx.attacker.prayers
+
+    if not (_pry.ranged_attack is None and _pry.ranged_strength is None):
+        raise SpecialWeaponError(f"{gear.Seercull} cannot have active prayers")
+
+    return Damage.basic_constructor(ctx.attack_speed, ctx.max_hit, 1.0, ctx.hitpoints)
+
+
+@SPECIAL_ATTACKS.register(gear.AbyssalBludgeon)
+def _abyssal_bludgeon(ctx: SpecialAttackContext) -> Damage:
+    """Penance, 0.5% more damage per missing prayer point."""
+    lad = ctx.attacker
+    pp_missing = max([0, int(lad._levels.prayer - lad.lvl.prayer)])
+    value = 1 + (ABYSSAL_BLUDGEON_DMG_MOD * pp_missing)
+    comment = "Abyssal bludgeon: Penance"
+
+    full_dms = ctx.damage_modifiers + [DamageModifier(value, comment)]
+    max_hit = lad.max_hit(*full_dms, spell=ctx.spell)
+    return Damage.basic_constructor(ctx.attack_speed, max_hit, ctx.accuracy, ctx.hitpoints)
+
+
+@SPECIAL_ATTACKS.register(gear.DragonDagger)
+def _dragon_dagger(ctx: SpecialAttackContext) -> Damage:
+    """Puncture, two independently rolled hits."""
+    hs = [UniformHitsplat(ctx.max_hit, ctx.accuracy, ctx.hitpoints) for _ in range(2)]
+    return Damage(ctx.attack_speed, hs)
+
+
+@SPECIAL_ATTACKS.register(gear.AbyssalDagger)
+def _abyssal_dagger(ctx: SpecialAttackContext) -> Damage:
+    """Abyssal Puncture, two hits that share one accuracy roll."""
+    landed = UniformHitsplat(ctx.max_hit, 1.0, ctx.hitpoints)
+    hs = [UniformHitsplat(ctx.max_hit, ctx.accuracy, ctx.hitpoints) for _ in range(2)]
+
+    total = ctx.accuracy * np.convolve(landed.pmf, landed.pmf)
+    total[0] += 1 - ctx.accuracy
+    return Damage(ctx.attack_speed, hs, total_probability=total)
+
+
+@SPECIAL_ATTACKS.register(gear.DragonClaws)
+def _dragon_claws(ctx: SpecialAttackContext) -> Damage:
+    """Slice and Dice, four hits whose damage depends on the first success.
+
+    Each scenario is the first successful hit: A (4-2-1-1), B (0-4-2-2),
+    C (0-0-3-3), D (0-0-0-5) or E (all miss, 0-0-1-1 half the time). Hits are
+    built as arrays of equally likely outcomes per scenario, so the marginal
+    hitsplats and the exact (correlated) total are single bincount passes.
+    """
+    acc = ctx.accuracy
+    mh = int(ctx.max_hit)
+    hp = ctx.hitpoints
+
+    if mh < 1:
+        return basic_special(ctx)
+
+    def _range(lo: float, hi: float) -> np.ndarray:
+        return np.arange(math.floor(lo), math.floor(hi) + 1)
+
+    # scenario A: first attack is successful (4-2-1-1)
+    a1 = _range(mh / 2, mh - 1)
+    a2 = a1 // 2
+    a3 = a2 // 2
+    a4 = a3
+
+    # scenario B: second attack is successful (0-4-2-2)
+    b2 = _range(mh * 3 / 8, mh * 7 / 8)
+    b3 = b2 // 2
+    zeros_b = np.zeros_like(b2)
+
+    # scenario C: third attack is successful (0-0-3-3)
+    c3 = _range(mh / 4, mh * 3 / 4)
+    zeros_c = np.zeros_like(c3)
+
+    # scenario D: fourth attack is successful (0-0-0-5)
+    d4 = _range(mh / 4, mh * 5 / 4)
+    zeros_d = np.zeros_like(d4)
+
+    # scenario E: the big buh, 0-0-0-0 or 0-0-1-1 with equal chance
+    e34 = np.asarray([0, 1])
+    zeros_e = np.zeros_like(e34)
+
+    hits = np.stack(
+        [
+            np.concatenate([a1, zeros_b, zeros_c, zeros_d, zeros_e]),
+            np.concatenate([a2, b2, zeros_c, zeros_d, zeros_e]),
+            np.concatenate([a3, b3, c3, zeros_d, e34]),
+            np.concatenate([a4, b3, c3, d4, e34]),
+        ]
+    )
+    hits = np.minimum(hits, hp)
+
+    scenario_probabilities = [acc, acc * (1 - acc), acc * (1 - acc) ** 2, acc * (1 - acc) ** 3, (1 - acc) ** 4]
+    outcomes = [a1, b2, c3, d4, e34]
+    weights = np.concatenate(
+        [np.full(_o.size, _p / _o.size) for _o, _p in zip(outcomes, scenario_probabilities)]
+    )
+
+    hs = []
+
+    for row in hits:
+        pmf = np.bincount(row, weights=weights)
+        hs.append(Hitsplat(np.arange(pmf.size), pmf))
+
+    total = np.bincount(hits.sum(axis=0), weights=weights)
+    return Damage(ctx.attack_speed, hs, total_probability=total)
@@ -13,6 +13,7 @@ from __future__ import annotations
 from collections import namedtuple
 from enum import Enum, auto, unique
 from pathlib import Path
+from typing import Any, Callable
 
 from osrsbox import items_api, monsters_api, prayers_api
 
@@ -24,6 +25,7 @@ _RESOURCES_DIRNAME = "resources"
 _MONSTERS_DE0_FNAME = "cox_base_stats.csv"
 _ITEMS_BB_FNAME = "bitterkoekje_items_bedevere_modified.csv"
 _MONSTERS_BITTER_FNAME = "bitterkoekje_npcs.csv"
+_COMPILED_DIRNAME = "compiled"
 
 PROJECT_DIR = Path(__file__).absolute().parents[2]
 
@@ -32,14 +34,36 @@ MONSTERS_DE0 = RESOURCES_DIR.joinpath(_MONSTERS_DE0_FNAME)
 ITEMS_BITTER_BED = RESOURCES_DIR.joinpath(_ITEMS_BB_FNAME)
 MONSTERS_BITTER = RESOURCES_DIR.joinpath(_MONSTERS_BITTER_FNAME)
 
+# see osrs_tools.database
+COMPILED_DIR = RESOURCES_DIR.joinpath(_COMPILED_DIRNAME)
+
 ###############################################################################
 # enums 'n' such                                                              #
 ###############################################################################
 
-# osrsbox-db load
-ITEMS = items_api.load()
-PRAYERS = prayers_api.load()
-MONSTERS = monsters_api.load()
+# osrsbox-db load, lazily. Parsing the item & monster json takes seconds, so
+# ITEMS, PRAYERS & MONSTERS are loaded on first access, see __getattr__.
+_OSRSBOX_LOADERS: dict[str, Callable[[], Any]] = {
+    "ITEMS": items_api.load,
+    "PRAYERS": prayers_api.load,
+    "MONSTERS": monsters_api.load,
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        loader = _OSRSBOX_LOADERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    # cache as a module global, later lookups don't reach __getattr__
+    value = globals()[name] = loader()
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_OSRSBOX_LOADERS])
+
 
 # misc ########################################################################
 
@@ -137,6 +161,13 @@ SPECIAL_ENERGY_DAMAGE = 10
 
 BOLT_PROC = "bolt proc"
 
+OPAL_BOLTS_PROC = 0.05
+OPAL_BOLTS_RANGED_RATIO = 0.10
+
+PEARL_BOLTS_PROC = 0.06
+PEARL_BOLTS_RANGED_RATIO = 1 / 20
+PEARL_BOLTS_FIERY_RANGED_RATIO = 1 / 15
+
 DIAMOND_BOLTS_PROC = 0.10
 DIAMOND_BOLTS_DMG = 1.15
 
@@ -144,6 +175,16 @@ RUBY_BOLTS_PROC = 0.06
 RUBY_BOLTS_HP_CAP = 500
 RUBY_BOLTS_HP_RATIO = 0.20
 
+DRAGONSTONE_BOLTS_PROC = 0.06
+DRAGONSTONE_BOLTS_RANGED_RATIO = 0.20
+
+ONYX_BOLTS_PROC = 0.11
+ONYX_BOLTS_DMG = 1.20
+
+KANDARIN_HARD_DIARY_BOLT_PROC_BOOST = 1.10
+ARMADYL_CROSSBOW_SPECIAL_BOLT_PROC_BOOST = 2
+ZARYTE_CROSSBOW_BOLT_EFFECT_BOOST = 1.10
+
 # damage types ################################################################
 
 
@@ -426,6 +467,8 @@ class DataMode(Enum):
     SECONDS_TO_KILL = DATAMODE_TYPE("seconds to kill", float, None)
     MINUTES_TO_KILL = DATAMODE_TYPE("minutes to kill", float, None)
     HOURS_TO_KILL = DATAMODE_TYPE("hours to kill", float, None)
+    MEDIAN_TICKS_TO_KILL = DATAMODE_TYPE("median ticks to kill", float, None)
+    P90_TICKS_TO_KILL = DATAMODE_TYPE("90th percentile ticks to kill", float, None)
     DAMAGE_PER_TICK = DPT
     DAMAGE_PER_SECOND = DPS
     DAMAGE_PER_MINUTE = DPM
@@ -438,6 +481,8 @@ class DataMode(Enum):
     STK = SECONDS_TO_KILL
     MTK = MINUTES_TO_KILL
     HTK = HOURS_TO_KILL
+    TTK_P50 = MEDIAN_TICKS_TO_KILL
+    TTK_P90 = P90_TICKS_TO_KILL
 
 
 @unique
@@ -0,0 +1,399 @@
+"""Compiled, memory-mapped copies of the resource CSVs.
+
+Parsing the resource CSVs with pandas and cleaning them column by column
+costs every process the same work on every start. compile_tables writes the
+cleaned tables once into a versioned binary format, which load_table maps
+into memory and turns back into the same DataFrames without parsing:
+
+    <directory>/manifest.json       format, per-table sources & columns
+    <directory>/<table>.npy         a structured array, one field per column
+    <directory>/<table>.strings.npy the table's unique strings
+
+String columns are stored as int32 codes into the table's string table.
+Object columns that mix strings & ints, like the npc "exp bonus" column,
+keep their ints in a second field. The manifest records the size, mtime &
+sha256 of each source CSV; a table whose source changed is stale and
+load_table returns None, so callers fall back to the CSVs. Compile with
+`python -m osrs_tools.database compile`.
+
+load_table builds a DataFrame, which copies every column into memory owned
+by the process. osrs_tools.utils loads its tables this way, so every process
+still holds its own copy of GEAR_DF, NPC_DF & COX_DF; compiling only saves
+the parsing & cleanup. load_columns returns numeric columns as read-only
+views of the mapped file, which processes share through the OS page cache,
+for callers that don't need a DataFrame. Nothing in the package uses it yet.
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from osrs_tools.data import COMPILED_DIR
+from osrs_tools.exceptions import OsrsException
+
+###############################################################################
+# errors 'n such                                                              #
+###############################################################################
+
+
+class DatabaseError(OsrsException):
+    pass
+
+
+# bump when the layout of the compiled files changes
+FORMAT_VERSION = 1
+
+MANIFEST_FNAME = "manifest.json"
+
+_INDEX_FIELD = "index"
+
+###############################################################################
+# source digests                                                              #
+###############################################################################
+
+
+def file_digest(path: str | os.PathLike) -> str:
+    """The sha256 of a file, re-read only when its size or mtime changes."""
+    stat = os.stat(path)
+    return _file_digest(os.fspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.cache
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(2**16), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def _source_record(source: Path) -> dict[str, Any]:
+    stat = os.stat(source)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_digest(source)}
+
+
+def _is_fresh(record: dict[str, Any], source: Path) -> bool:
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        return False
+
+    if (stat.st_size, stat.st_mtime_ns) == (record["size"], record["mtime_ns"]):
+        return True
+
+    # a fresh checkout touches mtimes without changing contents
+    return stat.st_size == record["size"] and file_digest(source) == record["sha256"]
+
+
+###############################################################################
+# encoding                                                                    #
+###############################################################################
+
+
+def _encode(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, list[dict[str, Any]]]:
+    """Encode a DataFrame as a structured array, a string table & column specs."""
+    strings = sorted({_v for _, _s in df.items() if _s.dtype == object for _v in _s.values if isinstance(_v, str)})
+    codes = {_s: _i for _i, _s in enumerate(strings)}
+
+    fields: list[tuple[str, np.ndarray]] = [(_INDEX_FIELD, df.index.to_numpy(dtype=np.int64))]
+    columns: list[dict[str, Any]] = []
+
+    for position, (name, series) in enumerate(df.items()):
+        values = series.to_numpy()
+        field = f"c{position}"
+
+        if values.dtype != object:
+            fields.append((field, values))
+            columns.append({"name": name, "kind": "native", "field": field})
+            continue
+
+        is_str = np.fromiter((isinstance(_v, str) for _v in values), dtype=bool, count=len(values))
+        fields.append((field, np.array([codes[_v] if _s else -1 for _v, _s in zip(values, is_str)], dtype=np.int32)))
+
+        if is_str.all():
+            columns.append({"name": name, "kind": "str", "field": field})
+            continue
+
+        others = values[~is_str]
+
+        if not all(type(_v) is int for _v in others):
+            raise DatabaseError(f"{name!r} mixes strings with {set(type(_v).__name__ for _v in others)}")
+
+        ints = np.array([0 if _s else _v for _v, _s in zip(values, is_str)], dtype=np.int64)
+        fields.append((f"{field}i", ints))
+        columns.append({"name": name, "kind": "mixed", "field": field})
+
+    array = np.empty(len(df), dtype=[(_f, _a.dtype) for _f, _a in fields])
+
+    for field, values in fields:
+        array[field] = values
+
+    return array, np.array(strings, dtype=str), columns
+
+
+def _decode(array: np.ndarray, strings: np.ndarray, columns: list[dict[str, Any]]) -> pd.DataFrame:
+    string_table = np.array(strings.tolist() + [None], dtype=object)  # code -1 is None
+    data: dict[str, Any] = {}
+
+    for column in columns:
+        kind, field = column["kind"], column["field"]
+
+        if kind == "native":
+            data[column["name"]] = array[field]
+        elif kind == "str":
+            data[column["name"]] = string_table[array[field]]
+        elif kind == "mixed":
+            values = string_table[array[field]]
+            (others,) = np.nonzero(array[field] < 0)
+
+            for row, value in zip(others, array[f"{field}i"][others].tolist()):
+                values[row] = value
+
+            data[column["name"]] = values
+        else:
+            raise DatabaseError(kind)
+
+    return pd.DataFrame(data, index=pd.Index(array[_INDEX_FIELD]), columns=[_c["name"] for _c in columns])
+
+
+###############################################################################
+# main functions                                                              #
+###############################################################################
+
+
+def compile_tables(
+    tables: dict[str, tuple[pd.DataFrame, Path]],
+    directory: str | os.PathLike = COMPILED_DIR,
+    version: str = "",
+) -> Path:
+    """Write DataFrames & a manifest to a directory of compiled tables.
+
+    Parameters
+    ----------
+    tables : dict[str, tuple[pd.DataFrame, Path]]
+        Each table's cleaned DataFrame & the CSV it was loaded from.
+
+    directory : str | os.PathLike, optional
+        The output directory, by default COMPILED_DIR.
+
+    version : str, optional
+        The version of the code that cleans the CSVs, by default "". Tables
+        compiled by another version are stale.
+
+    Returns
+    -------
+    Path
+        The manifest.
+
+    Raises
+    ------
+    DatabaseError
+        If a column can't be encoded.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest: dict[str, Any] = {"format": FORMAT_VERSION, "version": version, "tables": {}}
+
+    for name, (df, source) in tables.items():
+        array, strings, columns = _encode(df)
+        np.save(directory.joinpath(f"{name}.npy"), array, allow_pickle=False)
+        np.save(directory.joinpath(f"{name}.strings.npy"), strings, allow_pickle=False)
+        manifest["tables"][name] = {
+            "source": Path(source).name,
+            "source_record": _source_record(Path(source)),
+            "rows": len(df),
+            "columns": columns,
+        }
+
+    path = directory.joinpath(MANIFEST_FNAME)
+    path.write_text(json.dumps(manifest, indent=2))
+    return path
+
+
+def load_table(
+    name: str,
+    source: str | os.PathLike,
+    directory: str | os.PathLike = COMPILED_DIR,
+    version: str = "",
+) -> pd.DataFrame | None:
+    """Load a compiled table as a DataFrame.
+
+    The file is memory-mapped, but the DataFrame copies its columns, see
+    load_columns for views that share memory between processes.
+
+    Parameters
+    ----------
+    name : str
+        The table.
+
+    source : str | os.PathLike
+        The CSV the table was compiled from.
+
+    directory : str | os.PathLike, optional
+        The directory of compiled tables, by default COMPILED_DIR.
+
+    version : str, optional
+        The version of the code that cleans the CSVs, by default "".
+
+    Returns
+    -------
+    pd.DataFrame | None
+        The table, or None if it is missing, stale or of another format.
+    """
+    if (table := _open_table(name, source, Path(directory), version)) is None:
+        return None
+
+    array, entry = table
+
+    try:
+        strings = np.load(Path(directory).joinpath(f"{name}.strings.npy"), mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+
+    return _decode(array, strings, entry["columns"])
+
+
+def load_columns(
+    name: str,
+    source: str | os.PathLike,
+    directory: str | os.PathLike = COMPILED_DIR,
+    version: str = "",
+    columns: Sequence[str] | None = None,
+) -> dict[str, np.ndarray] | None:
+    """Load numeric columns of a compiled table without copying them.
+
+    Each column is a read-only view of the memory-mapped file, pages are
+    read on first access and shared with every process mapping the table.
+
+    Parameters
+    ----------
+    name : str
+        The table.
+
+    source : str | os.PathLike
+        The CSV the table was compiled from.
+
+    directory : str | os.PathLike, optional
+        The directory of compiled tables, by default COMPILED_DIR.
+
+    version : str, optional
+        The version of the code that cleans the CSVs, by default "".
+
+    columns : Sequence[str] | None, optional
+        The columns to load, by default every numeric column.
+
+    Returns
+    -------
+    dict[str, np.ndarray] | None
+        The columns by name, plus the row labels under "index", or None if
+        the table is missing, stale or of another format.
+
+    Raises
+    ------
+    DatabaseError
+        If a requested column isn't numeric or doesn't exist.
+    """
+    if (table := _open_table(name, source, Path(directory), version)) is None:
+        return None
+
+    array, entry = table
+    specs = {_c["name"]: _c for _c in entry["columns"]}
+    names = [_n for _n, _c in specs.items() if _c["kind"] == "native"] if columns is None else columns
+    views: dict[str, np.ndarray] = {_INDEX_FIELD: array[_INDEX_FIELD]}
+
+    for column in names:
+        if column not in specs or specs[column]["kind"] != "native":
+            raise DatabaseError(f"{name}[{column!r}] isn't a numeric column")
+
+        views[column] = array[specs[column]["field"]]
+
+    return views
+
+
+def _open_table(name: str, source: str | os.PathLike, directory: Path, version: str):
+    """Map a fresh compiled table, returning its array & manifest entry, None otherwise."""
+    manifest = _read_manifest(directory)
+
+    if manifest is None or manifest.get("format") != FORMAT_VERSION or manifest.get("version") != version:
+        return None
+
+    try:
+        entry = manifest["tables"][name]
+    except KeyError:
+        return None
+
+    if not _is_fresh(entry["source_record"], Path(source)):
+        return None
+
+    try:
+        array = np.load(directory.joinpath(f"{name}.npy"), mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+
+    if len(array) != entry["rows"]:
+        return None
+
+    return array, entry
+
+
+def _read_manifest(directory: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(directory.joinpath(MANIFEST_FNAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+###############################################################################
+# command line                                                                #
+###############################################################################
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m osrs_tools.database", description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for command, help in (("compile", "compile the resource CSVs"), ("check", "report stale tables")):
+        sub = commands.add_parser(command, help=help)
+        sub.add_argument("--directory", default=COMPILED_DIR, type=Path)
+
+    args = parser.parse_args(argv)
+
+    # import here, osrs_tools.utils loads its tables at import
+    from osrs_tools import utils
+
+    if args.command == "compile":
+        print(utils.compile_tables(args.directory))
+        return 0
+
+    stale = [
+        _n for _n, (_s, _) in utils.TABLES.items() if load_table(_n, _s, args.directory, utils.TABLES_VERSION) is None
+    ]
+
+    for name in stale:
+        print(f"{name}: stale")
+
+    if not stale:
+        print("up to date")
+
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,8 +9,24 @@ worst offender). Now, it looks like this.
 ###############################################################################
 """
 
-from .common_gear import *
+from typing import Any
+
+from . import common_gear
+from .columns import GearColumns
 from .equipment import Equipment
 from .gear import Gear
+from .registry import GearRegistry
 from .special_weapon import SpecialWeapon, SpecialWeaponError
 from .weapon import Weapon
+
+
+def __getattr__(name: str) -> Any:
+    # common gear is built on first access, see common_gear
+    if name not in common_gear.COMMON_GEAR:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(common_gear.COMMON_GEAR, name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *common_gear.__all__])
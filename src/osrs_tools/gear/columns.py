@@ -0,0 +1,312 @@
+"""A columnar view of the gear database for vectorized item queries.
+
+GearColumns keeps every item's bonuses, slot, attack speed, weapon type &
+two-handedness in NumPy arrays, one row per item. Queries like "every head
+slot item ranked by crush attack + melee strength" are a few array
+operations, no Gear objects are built, and the arrays pickle cheaply to
+worker processes. Build a Gear from a row with GearColumns.gear.
+
+Stat columns are named like the columns of utils.GEAR_DF, e.g.
+"crush attack", "melee strength", "magic defence", "prayer".
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from functools import cache
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from osrs_tools.data import DT, Slots
+from osrs_tools.exceptions import OsrsException
+
+from .gear import Gear
+from .weapon import Weapon
+
+###############################################################################
+# errors 'n such                                                              #
+###############################################################################
+
+
+class GearColumnsError(OsrsException):
+    pass
+
+
+# slot codes index SLOTS, -1 for rows without a slot
+SLOTS: tuple[Slots, ...] = tuple(Slots)
+
+# (column, AggressiveStats attribute), magic damage is a fraction
+AGGRESSIVE_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("stab attack", "stab"),
+    ("slash attack", "slash"),
+    ("crush attack", "crush"),
+    ("magic attack", "magic_attack"),
+    ("ranged attack", "ranged_attack"),
+    ("melee strength", "melee_strength"),
+    ("ranged strength", "ranged_strength"),
+    ("magic damage", "magic_strength"),
+)
+
+# (column, DefensiveStats attribute)
+DEFENSIVE_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("stab defence", "stab"),
+    ("slash defence", "slash"),
+    ("crush defence", "crush"),
+    ("magic defence", "magic"),
+    ("ranged defence", "ranged"),
+)
+
+# the accuracy & strength bonus of each damage type, magic strength is a modifier
+BONUS_COLUMNS: dict[DT, tuple[str, str | None]] = {
+    DT.STAB: ("stab attack", "melee strength"),
+    DT.SLASH: ("slash attack", "melee strength"),
+    DT.CRUSH: ("crush attack", "melee strength"),
+    DT.MAGIC: ("magic attack", None),
+    DT.RANGED: ("ranged attack", "ranged strength"),
+}
+
+_AGGRESSIVE_INDEX = {_c: _i for _i, (_c, _) in enumerate(AGGRESSIVE_COLUMNS)}
+_DEFENSIVE_INDEX = {_c: _i for _i, (_c, _) in enumerate(DEFENSIVE_COLUMNS)}
+_DEFENSIVE_DT_INDEX = {
+    DT.STAB: 0,
+    DT.SLASH: 1,
+    DT.CRUSH: 2,
+    DT.MAGIC: 3,
+    DT.RANGED: 4,
+}
+
+###############################################################################
+# main class                                                                  #
+###############################################################################
+
+
+@dataclass(frozen=True, eq=False)
+class GearColumns:
+    """Item stats as arrays, one row per item.
+
+    Attributes
+    ----------
+
+    ids : np.ndarray
+        (items,) int, the GEAR_DF row label of each item, or its position
+        in the iterable for GearColumns.from_gear.
+
+    names : np.ndarray
+        (items,) object, the item names.
+
+    aggressive : np.ndarray
+        (items, 8) float, see AGGRESSIVE_COLUMNS.
+
+    defensive : np.ndarray
+        (items, 5) int, see DEFENSIVE_COLUMNS.
+
+    prayer : np.ndarray
+        (items,) int, the prayer bonus.
+
+    slot : np.ndarray
+        (items,) int8, an index into SLOTS.
+
+    attack_speed : np.ndarray
+        (items,) int, 0 for items that aren't weapons.
+
+    weapon_type : np.ndarray
+        (items,) object, e.g. "whips", "" for items that aren't weapons.
+
+    two_handed : np.ndarray
+        (items,) bool.
+    """
+
+    ids: np.ndarray
+    names: np.ndarray
+    aggressive: np.ndarray
+    defensive: np.ndarray
+    prayer: np.ndarray
+    slot: np.ndarray
+    attack_speed: np.ndarray
+    weapon_type: np.ndarray
+    two_handed: np.ndarray
+
+    # dunder methods
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, rows: slice | np.ndarray | list[int]) -> GearColumns:
+        """The items of a slice, boolean mask or index array."""
+        return GearColumns(**{_f.name: getattr(self, _f.name)[rows] for _f in fields(self)})
+
+    # columns
+
+    def stat(self, column: str) -> np.ndarray:
+        """A stat column by name, e.g. "crush attack" or "prayer"."""
+        if column in _AGGRESSIVE_INDEX:
+            return self.aggressive[:, _AGGRESSIVE_INDEX[column]]
+
+        if column in _DEFENSIVE_INDEX:
+            return self.defensive[:, _DEFENSIVE_INDEX[column]]
+
+        if column == "prayer":
+            return self.prayer
+
+        if column == "attack speed":
+            return self.attack_speed
+
+        raise GearColumnsError(column)
+
+    def aggressive_bonus(self, dt: DT) -> np.ndarray:
+        """An (items, 2) int matrix of accuracy & strength bonus for a damage type.
+
+        The strength bonus of magic is 0, magic damage is a modifier.
+        """
+        acc_col, str_col = BONUS_COLUMNS[dt]
+        out = np.zeros((len(self), 2), dtype=int)
+        out[:, 0] = self.stat(acc_col)
+
+        if str_col is not None:
+            out[:, 1] = self.stat(str_col)
+
+        return out
+
+    def defensive_bonus(self, *dts: DT) -> np.ndarray:
+        """The (items,) sum of the defence bonuses of damage types."""
+        return self.defensive[:, [_DEFENSIVE_DT_INDEX[_dt] for _dt in dts]].sum(axis=1)
+
+    # queries
+
+    def select(
+        self,
+        slot: Slots | None = None,
+        *,
+        two_handed: bool | None = None,
+        weapon_type: str | None = None,
+        mask: np.ndarray | None = None,
+    ) -> GearColumns:
+        """The items matching every given condition."""
+        keep = np.ones(len(self), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+
+        if slot is not None:
+            keep = keep & (self.slot == SLOTS.index(slot))
+
+        if two_handed is not None:
+            keep = keep & (self.two_handed == two_handed)
+
+        if weapon_type is not None:
+            keep = keep & (self.weapon_type == weapon_type)
+
+        return self[keep]
+
+    def score(self, weights: dict[str, float]) -> np.ndarray:
+        """The (items,) weighted sum of stat columns.
+
+        Parameters
+        ----------
+        weights : dict[str, float]
+            Stat columns & weights, e.g. {"crush attack": 1, "melee strength": 1}.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        total = np.zeros(len(self), dtype=float)
+
+        for column, weight in weights.items():
+            total += weight * self.stat(column)
+
+        return total
+
+    def top_k(self, weights: dict[str, float], k: int = 1) -> GearColumns:
+        """The k items of highest score, best first, ties in row order."""
+        order = np.argsort(-self.score(weights), kind="stable")
+        return self[order[:k]]
+
+    def top_k_per_slot(self, weights: dict[str, float], k: int = 1) -> dict[Slots, GearColumns]:
+        """The k items of highest score in each slot with items."""
+        return {
+            _s: self.select(_s).top_k(weights, k) for _i, _s in enumerate(SLOTS) if np.any(self.slot == _i)
+        }
+
+    def slots(self) -> list[Slots]:
+        return [SLOTS[_c] for _c in self.slot]
+
+    def gear(self, row: int) -> Gear:
+        """Build the Gear of a row, the common_gear object if one exists."""
+        from . import common_gear  # common_gear builds items lazily
+
+        name = str(self.names[row])
+
+        if isinstance(defined := common_gear.COMMON_GEAR.by_source_name(name), Gear):
+            return defined
+
+        return Weapon.from_bb(name) if SLOTS[self.slot[row]] is Slots.WEAPON else Gear.from_bb(name)
+
+    # class methods
+
+    @classmethod
+    def from_dataframe(cls, gear_df: pd.DataFrame | None = None) -> GearColumns:
+        """The rows of a bitterkoekje-style table with a gear slot.
+
+        Parameters
+        ----------
+        gear_df : pd.DataFrame | None, optional
+            By default utils.GEAR_DF.
+
+        Returns
+        -------
+        GearColumns
+        """
+        if gear_df is None:
+            return gear_columns()
+
+        slot_codes = {_s.value: _i for _i, _s in enumerate(SLOTS)}
+        slot = gear_df["slot"].map(slot_codes).fillna(-1).to_numpy(dtype=np.int8)
+        df = gear_df.loc[slot >= 0]
+        slot = slot[slot >= 0]
+        is_weapon = slot == SLOTS.index(Slots.WEAPON)
+
+        return cls(
+            ids=df.index.to_numpy(dtype=np.int64),
+            names=df["name"].to_numpy(dtype=object),
+            aggressive=df[[_c for _c, _ in AGGRESSIVE_COLUMNS]].to_numpy(dtype=float),
+            defensive=df[[_c for _c, _ in DEFENSIVE_COLUMNS]].to_numpy(dtype=np.int64),
+            prayer=df["prayer"].to_numpy(dtype=np.int64),
+            slot=slot,
+            attack_speed=np.where(is_weapon, df["attack speed"].to_numpy(dtype=np.int64), 0),
+            weapon_type=np.where(is_weapon, df["weapon type"].to_numpy(dtype=object), ""),
+            two_handed=is_weapon & df["two handed"].to_numpy(dtype=bool),
+        )
+
+    @classmethod
+    def from_gear(cls, gear: Iterable[Gear]) -> GearColumns:
+        """The columns of Gear objects, e.g. a pool of candidate items."""
+        gear = list(gear)
+        weapons = [_g if isinstance(_g, Weapon) else None for _g in gear]
+
+        return cls(
+            ids=np.arange(len(gear), dtype=np.int64),
+            names=np.array([_g.name for _g in gear], dtype=object),
+            aggressive=np.array(
+                [[getattr(_g.aggressive_bonus, _a).value for _, _a in AGGRESSIVE_COLUMNS] for _g in gear], dtype=float
+            ).reshape(-1, len(AGGRESSIVE_COLUMNS)),
+            defensive=np.array(
+                [[getattr(_g.defensive_bonus, _a).value for _, _a in DEFENSIVE_COLUMNS] for _g in gear], dtype=np.int64
+            ).reshape(-1, len(DEFENSIVE_COLUMNS)),
+            prayer=np.array([_g.prayer_bonus for _g in gear], dtype=np.int64),
+            slot=np.array([SLOTS.index(_g.slot) for _g in gear], dtype=np.int8),
+            attack_speed=np.array([0 if _w is None else _w.attack_speed for _w in weapons], dtype=np.int64),
+            weapon_type=np.array(["" if _w is None else _w.styles.name for _w in weapons], dtype=object),
+            two_handed=np.array([_w is not None and _w.two_handed for _w in weapons], dtype=bool),
+        )
+
+
+@cache
+def gear_columns() -> GearColumns:
+    """The columns of every item in utils.GEAR_DF with a gear slot."""
+    from osrs_tools.utils import GEAR_DF
+
+    return GearColumns.from_dataframe(GEAR_DF)
@@ -1,377 +1,428 @@
 """Useful and re-usable gear.
 
+Every item is declared on CommonGear and built on first access, see
+osrs_tools.gear.registry. The module exposes them as attributes, so
+`common_gear.TwistedBow` and `from osrs_tools.gear import TwistedBow` work as
+before, but a script only pays for the items it touches.
+
 ###############################################################################
 # email:    noahgill409@gmail.com                                             #
 # created: 2022-04-25                                                         #
 ###############################################################################
 """
 
+from typing import Any
+
 from osrs_tools.data import Slots
 from osrs_tools.stats import AggressiveStats, DefensiveStats, PlayerLevels
 from osrs_tools.tracked_value import EquipmentStat
 
 from .gear import Gear
+from .registry import Alias, GearRegistry, Lazy, LazyList
 from .special_weapon import SpecialWeapon
 from .weapon import Weapon
 
-# void ########################################################################
+###############################################################################
+# factories                                                                   #
+###############################################################################
+
+
+def _gear(name: str) -> Lazy[Gear]:
+    return Lazy(Gear.from_bb, name)
+
 
-VoidKnightHelm = Gear.from_bb("void knight helm")
-VoidKnightTop = Gear.from_bb("void knight top")
-VoidKnightRobe = Gear.from_bb("void knight robe")
-VoidKnightGloves = Gear.from_bb("void knight gloves")
-
-EliteVoidTop = Gear.from_bb("elite void top")
-EliteVoidRobe = Gear.from_bb("elite void robe")
+def _weapon(name: str) -> Lazy[Weapon]:
+    return Lazy(Weapon.from_bb, name)
 
-# misc ########################################################################
 
-RingOfEndurance = Gear.no_stats("ring of endurance", Slots.RING)
-KodaiWand = Weapon.from_bb("kodai wand")
-BookOfTheDead = Gear(
-    name="book of the dead",
-    slot=Slots.SHIELD,
-    aggressive_bonus=AggressiveStats(magic_attack=EquipmentStat(6)),
-    defensive_bonus=DefensiveStats(),
-    prayer_bonus=3,
-    level_requirements=PlayerLevels.starting_stats(),
-)
-RingOfSufferingI = Gear.from_bb("ring of suffering (i)")
+def _special_weapon(name: str) -> Lazy[SpecialWeapon]:
+    return Lazy(SpecialWeapon.from_bb, name)
 
-IbansStaff = Weapon.from_bb("iban staff (u)")
-TridentOfTheSeas = Weapon.from_bb("trident of the seas")
-TridentOfTheSwamp = Weapon.from_bb("trident of the swamp")
 
-SanguinestiStaff = Weapon.from_bb("sanguinesti staff")
-HarmonisedStaff = Weapon.from_bb("harmonised nightmare staff")
-TumekensShadow = Weapon.from_bb("tumeken's shadow")
+def _osrsbox_gear(name: str) -> Lazy[Gear]:
+    return Lazy(Gear.from_osrsbox, name)
+
+
+def _book_of_the_dead(name: str) -> Gear:
+    return Gear(
+        name=name,
+        slot=Slots.SHIELD,
+        aggressive_bonus=AggressiveStats(magic_attack=EquipmentStat(6)),
+        defensive_bonus=DefensiveStats(),
+        prayer_bonus=3,
+        level_requirements=PlayerLevels.starting_stats(),
+    )
+
+
+###############################################################################
+# registry                                                                    #
+###############################################################################
+
 
-BlessedCoif = Gear.from_bb("god coif")
-BlessedBody = Gear.from_bb("god d'hide body")
-BlessedChaps = Gear.from_bb("god d'hide chaps")
-BlessedBracers = Gear.from_bb("god bracers")
-BlessedBoots = Gear.from_bb("blessed d'hide boots")
+class CommonGear(GearRegistry):
+    """Useful and re-usable gear, built on first access."""
 
-ZaryteVambraces = Gear.from_osrsbox("zaryte vambraces")
-BarrowsGloves = Gear.from_bb("barrows gloves")
+    # void ####################################################################
 
-SalveAmuletI = Gear.from_bb("salve amulet (i)")
-SalveAmuletEI = Gear.from_bb("salve amulet (ei)")
+    VoidKnightHelm = _gear("void knight helm")
+    VoidKnightTop = _gear("void knight top")
+    VoidKnightRobe = _gear("void knight robe")
+    VoidKnightGloves = _gear("void knight gloves")
 
-TorvaFullHelm = Gear.from_bb("torva full helm")
-TorvaPlatebody = Gear.from_bb("torva platebody")
-TorvaPlatelegs = Gear.from_bb("torva platelegs")
+    EliteVoidTop = _gear("elite void top")
+    EliteVoidRobe = _gear("elite void robe")
 
-DharoksHelm = Gear.from_bb("dharok's helm")
-DharoksPlatebody = Gear.from_bb("dharok's platebody")
-DharoksPlatelegs = Gear.from_bb("dharok's platelegs")
-DharoksGreataxe = Weapon.from_bb("dharok's greataxe")
+    # misc ####################################################################
 
-NeitiznotFaceguard = Gear.from_bb("neitiznot faceguard")
-BandosChestplate = Gear.from_bb("bandos chestplate")
-BandosTassets = Gear.from_bb("bandos tassets")
+    RingOfEndurance = Lazy(Gear.no_stats, "ring of endurance", Slots.RING)
+    KodaiWand = _weapon("kodai wand")
+    BookOfTheDead = Lazy(_book_of_the_dead, "book of the dead")
+    RingOfSufferingI = _gear("ring of suffering (i)")
 
-InquisitorsGreatHelm = Gear.from_bb("inquisitor's great helm")
-InquisitorsHauberk = Gear.from_bb("inquisitor's hauberk")
-InquisitorsPlateskirt = Gear.from_bb("inquisitor's plateskirt")
+    IbansStaff = _weapon("iban staff (u)")
+    TridentOfTheSeas = _weapon("trident of the seas")
+    TridentOfTheSwamp = _weapon("trident of the swamp")
 
-JusticiarFaceguard = Gear.from_bb("justiciar faceguard")
-JusticiarChestguard = Gear.from_bb("justiciar chestguard")
-JusticiarLegguard = Gear.from_bb("justiciar legguard")
+    SanguinestiStaff = _weapon("sanguinesti staff")
+    HarmonisedStaff = _weapon("harmonised nightmare staff")
+    TumekensShadow = _weapon("tumeken's shadow")
 
-ObsidianHelm = Gear.from_bb("obsidian helm")
-ObsidianPlatebody = Gear.from_bb("obsidian platebody")
-ObsidianPlatelegs = Gear.from_bb("obsidian platelegs")
+    BlessedCoif = _gear("god coif")
+    BlessedBody = _gear("god d'hide body")
+    BlessedChaps = _gear("god d'hide chaps")
+    BlessedBracers = _gear("god bracers")
+    BlessedBoots = _gear("blessed d'hide boots")
 
-ObsidianDagger = Weapon.from_bb("obsidian dagger")
-ObsidianMace = Weapon.from_bb("obsidian mace")
-ObsidianMaul = Weapon.from_bb("obsidian maul")
-ObsidianSword = Weapon.from_bb("obsidian sword")
+    ZaryteVambraces = _osrsbox_gear("zaryte vambraces")
+    BarrowsGloves = _gear("barrows gloves")
 
-LeafBladedSpear = Weapon.from_bb("leaf-bladed spear")
-LeafBladedSword = Weapon.from_bb("leaf-bladed sword")
-LeafBladedBattleaxe = Weapon.from_bb("leaf-bladed battleaxe")
+    SalveAmuletI = _gear("salve amulet (i)")
+    SalveAmuletEI = _gear("salve amulet (ei)")
 
-Keris = Weapon.from_bb("keris")
+    TorvaFullHelm = _gear("torva full helm")
+    TorvaPlatebody = _gear("torva platebody")
+    TorvaPlatelegs = _gear("torva platelegs")
 
-CrystalHelm = Gear.from_bb("crystal helm")
-CrystalBody = Gear.from_bb("crystal body")
-CrystalLegs = Gear.from_bb("crystal legs")
+    DharoksHelm = _gear("dharok's helm")
+    DharoksPlatebody = _gear("dharok's platebody")
+    DharoksPlatelegs = _gear("dharok's platelegs")
+    DharoksGreataxe = _weapon("dharok's greataxe")
 
-CrystalBow = Weapon.from_bb("crystal bow")
-BowOfFaerdhinen = Weapon.from_bb("bow of faerdhinen")
-Bowfa = BowOfFaerdhinen
+    NeitiznotFaceguard = _gear("neitiznot faceguard")
+    BandosChestplate = _gear("bandos chestplate")
+    BandosTassets = _gear("bandos tassets")
 
-MysticSmokeStaff = Weapon.from_bb("mystic smoke staff")
-SmokeBattlestaff = Weapon.from_bb("smoke battlestaff")
+    InquisitorsGreatHelm = _gear("inquisitor's great helm")
+    InquisitorsHauberk = _gear("inquisitor's hauberk")
+    InquisitorsPlateskirt = _gear("inquisitor's plateskirt")
 
-GracefulHood = Gear.from_osrsbox("graceful hood")
-GracefulTop = Gear.from_osrsbox("graceful top")
-GracefulLegs = Gear.from_osrsbox("graceful legs")
-GracefulGloves = Gear.from_osrsbox("graceful gloves")
-GracefulBoots = Gear.from_osrsbox("graceful boots")
-GracefulCape = Gear.from_osrsbox("graceful cape")
+    JusticiarFaceguard = _gear("justiciar faceguard")
+    JusticiarChestguard = _gear("justiciar chestguard")
+    JusticiarLegguard = _gear("justiciar legguard")
 
-ArmadylCrossbow = weapon = SpecialWeapon.from_bb("armadyl crossbow")
-ZaryteCrossbow = weapon = SpecialWeapon.from_bb("zaryte crossbow")
+    ObsidianHelm = _gear("obsidian helm")
+    ObsidianPlatebody = _gear("obsidian platebody")
+    ObsidianPlatelegs = _gear("obsidian platelegs")
 
-ScytheOfVitur = Weapon.from_bb("scythe of vitur")
+    ObsidianDagger = _weapon("obsidian dagger")
+    ObsidianMace = _weapon("obsidian mace")
+    ObsidianMaul = _weapon("obsidian maul")
+    ObsidianSword = _weapon("obsidian sword")
 
-Chinchompa = Weapon.from_bb("chinchompa")
-RedChinchompa = Weapon.from_bb("red chinchompa")
-BlackChinchompa = Weapon.from_bb("black chinchompa")
-GreyChinchompa = Chinchompa
+    LeafBladedSpear = _weapon("leaf-bladed spear")
+    LeafBladedSword = _weapon("leaf-bladed sword")
+    LeafBladedBattleaxe = _weapon("leaf-bladed battleaxe")
 
-BrimstoneRing = Gear.from_bb("brimstone ring")
+    Keris = _weapon("keris")
 
-TomeOfFire = Gear.from_bb("tome of fire")
-TomeOfWater = Gear.from_bb("tome of water")
+    CrystalHelm = _gear("crystal helm")
+    CrystalBody = _gear("crystal body")
+    CrystalLegs = _gear("crystal legs")
 
-StaffOfLight = SpecialWeapon.from_bb("staff of light")
-StaffOfTheDead = SpecialWeapon.from_bb("staff of the dead")
-ToxicStaffOfTheDead = SpecialWeapon.from_bb("toxic staff of the dead")
+    CrystalBow = _weapon("crystal bow")
+    BowOfFaerdhinen = _weapon("bow of faerdhinen")
+    Bowfa = Alias("BowOfFaerdhinen")
 
-ElysianSpiritShield = Gear.from_bb("elysian spirit shield")
+    MysticSmokeStaff = _weapon("mystic smoke staff")
+    SmokeBattlestaff = _weapon("smoke battlestaff")
 
-DinhsBulwark = SpecialWeapon.from_bb("dinh's bulwark")
-AmuletofBloodFury = Gear.from_bb("amulet of blood fury")
-AmuletofFury = Gear.from_bb("amulet of fury")
+    GracefulHood = _osrsbox_gear("graceful hood")
+    GracefulTop = _osrsbox_gear("graceful top")
+    GracefulLegs = _osrsbox_gear("graceful legs")
+    GracefulGloves = _osrsbox_gear("graceful gloves")
+    GracefulBoots = _osrsbox_gear("graceful boots")
+    GracefulCape = _osrsbox_gear("graceful cape")
 
-BoneDagger = SpecialWeapon.from_bb("bone dagger")
-DorgeshuunCrossbow = SpecialWeapon.from_bb("dorgeshuun crossbow")
-BoneCrossbow = DorgeshuunCrossbow
+    ArmadylCrossbow = _special_weapon("armadyl crossbow")
+    ZaryteCrossbow = _special_weapon("zaryte crossbow")
 
-DragonClaws = SpecialWeapon.from_bb("dragon claws")
-AbyssalBludgeon = SpecialWeapon.from_bb("abyssal bludgeon")
-Arclight = SpecialWeapon.from_bb("arclight")
+    ScytheOfVitur = _weapon("scythe of vitur")
 
-DragonHunterCrossbow = Weapon.from_bb("dragon hunter crossbow")
-DragonHunterLance = Weapon.from_bb("dragon hunter lance")
-GhraziRapier = Weapon.from_bb("ghrazi rapier")
+    Chinchompa = _weapon("chinchompa")
+    RedChinchompa = _weapon("red chinchompa")
+    BlackChinchompa = _weapon("black chinchompa")
+    GreyChinchompa = Alias("Chinchompa")
 
-SlayerHelmetI = Gear.from_bb("slayer helmet (i)")
+    BrimstoneRing = _gear("brimstone ring")
 
-CrawsBow = Weapon.from_bb("craw's bow")
-ViggorasChainmace = Weapon.from_bb("viggora's chainmace")
-ThammaronsSceptre = Weapon.from_bb("thammaron's sceptre")
+    TomeOfFire = _gear("tome of fire")
+    TomeOfWater = _gear("tome of water")
 
-TwistedBow = Weapon.from_bb("twisted bow")
-BerserkerNecklace = Gear.from_bb("berserker necklace")
-ChaosGauntlets = Gear.from_bb("chaos gauntlets")
+    StaffOfLight = _special_weapon("staff of light")
+    StaffOfTheDead = _special_weapon("staff of the dead")
+    ToxicStaffOfTheDead = _special_weapon("toxic staff of the dead")
 
-AbyssalWhip = SpecialWeapon.from_bb("abyssal whip")
-AbyssalTentacle = SpecialWeapon.from_bb("abyssal tentacle")
-AbyssalDagger = SpecialWeapon.from_bb("abyssal dagger")
-DragonDagger = SpecialWeapon.from_bb("dragon dagger")
-OsmumtensFang = SpecialWeapon.from_bb("osmumten's fang")
+    ElysianSpiritShield = _gear("elysian spirit shield")
 
-Seercull = SpecialWeapon.from_bb("seercull")
+    DinhsBulwark = _special_weapon("dinh's bulwark")
+    AmuletofBloodFury = _gear("amulet of blood fury")
+    AmuletofFury = _gear("amulet of fury")
 
-DragonWarhammer = SpecialWeapon.from_bb("dragon warhammer")
+    BoneDagger = _special_weapon("bone dagger")
+    DorgeshuunCrossbow = _special_weapon("dorgeshuun crossbow")
+    BoneCrossbow = Alias("DorgeshuunCrossbow")
 
-# ammunition ##################################################################
+    DragonClaws = _special_weapon("dragon claws")
+    AbyssalBludgeon = _special_weapon("abyssal bludgeon")
+    Arclight = _special_weapon("arclight")
 
-RubyDragonBoltsE = Gear.from_bb("ruby dragon bolts (e)")
-RubyBoltsE = Gear.from_bb("ruby bolts (e)")
+    DragonHunterCrossbow = _weapon("dragon hunter crossbow")
+    DragonHunterLance = _weapon("dragon hunter lance")
+    GhraziRapier = _weapon("ghrazi rapier")
 
+    SlayerHelmetI = _gear("slayer helmet (i)")
 
-DiamondDragonBoltsE = Gear.from_bb("diamond dragon bolts (e)")
-DiamondBoltsE = Gear.from_bb("diamond bolts (e)")
+    CrawsBow = _weapon("craw's bow")
+    ViggorasChainmace = _weapon("viggora's chainmace")
+    ThammaronsSceptre = _weapon("thammaron's sceptre")
 
+    TwistedBow = _weapon("twisted bow")
+    BerserkerNecklace = _gear("berserker necklace")
+    ChaosGauntlets = _gear("chaos gauntlets")
 
-DragonstoneDragonBoltsE = Gear.from_bb("dragonstone dragon bolts (e)")
-DragonstoneBoltsE = Gear.from_bb("dragonstone bolts (e)")
+    AbyssalWhip = _special_weapon("abyssal whip")
+    AbyssalTentacle = _special_weapon("abyssal tentacle")
+    AbyssalDagger = _special_weapon("abyssal dagger")
+    DragonDagger = _special_weapon("dragon dagger")
+    OsmumtensFang = _special_weapon("osmumten's fang")
 
+    Seercull = _special_weapon("seercull")
 
-OnyxDragonBoltsE = Gear.from_bb("onyx dragon bolts (e)")
-OnyxBoltsE = Gear.from_bb("onyx bolts (e)")
+    DragonWarhammer = _special_weapon("dragon warhammer")
 
+    # ammunition ##############################################################
 
-# basic melee
-AmuletOfTorture = Gear.from_bb("amulet of torture")
-PrimordialBoots = Gear.from_bb("primordial boots")
-GuardianBoots = Gear.from_bb("guardian boots")
-InfernalCape = Gear.from_bb("infernal cape")
-FerociousGloves = Gear.from_bb("ferocious gloves")
-BrimstoneRing = Gear.from_bb("brimstone ring")
-BerserkerRingI = Gear.from_bb("berserker (i)")
+    OpalDragonBoltsE = _gear("opal dragon bolts (e)")
+    OpalBoltsE = _gear("opal bolts (e)")
 
-# basic ranged
-AvasAssembler = Gear.from_bb("ava's assembler")
-NecklaceOfAnguish = Gear.from_bb("necklace of anguish")
-PegasianBoots = Gear.from_bb("pegasian boots")
-ArchersRingI = Gear.from_bb("archer (i)")
+    PearlDragonBoltsE = _gear("pearl dragon bolts (e)")
+    PearlBoltsE = _gear("pearl bolts (e)")
 
-# basic magic
-GodCapeI = Gear.from_bb("god cape (i)")
-OccultNecklace = Gear.from_bb("occult necklace")
-ArcaneSpiritShield = Gear.from_bb("arcane spirit shield")
-TormentedBracelet = Gear.from_bb("tormented bracelet")
-EternalBoots = Gear.from_bb("eternal boots")
-SeersRingI = Gear.from_bb("seers (i)")
+    EmeraldDragonBoltsE = _gear("emerald dragon bolts (e)")
+    EmeraldBoltsE = _gear("emerald bolts (e)")
 
-ElidinisWardF = Gear.from_bb("elidinis' ward (f)")
+    RubyDragonBoltsE = _gear("ruby dragon bolts (e)")
+    RubyBoltsE = _gear("ruby bolts (e)")
 
-AvernicDefender = Gear.from_bb("avernic defender")
-TyrannicalRingI = Gear.from_bb("tyrannical (i)")
+    DiamondDragonBoltsE = _gear("diamond dragon bolts (e)")
+    DiamondBoltsE = _gear("diamond bolts (e)")
 
-BandosGodsword = SpecialWeapon.from_bb("bandos godsword")
-ZamorakianHasta = SpecialWeapon.from_bb("zamorakian hasta")
-DragonPickaxe = SpecialWeapon.from_bb("dragon pickaxe")
-DragonArrows = Gear.from_bb("dragon arrow")
+    DragonstoneDragonBoltsE = _gear("dragonstone dragon bolts (e)")
+    DragonstoneBoltsE = _gear("dragonstone bolts (e)")
 
-ToxicBlowpipe = SpecialWeapon.from_bb("toxic blowpipe")
-DragonDarts = Gear.from_bb("dragon dart")
-TwistedBuckler = Gear.from_bb("twisted buckler")
-BoneBolts = Gear.from_bb("bone bolts")
+    OnyxDragonBoltsE = _gear("onyx dragon bolts (e)")
+    OnyxBoltsE = _gear("onyx bolts (e)")
 
+    # basic melee
+    AmuletOfTorture = _gear("amulet of torture")
+    PrimordialBoots = _gear("primordial boots")
+    GuardianBoots = _gear("guardian boots")
+    InfernalCape = _gear("infernal cape")
+    FerociousGloves = _gear("ferocious gloves")
+    BerserkerRingI = _gear("berserker (i)")
 
-NeitiznotFaceguard = Gear.from_bb("neitiznot faceguard")
-BandosChestplate = Gear.from_bb("bandos chestplate")
-BandosTassets = Gear.from_bb("bandos tassets")
+    # basic ranged
+    AvasAssembler = _gear("ava's assembler")
+    NecklaceOfAnguish = _gear("necklace of anguish")
+    PegasianBoots = _gear("pegasian boots")
+    ArchersRingI = _gear("archer (i)")
 
-InquisitorsGreatHelm = Gear.from_bb("inquisitor's great helm")
-InquisitorsHauberk = Gear.from_bb("inquisitor's hauberk")
-InquisitorsPlateskirt = Gear.from_bb("inquisitor's plateskirt")
-InquisitorsMace = Weapon.from_bb("inquisitor's mace")
+    # basic magic
+    GodCapeI = _gear("god cape (i)")
+    OccultNecklace = _gear("occult necklace")
+    ArcaneSpiritShield = _gear("arcane spirit shield")
+    TormentedBracelet = _gear("tormented bracelet")
+    EternalBoots = _gear("eternal boots")
+    SeersRingI = _gear("seers (i)")
 
-ArmadylHelmet = Gear.from_bb("armadyl helmet")
-ArmadylChestplate = Gear.from_bb("armadyl chestplate")
-ArmadylChainskirt = Gear.from_bb("armadyl chainskirt")
+    ElidinisWardF = _gear("elidinis' ward (f)")
 
-MasoriMaskF = Gear.from_bb("masori mask (f)")
-MasoriBodyF = Gear.from_bb("masori body (f)")
-MasoriChapsF = Gear.from_bb("masori chaps (f)")
+    AvernicDefender = _gear("avernic defender")
+    TyrannicalRingI = _gear("tyrannical (i)")
+
+    BandosGodsword = _special_weapon("bandos godsword")
+    ZamorakianHasta = _special_weapon("zamorakian hasta")
+    DragonPickaxe = _special_weapon("dragon pickaxe")
+    DragonArrows = _gear("dragon arrow")
 
-AncestralHat = Gear.from_bb("ancestral hat")
-AncestralRobeTop = Gear.from_bb("ancestral robe top")
-AncestralRobeBottoms = Gear.from_bb("ancestral robe bottoms")
-
-NeitiznotHelm = Gear.from_bb("neitiznot")
-FireCape = Gear.from_bb("fire cape")
-DragonDefender = Gear.from_bb("dragon defender")
-RegenBracelet = Gear.from_bb("regen bracelet")
-DragonBoots = Gear.from_bb("dragon boots")
-
-DwarvenHelmet = Gear.from_bb("dwarven helmet")
-MythicalCape = Gear.from_bb("mythical cape")
-TyrannicalRingI = Gear.from_bb("tyrannical (i)")
-
-BookOfLaw = Gear.from_bb("book of law")
-RuneCrossbow = Weapon.from_bb("rune crossbow")
-
-# gear shorthand ##############################################################
-
-Dwh = DragonWarhammer
-Bgs = BandosGodsword
-ZerkRing = BerserkerRingI
-
-
-# gear sets ###################################################################
-
-BandosSet = [NeitiznotFaceguard, BandosChestplate, BandosTassets]
-InquisitorsArmourSet = [InquisitorsGreatHelm, InquisitorsHauberk, InquisitorsPlateskirt]
-
-TorvaSet = [TorvaFullHelm, TorvaPlatebody, TorvaPlatelegs]
-
-DharoksSet: list[Gear] = [
-    DharoksHelm,
-    DharoksPlatebody,
-    DharoksPlatelegs,
-    DharoksGreataxe,
-]
-
-NormalVoidSet: list[Gear] = [
-    VoidKnightHelm,
-    VoidKnightTop,
-    VoidKnightRobe,
-    VoidKnightGloves,
-]
-
-EliteVoidSet: list[Gear] = [
-    VoidKnightHelm,
-    EliteVoidTop,
-    EliteVoidRobe,
-    VoidKnightGloves,
-]
-
-JusticiarSet: list[Gear] = [
-    JusticiarFaceguard,
-    JusticiarChestguard,
-    JusticiarLegguard,
-]
-
-ObsidianArmorSet: list[Gear] = [
-    ObsidianHelm,
-    ObsidianPlatebody,
-    ObsidianPlatelegs,
-]
-
-ObsidianWeapons: list[Gear] = [
-    ObsidianDagger,
-    ObsidianMace,
-    ObsidianMaul,
-    ObsidianSword,
-]
-
-LeafBladedWeapons: list[Weapon] = [
-    LeafBladedSpear,
-    LeafBladedSword,
-    LeafBladedBattleaxe,
-]
-
-CrystalArmorSet: list[Gear] = [
-    CrystalHelm,
-    CrystalBody,
-    CrystalLegs,
-]
-
-SmokeStaves = [SmokeBattlestaff, MysticSmokeStaff]
-
-GracefulSet: list[Gear] = [
-    GracefulHood,
-    GracefulTop,
-    GracefulLegs,
-    GracefulGloves,
-    GracefulBoots,
-    GracefulCape,
-]
-
-Chinchompas: list[Weapon] = [
-    Chinchompa,
-    RedChinchompa,
-    BlackChinchompa,
-]
-
-StavesOfTheDead: list[SpecialWeapon] = [
-    StaffOfLight,
-    StaffOfTheDead,
-    ToxicStaffOfTheDead,
-]
-
-DragonbaneWeapons = [
-    DragonHunterCrossbow,
-    DragonHunterLance,
-]
-
-WildernessWeapons = [
-    CrawsBow,
-    ViggorasChainmace,
-    ThammaronsSceptre,
-]
-
-ArmadylSet = [
-    ArmadylHelmet,
-    ArmadylChestplate,
-    ArmadylChainskirt,
-]
-
-BlessedDragonhide = [
-    BlessedCoif,
-    BlessedBody,
-    BlessedChaps,
-    BlessedBracers,
-    BlessedBoots,
-]
-
-AncestralSet = [AncestralHat, AncestralRobeTop, AncestralRobeBottoms]
+    ToxicBlowpipe = _special_weapon("toxic blowpipe")
+    DragonDarts = _gear("dragon dart")
+    TwistedBuckler = _gear("twisted buckler")
+    BoneBolts = _gear("bone bolts")
+
+    InquisitorsMace = _weapon("inquisitor's mace")
+
+    ArmadylHelmet = _gear("armadyl helmet")
+    ArmadylChestplate = _gear("armadyl chestplate")
+    ArmadylChainskirt = _gear("armadyl chainskirt")
+
+    MasoriMaskF = _gear("masori mask (f)")
+    MasoriBodyF = _gear("masori body (f)")
+    MasoriChapsF = _gear("masori chaps (f)")
+
+    AncestralHat = _gear("ancestral hat")
+    AncestralRobeTop = _gear("ancestral robe top")
+    AncestralRobeBottoms = _gear("ancestral robe bottoms")
+
+    NeitiznotHelm = _gear("neitiznot")
+    FireCape = _gear("fire cape")
+    DragonDefender = _gear("dragon defender")
+    RegenBracelet = _gear("regen bracelet")
+    DragonBoots = _gear("dragon boots")
+
+    DwarvenHelmet = _gear("dwarven helmet")
+    MythicalCape = _gear("mythical cape")
+
+    BookOfLaw = _gear("book of law")
+    RuneCrossbow = _weapon("rune crossbow")
+
+    # gear shorthand ##########################################################
+
+    Dwh = Alias("DragonWarhammer")
+    Bgs = Alias("BandosGodsword")
+    ZerkRing = Alias("BerserkerRingI")
+
+    # gear sets ###############################################################
+
+    BandosSet = LazyList("NeitiznotFaceguard", "BandosChestplate", "BandosTassets")
+    InquisitorsArmourSet = LazyList("InquisitorsGreatHelm", "InquisitorsHauberk", "InquisitorsPlateskirt")
+
+    TorvaSet = LazyList("TorvaFullHelm", "TorvaPlatebody", "TorvaPlatelegs")
+
+    DharoksSet = LazyList(
+        "DharoksHelm",
+        "DharoksPlatebody",
+        "DharoksPlatelegs",
+        "DharoksGreataxe",
+    )
+
+    NormalVoidSet = LazyList(
+        "VoidKnightHelm",
+        "VoidKnightTop",
+        "VoidKnightRobe",
+        "VoidKnightGloves",
+    )
+
+    EliteVoidSet = LazyList(
+        "VoidKnightHelm",
+        "EliteVoidTop",
+        "EliteVoidRobe",
+        "VoidKnightGloves",
+    )
+
+    JusticiarSet = LazyList(
+        "JusticiarFaceguard",
+        "JusticiarChestguard",
+        "JusticiarLegguard",
+    )
+
+    ObsidianArmorSet = LazyList(
+        "ObsidianHelm",
+        "ObsidianPlatebody",
+        "ObsidianPlatelegs",
+    )
+
+    ObsidianWeapons = LazyList(
+        "ObsidianDagger",
+        "ObsidianMace",
+        "ObsidianMaul",
+        "ObsidianSword",
+    )
+
+    LeafBladedWeapons = LazyList(
+        "LeafBladedSpear",
+        "LeafBladedSword",
+        "LeafBladedBattleaxe",
+    )
+
+    CrystalArmorSet = LazyList(
+        "CrystalHelm",
+        "CrystalBody",
+        "CrystalLegs",
+    )
+
+    SmokeStaves = LazyList("SmokeBattlestaff", "MysticSmokeStaff")
+
+    GracefulSet = LazyList(
+        "GracefulHood",
+        "GracefulTop",
+        "GracefulLegs",
+        "GracefulGloves",
+        "GracefulBoots",
+        "GracefulCape",
+    )
+
+    Chinchompas = LazyList(
+        "Chinchompa",
+        "RedChinchompa",
+        "BlackChinchompa",
+    )
+
+    StavesOfTheDead = LazyList(
+        "StaffOfLight",
+        "StaffOfTheDead",
+        "ToxicStaffOfTheDead",
+    )
+
+    DragonbaneWeapons = LazyList(
+        "DragonHunterCrossbow",
+        "DragonHunterLance",
+    )
+
+    WildernessWeapons = LazyList(
+        "CrawsBow",
+        "ViggorasChainmace",
+        "ThammaronsSceptre",
+    )
+
+    ArmadylSet = LazyList(
+        "ArmadylHelmet",
+        "ArmadylChestplate",
+        "ArmadylChainskirt",
+    )
+
+    BlessedDragonhide = LazyList(
+        "BlessedCoif",
+        "BlessedBody",
+        "BlessedChaps",
+        "BlessedBracers",
+        "BlessedBoots",
+    )
+
+    AncestralSet = LazyList("AncestralHat", "AncestralRobeTop", "AncestralRobeBottoms")
+
+
+COMMON_GEAR = CommonGear()
+
+__all__ = CommonGear.names()
+
+
+def __getattr__(name: str) -> Any:
+    if name not in COMMON_GEAR:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(COMMON_GEAR, name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
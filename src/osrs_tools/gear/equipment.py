@@ -658,7 +658,9 @@ class Equipment:
 
     @property
     def enchanted_opal_bolts(self) -> bool:
-        return NotImplemented
+        """True if enchanted opal bolts are equipped."""
+        matching_ammunition = [gear.OpalDragonBoltsE, gear.OpalBoltsE]
+        return self[Slots.AMMUNITION] in matching_ammunition
 
     @property
     def enchanted_jade_bolts(self) -> bool:
@@ -666,7 +668,9 @@ class Equipment:
 
     @property
     def enchanted_pearl_bolts(self) -> bool:
-        return NotImplemented
+        """True if enchanted pearl bolts are equipped."""
+        matching_ammunition = [gear.PearlDragonBoltsE, gear.PearlBoltsE]
+        return self[Slots.AMMUNITION] in matching_ammunition
 
     @property
     def enchanted_topaz_bolts(self) -> bool:
@@ -678,7 +682,9 @@ class Equipment:
 
     @property
     def enchanted_emerald_bolts(self) -> bool:
-        return NotImplemented
+        """True if enchanted emerald bolts are equipped."""
+        matching_ammunition = [gear.EmeraldDragonBoltsE, gear.EmeraldBoltsE]
+        return self[Slots.AMMUNITION] in matching_ammunition
 
     @property
     def enchanted_ruby_bolts(self) -> bool:
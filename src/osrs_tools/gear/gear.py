@@ -9,7 +9,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from osrs_tools.data import ITEMS, Slots
+from osrs_tools import data
+from osrs_tools.data import Slots
 from osrs_tools.exceptions import OsrsException
 from osrs_tools.stats import AggressiveStats, DefensiveStats, PlayerLevels
 from osrs_tools.tracked_value import EquipmentStat, Level, TrackedFloat
@@ -105,9 +106,9 @@ class Gear:
     ):
 
         if name is not None and item_id is None:
-            item = ITEMS.lookup_by_item_name(name)
+            item = data.ITEMS.lookup_by_item_name(name)
         elif name is None and item_id is not None:
-            item = ITEMS.lookup_by_item_id(item_id)
+            item = data.ITEMS.lookup_by_item_id(item_id)
         else:
             raise ValueError(f"{name=}, {item_id=}")
 
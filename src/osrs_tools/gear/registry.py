@@ -0,0 +1,173 @@
+"""Registries of named gear, built on first access.
+
+Building a Gear looks up its row and constructs a dozen tracked stats, and a
+few items parse the osrsbox database. A GearRegistry declares its items as
+class attributes that are built on first access and cached on the instance,
+so importing a registry builds nothing and a script pays only for the items
+it touches.
+
+    class MyGear(GearRegistry):
+        Whip = Lazy(Gear.from_bb, "abyssal whip")
+        Tentacle = Lazy(Weapon.from_bb, "abyssal tentacle")
+        Tent = Alias("Tentacle")
+        Whips = LazyList("Whip", "Tentacle")
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Generic, Iterator, TypeVar, overload
+
+T = TypeVar("T")
+
+###############################################################################
+# descriptors                                                                 #
+###############################################################################
+
+
+class Lazy(Generic[T]):
+    """A registry attribute built by factory(*args) on first access.
+
+    The value is stored in the registry's __dict__, which shadows this
+    non-data descriptor, so later accesses are plain attribute lookups.
+    """
+
+    def __init__(self, factory: Callable[..., T], *args: Any):
+        self.factory = factory
+        self.args = args
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Lazy[T]:
+        ...
+
+    @overload
+    def __get__(self, instance: GearRegistry, owner: type | None = None) -> T:
+        ...
+
+    def __get__(self, instance: GearRegistry | None, owner: type | None = None) -> T | Lazy[T]:
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.name] = self.build(instance)
+        return value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name})"
+
+    @property
+    def source_name(self) -> str | None:
+        """The name the item is built from, if it's built from one."""
+        return self.args[0] if self.args and isinstance(self.args[0], str) else None
+
+    def build(self, registry: GearRegistry) -> T:
+        return self.factory(*self.args)
+
+
+class Alias(Lazy[Any]):
+    """Another name of a registry attribute, the same object."""
+
+    def __init__(self, target: str):
+        super().__init__(getattr, target)
+
+    @property
+    def source_name(self) -> str | None:
+        return None
+
+    def build(self, registry: GearRegistry) -> Any:
+        return getattr(registry, self.args[0])
+
+
+class LazyList(Lazy[list]):
+    """A list of registry attributes, e.g. an armour set."""
+
+    def __init__(self, *names: str):
+        super().__init__(list, *names)
+
+    @property
+    def source_name(self) -> str | None:
+        return None
+
+    def build(self, registry: GearRegistry) -> list:
+        return [getattr(registry, _n) for _n in self.args]
+
+
+###############################################################################
+# registry                                                                    #
+###############################################################################
+
+
+class GearRegistry:
+    """A namespace of Lazy attributes, see the module docstring."""
+
+    @classmethod
+    def names(cls) -> list[str]:
+        """Every attribute name, in definition order."""
+        names: dict[str, None] = {}
+
+        for klass in reversed(cls.__mro__):
+            names.update((_n, None) for _n, _v in vars(klass).items() if isinstance(_v, Lazy))
+
+        return list(names)
+
+    @classmethod
+    def _descriptor(cls, name: str) -> Lazy | None:
+        descriptor = getattr(cls, name, None)
+        return descriptor if isinstance(descriptor, Lazy) else None
+
+    def __contains__(self, name: str) -> bool:
+        return self._descriptor(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.names()
+
+    def __len__(self) -> int:
+        return len(self.names())
+
+    def __dir__(self) -> list[str]:
+        return sorted({*super().__dir__(), *self.names()})
+
+    def built(self) -> list[str]:
+        """The names of the attributes built so far."""
+        return [_n for _n in self.names() if _n in self.__dict__]
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Every (name, value) pair, building each value."""
+        for name in self.names():
+            yield name, getattr(self, name)
+
+    def by_source_name(self, source_name: str) -> Any | None:
+        """The item built from a name, e.g. "twisted bow", None if undefined.
+
+        Only that item is built.
+        """
+        try:
+            attribute = self._source_names()[source_name]
+        except KeyError:
+            return None
+
+        return getattr(self, attribute)
+
+    @classmethod
+    def _source_names(cls) -> dict[str, str]:
+        return _source_names(cls)
+
+
+@functools.cache
+def _source_names(registry: type[GearRegistry]) -> dict[str, str]:
+    """Source names to the first attribute built from each."""
+    source_names: dict[str, str] = {}
+
+    for name in registry.names():
+        if (descriptor := registry._descriptor(name)) is not None and descriptor.source_name is not None:
+            source_names.setdefault(descriptor.source_name, name)
+
+    return source_names
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from osrs_tools.data import PRAYERS, Skills
+from osrs_tools import data
+from osrs_tools.data import Skills
 from osrs_tools.exceptions import OsrsException
 from osrs_tools.tracked_value import LevelModifier
 
@@ -78,7 +79,7 @@ class Prayer:
             "magic_defence": None,
         }
 
-        for pp in PRAYERS.all_prayers:
+        for pp in data.PRAYERS.all_prayers:
             if pp.name == name or pp.id == prayer_id:
                 options.update(pp.bonuses)  # update with osrsbox source first
                 if options.get("magic"):
@@ -13,7 +13,7 @@ from osrs_tools.boost import Boost, Overload
 from osrs_tools.character.monster import Monster
 from osrs_tools.character.monster.cox import CoxMonster
 from osrs_tools.character.player import Player
-from osrs_tools.combat import Damage, PvMCalc
+from osrs_tools.combat import Damage, DamageCache, PvMCalc
 from osrs_tools.gear.equipment import Equipment
 from osrs_tools.prayer import Prayers
 from osrs_tools.stats import PlayerLevels
@@ -141,9 +141,9 @@ class CombatStrategy(Strategy):
         """
         return self.equip_player(**kwargs).boost_player().pray_player().misc_player(**kwargs)
 
-    def damage_distribution(self, target: Monster, **kwargs) -> Damage:
+    def damage_distribution(self, target: Monster, cache: DamageCache | None = None, **kwargs) -> Damage:
         """Simple wrapper for Player.damage_distribution"""
-        calc = PvMCalc(self.player, target)
+        calc = PvMCalc(self.player, target, cache)
         return calc.get_damage(**kwargs)
 
     # properties
@@ -7,7 +7,7 @@
 """
 
 from .data import MaximumVisibleLevel, MinimumVisibleLevel, ModifierPair, VoidModifiers
-from .tracked_value import TrackedFloat, TrackedInt, TrackedValue
+from .tracked_value import TrackedFloat, TrackedInt, TrackedValue, set_tracking, tracking_enabled, untracked
 from .tracked_values import (
     DamageModifier,
     DamageValue,
@@ -9,31 +9,164 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass, field
-from typing import Any, Callable
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
 
 from numpy import float64, int64
 
+###############################################################################
+# tracking                                                                    #
+###############################################################################
+
+# when False, operations skip building provenance comments
+_tracking = True
+
+
+def tracking_enabled() -> bool:
+    """True if operations on TrackedValues record provenance comments."""
+    return _tracking
+
+
+def set_tracking(enabled: bool, /) -> bool:
+    """Globally enable or disable provenance comments.
+
+    Parameters
+    ----------
+    enabled : bool
+        False skips comment bookkeeping on every TrackedValue operation.
+
+    Returns
+    -------
+    bool
+        The previous setting.
+    """
+    global _tracking
+    previous = _tracking
+    _tracking = bool(enabled)
+    return previous
+
+
+@contextmanager
+def untracked() -> Iterator[None]:
+    """Fast mode: values are computed as usual, but without comments.
+
+    TrackedValues created inside the block have no comment and report their
+    value instead. Useful for batch runs where provenance is never read.
+
+    Examples
+    --------
+    >>> with untracked():
+    ...     dam = PvMCalc(player, target).get_damage()
+    """
+    previous = set_tracking(False)
+
+    try:
+        yield
+    finally:
+        set_tracking(previous)
+
+
+###############################################################################
+# interning & lazy comments                                                   #
+###############################################################################
+
+# TrackedValues built from these without a comment are shared instances
+INTERNED_INT_RANGE = range(0, 150 + 1)
+INTERNED_FLOATS = frozenset([0.0, 1.0])
+# lazy comments nested deeper than this are rendered eagerly
+_MAX_LAZY_DEPTH = 64
+
+_interned: dict[tuple[type, type, Any], TrackedValue] = {}
+
+
+def _raw(__value: Any, /) -> Any:
+    """The underlying value of a TrackedValue, other values pass through."""
+    return __value._value if isinstance(__value, TrackedValue) else __value
+
+
+def _is_interned(__value: Any, /) -> bool:
+    _type = type(__value)
+    return (_type is int and __value in INTERNED_INT_RANGE) or (_type is float and __value in INTERNED_FLOATS)
+
+
+def _lazy_comment(template: str, left: Any, right: Any) -> tuple[str, Any, Any, int]:
+    """A comment that is only formatted when read, see TrackedValue.comment."""
+    depth = 0
+
+    for operand in (left, right):
+        if isinstance(operand, TrackedValue) and isinstance(operand._comment, tuple):
+            if operand._comment[3] >= _MAX_LAZY_DEPTH:
+                operand.comment  # render now to bound recursion later
+            else:
+                depth = max(depth, operand._comment[3] + 1)
+
+    return (template, left, right, depth)
+
+
 ###############################################################################
 # abstract class                                                              #
 ###############################################################################
 
 
-@dataclass(eq=False, unsafe_hash=True)
 class TrackedValue:
+    """A value that carries a description of where it came from.
+
+    Instances are immutable. Comments of arithmetic results are kept as
+    (template, left, right) and only formatted when read. Instances without
+    a comment whose value is a small int (see INTERNED_INT_RANGE) or 0.0/1.0
+    are interned, so e.g. every EquipmentStat(0) is the same object.
+
+    Attributes
+    ----------
+
+    _value : Any
+        The value.
+
+    _comment : str | tuple | None, optional
+        A description of the value, None for the value itself. Defaults to
+        None.
+    """
+
+    __slots__ = ("_value", "_comment")
+
     _value: Any
-    _value_type: type = field(init=False)
-    _comment: str | None = None
-    _comment_is_default: bool = field(init=False, default=False)
+    _comment: str | tuple[str, Any, Any, int] | None
+
+    def __new__(cls, _value: Any = None, _comment: str | None = None):
+        if _comment is not None or not _is_interned(_value):
+            return object.__new__(cls)
+
+        key = (cls, type(_value), _value)
+
+        try:
+            return _interned[key]
+        except KeyError:
+            obj = _interned[key] = object.__new__(cls)
+            return obj
+
+    def __init__(self, _value: Any, _comment: str | tuple[str, Any, Any, int] | None = None):
+        object.__setattr__(self, "_value", _value)
+        object.__setattr__(self, "_comment", _comment)
 
     # dunder and helper methods ###############################################
 
-    def __post_init__(self):
-        self._value_type = type(self.value)
+    def __setattr__(self, __name: str, __value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(_value={self._value!r}, _comment={self.comment!r})"
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+    def __reduce__(self):
+        return (self.__class__, (self._value, None if self._comment is None else self.comment))
+
+    def __copy__(self):
+        return self
 
-        if self._comment is None:
-            self._comment = str(self.value)
-            self._comment_is_default = True
+    def __deepcopy__(self, memo):
+        return self
 
     def _dunder_helper(self, other, func: Callable[[Any, Any], Any]) -> Any:
         """Performs a basic function on self and other.
@@ -66,6 +199,11 @@ class TrackedValue:
 
         return _val
 
+    @classmethod
+    def _untracked(cls, __value: Any, /) -> Any:
+        """Create an instance without comment bookkeeping, see untracked."""
+        return cls(__value)
+
     def _assert_subclass(self, __value: TrackedValue, /) -> TrackedValue:
         """"""
         assert isinstance(__value, self.__class__)
@@ -92,7 +230,7 @@ class TrackedValue:
     def __str__(self):
         _s = f"{self.__class__.__name__}({self.value})"
 
-        if not self._comment_is_default:
+        if self._comment is not None:
             _s = _s[:-1] + f": {self.comment})"
 
         return _s
@@ -103,22 +241,28 @@ class TrackedValue:
     def value(self) -> Any:
         return self._value
 
-    @value.setter
-    def value(self, __x, /):
-        if not isinstance(__x, self._value_type):
-            raise TypeError(__x, self._value_type)
+    @property
+    def _value_type(self) -> type:
+        return type(self._value)
 
-        self._value = __x
+    @property
+    def _comment_is_default(self) -> bool:
+        return self._comment is None
 
     @property
     def comment(self) -> str:
-        assert self._comment is not None
-        return self._comment
+        _comment = self._comment
 
-    @comment.setter
-    def comment(self, __x, /):
-        assert isinstance(__x, str)
-        self._comment = __x
+        if _comment is None:
+            return str(self.value)
+
+        if isinstance(_comment, tuple):
+            template, left, right, _ = _comment
+            _comment = template.format(left, right)
+            # drop the operand references once rendered
+            object.__setattr__(self, "_comment", _comment)
+
+        return _comment
 
     # arithmetic operations ###################################################
     # def __copy__(self) -> TrackedValue:
@@ -126,8 +270,11 @@ class TrackedValue:
     #     return self.__class__(*unpacked)
 
     def __add__(self, other) -> TrackedValue:
+        if not _tracking:
+            return self._untracked(self._value + _raw(other))
+
         new_val = self._dunder_helper(other, lambda x, y: x + y)
-        new_com = f"({self} + {other})"
+        new_com = _lazy_comment("({} + {})", self, other)
         return self.__class__(new_val, new_com)
 
     def __radd__(self, other) -> TrackedValue:
@@ -135,8 +282,11 @@ class TrackedValue:
         return val
 
     def __sub__(self, other) -> TrackedValue:
+        if not _tracking:
+            return self._untracked(self._value - _raw(other))
+
         new_val = self._dunder_helper(other, lambda x, y: x - y)
-        new_com = f"({self} - {other})"
+        new_com = _lazy_comment("({} - {})", self, other)
         return self.__class__(new_val, new_com)
 
     def __mul__(self, other) -> Any:
@@ -146,8 +296,11 @@ class TrackedValue:
             else:
                 return 0
 
+        if not _tracking:
+            return self._untracked(self._value * _raw(other))
+
         new_val = self._dunder_helper(other, lambda x, y: x * y)
-        new_com = f"({self} · {other})"
+        new_com = _lazy_comment("({} · {})", self, other)
         return self.__class__(new_val, new_com)
 
     def __rmul__(self, other) -> Any:
@@ -171,8 +324,9 @@ class TrackedValue:
 ###############################################################################
 
 
-@dataclass(eq=False, unsafe_hash=True)
 class TrackedInt(TrackedValue):
+    __slots__ = ()
+
     _value: int | int64
 
     # properties
@@ -187,10 +341,13 @@ class TrackedInt(TrackedValue):
     # operations
 
     def __add__(self, other) -> TrackedInt:
+        if not _tracking:
+            return self._untracked(math.floor(self._value + _raw(other)))
+
         if isinstance(other, TrackedInt):
-            new_com = f"({self} + {other}"
+            new_com = _lazy_comment("({} + {}", self, other)
         else:
-            new_com = f"⌊{self} + {other}⌋"
+            new_com = _lazy_comment("⌊{} + {}⌋", self, other)
 
         new_val = self._dunder_helper(other, lambda x, y: math.floor(x + y))
         new_tracked_int = self.__class__(new_val, new_com)
@@ -198,10 +355,13 @@ class TrackedInt(TrackedValue):
         return new_tracked_int
 
     def __sub__(self, other) -> TrackedInt:
+        if not _tracking:
+            return self._untracked(math.floor(self._value - _raw(other)))
+
         if isinstance(other, TrackedInt):
-            new_com = f"({self} - {other}"
+            new_com = _lazy_comment("({} - {}", self, other)
         else:
-            new_com = f"⌊{self} - {other}⌋"
+            new_com = _lazy_comment("⌊{} - {}⌋", self, other)
 
         new_val = self._dunder_helper(other, lambda x, y: math.floor(x - y))
         new_tracked_int = self.__class__(new_val, new_com)
@@ -209,10 +369,13 @@ class TrackedInt(TrackedValue):
         return new_tracked_int
 
     def __mul__(self, other) -> TrackedInt:
+        if not _tracking:
+            return self._untracked(math.floor(self._value * _raw(other)))
+
         if isinstance(other, TrackedInt):
-            new_com = f"({self} · {other})"
+            new_com = _lazy_comment("({} · {})", self, other)
         else:
-            new_com = f"⌊{self} · {other}⌋"
+            new_com = _lazy_comment("⌊{} · {}⌋", self, other)
 
         new_val = self._dunder_helper(other, lambda x, y: math.floor(x * y))
         new_tracked_int = self.__class__(new_val, new_com)
@@ -233,8 +396,9 @@ class TrackedInt(TrackedValue):
         return cls(1)
 
 
-@dataclass(eq=False, unsafe_hash=True)
 class TrackedFloat(TrackedValue):
+    __slots__ = ()
+
     _value: float | float64
 
     # properties
@@ -255,7 +419,10 @@ class TrackedFloat(TrackedValue):
         return val
 
     def __add__(self, other) -> TrackedFloat:
-        new_com = f"({self} + {other})"
+        if not _tracking:
+            return self._untracked(self._value + _raw(other))
+
+        new_com = _lazy_comment("({} + {})", self, other)
         new_val = self._dunder_helper(other, lambda x, y: x + y)
 
         val = self.__class__(new_val, new_com)
@@ -17,6 +17,8 @@ from .tracked_value import TrackedFloat, TrackedInt, TrackedValue
 
 
 class Level(TrackedInt):
+    __slots__ = ()
+
     def _assert_subclass(self, __value: TrackedValue, /) -> Level:
         val = super()._assert_subclass(__value)
         assert isinstance(val, self.__class__)
@@ -46,13 +48,15 @@ class Level(TrackedInt):
 
 
 class LevelModifier(TrackedFloat):
-    ...
+    __slots__ = ()
 
 
 # roll ########################################################################
 
 
 class Roll(TrackedInt):
+    __slots__ = ()
+
     def _assert_subclass(self, __value: TrackedValue, /) -> Roll:
         val = super()._assert_subclass(__value)
         assert isinstance(val, self.__class__)
@@ -67,13 +71,15 @@ class Roll(TrackedInt):
 
 
 class RollModifier(TrackedFloat):
-    ...
+    __slots__ = ()
 
 
 # damage value ################################################################
 
 
 class DamageValue(TrackedInt):
+    __slots__ = ()
+
     def _assert_subclass(self, __value: TrackedValue, /) -> DamageValue:
         val = super()._assert_subclass(__value)
         assert isinstance(val, self.__class__)
@@ -102,6 +108,8 @@ class DamageValue(TrackedInt):
 
 
 class DamageModifier(TrackedFloat):
+    __slots__ = ()
+
     def _assert_subclass(self, __value: TrackedValue, /) -> DamageModifier:
         val = super()._assert_subclass(__value)
         assert isinstance(val, self.__class__)
@@ -116,6 +124,8 @@ class DamageModifier(TrackedFloat):
 
 
 class StyleBonus(TrackedInt):
+    __slots__ = ()
+
 
     # class methods
 
@@ -127,6 +137,9 @@ class StyleBonus(TrackedInt):
 class EquipmentStat(TrackedInt):
     """Stats for Equipment and related fields"""
 
+    __slots__ = ()
+
+
     @staticmethod
     def _assert_subclass(__value: TrackedInt, /) -> EquipmentStat:
         assert isinstance(__value, EquipmentStat)
@@ -8,10 +8,22 @@ This code is a little old and jank, but it gets the job done.
 ###############################################################################
 """
 
+import bisect
+import difflib
+import functools
+import hashlib
+import inspect
+import marshal
+import os
+import re
+from pathlib import Path
+from typing import Callable
+
 import numpy as np
 import pandas as pd
 
-from osrs_tools.data import CSV_SEP, ITEMS_BITTER_BED, MONSTERS_BITTER, MONSTERS_DE0
+from osrs_tools import database
+from osrs_tools.data import COMPILED_DIR, CSV_SEP, ITEMS_BITTER_BED, MONSTERS_BITTER, MONSTERS_DE0
 
 ###############################################################################
 # load csvs                                                                   #
@@ -138,16 +150,200 @@ def _load_bitterkoekje_npc():
     return npc_df
 
 
+###############################################################################
+# name indexes                                                                #
+###############################################################################
+
+_PUNCTUATION = re.compile(r"['’.,()!]")
+
+# common abbreviations, added to the gear index if the item exists
+GEAR_ALIASES = {
+    "ags": "armadyl godsword",
+    "bgs": "bandos godsword",
+    "sgs": "saradomin godsword",
+    "zgs": "zamorak godsword",
+    "dwh": "dragon warhammer",
+    "tbow": "twisted bow",
+    "bp": "toxic blowpipe",
+    "blowpipe": "toxic blowpipe",
+    "scythe": "scythe of vitur",
+    "tent": "abyssal tentacle",
+    "claws": "dragon claws",
+    "acb": "armadyl crossbow",
+    "zcb": "zaryte crossbow",
+    "dhl": "dragon hunter lance",
+    "dhcb": "dragon hunter crossbow",
+    "sang": "sanguinesti staff",
+    "shadow": "tumeken's shadow",
+    "fang": "osmumten's fang",
+    "rapier": "ghrazi rapier",
+    "bulwark": "dinh's bulwark",
+    "bofa": "bow of faerdhinen",
+}
+
+COX_ALIASES = {
+    "olm": "great olm",
+    "vasa": "vasa nistirio",
+    "shaman": "lizardman shaman",
+    "mystic": "skeletal mystic",
+}
+
+
+def normalize_name(name: str) -> str:
+    """Lower case, drop punctuation & collapse whitespace.
+
+    "Tumeken's  Shadow" and "tumekens shadow" both normalize to
+    "tumekens shadow", "Dragon-hunter lance" to "dragon hunter lance".
+    """
+    return " ".join(_PUNCTUATION.sub("", name.lower().replace("-", " ").replace("_", " ")).split())
+
+
+class NameIndex:
+    """Name to row lookups & prefix / fuzzy search over one table column.
+
+    Names resolve exactly first, then by their normalized form or an alias.
+    Build once per table, lookups are dictionary hits instead of a scan over
+    the column.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The table.
+
+    column : str
+        The column of names.
+
+    aliases : dict[str, str] | None, optional
+        Alternate names of existing names, by default None.
+    """
+
+    def __init__(self, df: pd.DataFrame, column: str, aliases: dict[str, str] | None = None):
+        self.df = df
+        self.names: list[str] = df[column].tolist()
+        self._exact: dict[str, list[int]] = {}
+        self._normalized: dict[str, list[int]] = {}
+
+        for row, name in enumerate(self.names):
+            self._exact.setdefault(name, []).append(row)
+
+            if key := normalize_name(name):
+                self._normalized.setdefault(key, []).append(row)
+
+        for alias, name in (aliases or {}).items():
+            if name in self._exact:
+                self._normalized.setdefault(normalize_name(alias), self._exact[name])
+
+        self._keys = sorted(self._normalized)
+
+    def __contains__(self, name: str) -> bool:
+        return bool(self.rows(name))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rows(self, name: str) -> list[int]:
+        """The positions of the rows of a name, empty if there are none."""
+        if (rows := self._exact.get(name)) is not None:
+            return rows
+
+        return self._normalized.get(normalize_name(name), [])
+
+    def lookup(self, name: str) -> pd.DataFrame:
+        """The rows of a name, like df.loc[df[column] == name]."""
+        rows = self.rows(name)
+
+        if len(rows) == 1:
+            return self.df.iloc[rows[0] : rows[0] + 1]
+
+        return self.df.take(rows)
+
+    def search(self, query: str, limit: int = 10, cutoff: float = 0.6) -> list[str]:
+        """Names that start with the query, then close matches.
+
+        Parameters
+        ----------
+        query : str
+            A partial or misspelled name or alias.
+
+        limit : int, optional
+            The maximum number of names, by default 10.
+
+        cutoff : float, optional
+            The minimum similarity of a close match in [0, 1], by default 0.6.
+
+        Returns
+        -------
+        list[str]
+            Distinct names, best first.
+        """
+        key = normalize_name(query)
+        keys: list[str] = []
+
+        if key:
+            start = bisect.bisect_left(self._keys, key)
+
+            for candidate in self._keys[start:]:
+                if not candidate.startswith(key):
+                    break
+
+                keys.append(candidate)
+
+            keys.sort(key=len)
+
+        keys.extend(difflib.get_close_matches(key, self._keys, n=limit, cutoff=cutoff))
+        names: list[str] = []
+
+        for candidate in keys:
+            for row in self._normalized[candidate]:
+                if self.names[row] not in names:
+                    names.append(self.names[row])
+
+        return names[:limit]
+
+
+@functools.cache
+def gear_index() -> NameIndex:
+    return NameIndex(GEAR_DF, "name", GEAR_ALIASES)
+
+
+@functools.cache
+def monster_index() -> NameIndex:
+    return NameIndex(NPC_DF, "npc")
+
+
+@functools.cache
+def cox_monster_index() -> NameIndex:
+    return NameIndex(COX_DF, "name", COX_ALIASES)
+
+
+def search_gear(query: str, limit: int = 10) -> list[str]:
+    """Gear names matching a partial or misspelled name, see NameIndex.search."""
+    return gear_index().search(query, limit)
+
+
+def search_monsters(query: str, limit: int = 10) -> list[str]:
+    """Monster names matching a partial or misspelled name, see NameIndex.search."""
+    return monster_index().search(query, limit)
+
+
+###############################################################################
+# lookups                                                                     #
+###############################################################################
+
+
 def lookup_monster(name: str, npc_df: pd.DataFrame | None = None) -> pd.DataFrame:
     """
 
-    :param name: Name of the npc
+    :param name: Name of the npc, the default table also matches normalized names
     :param npc_df: pd.DataFrame or the default one, allows for lookup chaining
     :return:
     """
     npc_index = "npc"
-    df = npc_df if npc_df else NPC_DF
-    return df.loc[df[npc_index] == name]
+
+    if npc_df is None:
+        return monster_index().lookup(name)
+
+    return npc_df.loc[npc_df[npc_index] == name]
 
 
 def lookup_normal_monster_by_name(
@@ -164,7 +360,7 @@ def lookup_normal_monster_by_name(
 
 
 def get_cox_monster_base_stats_by_name(name: str) -> pd.DataFrame:
-    mon_df = COX_DF.loc[COX_DF["name"] == name.lower()]
+    mon_df = cox_monster_index().lookup(name.lower())
 
     if len(mon_df) == 0:
         raise ValueError(f"{name=} not found")
@@ -177,12 +373,14 @@ def get_cox_monster_base_stats_by_name(name: str) -> pd.DataFrame:
 def lookup_gear(name: str, gear_df: pd.DataFrame | None = None) -> pd.DataFrame:
     """
 
-    :param name: The name of the item
+    :param name: The name of the item, the default table also matches normalized names & GEAR_ALIASES
     :param gear_df: You can supply a dataframe to chain lookups or default to the whole list
     :return pd.DataFrame:
     """
-    df = gear_df if gear_df else GEAR_DF
-    return df.loc[df["name"] == name]
+    if gear_df is None:
+        return gear_index().lookup(name)
+
+    return gear_df.loc[gear_df["name"] == name]
 
 
 # def lookup_slot_table(slot: str, gear_df: pd.DataFrame = None) -> pd.DataFrame:
@@ -241,6 +439,46 @@ def lookup_gear(name: str, gear_df: pd.DataFrame | None = None) -> pd.DataFrame:
 # 	return gear_min, gear_max
 #
 
-COX_DF = _load_de0()
-GEAR_DF = _load_bitterkoekje_bedevere()
-NPC_DF = _load_bitterkoekje_npc()
+###############################################################################
+# compiled tables                                                             #
+###############################################################################
+
+TABLES: dict[str, tuple[Path, Callable[[], pd.DataFrame]]] = {
+    "cox": (MONSTERS_DE0, _load_de0),
+    "gear": (ITEMS_BITTER_BED, _load_bitterkoekje_bedevere),
+    "npc": (MONSTERS_BITTER, _load_bitterkoekje_npc),
+}
+
+
+def _tables_version() -> str:
+    """A digest of the loaders' code & pandas version, so editing a loader retires compiled tables."""
+    digest = hashlib.sha256(pd.__version__.encode())
+
+    for _, loader in TABLES.values():
+        try:
+            digest.update(inspect.getsource(loader).encode())
+        except (OSError, TypeError):  # no source, e.g. a bytecode-only install
+            digest.update(marshal.dumps(loader.__code__))
+
+    return digest.hexdigest()[:16]
+
+
+TABLES_VERSION = _tables_version()
+
+
+def compile_tables(directory: str | os.PathLike = COMPILED_DIR) -> Path:
+    """Compile the resource CSVs, see osrs_tools.database.compile_tables."""
+    tables = {_n: (_loader(), _source) for _n, (_source, _loader) in TABLES.items()}
+    return database.compile_tables(tables, directory, TABLES_VERSION)
+
+
+def _load_table(name: str) -> pd.DataFrame:
+    """Load a compiled table, or its CSV if the compiled table is stale."""
+    source, loader = TABLES[name]
+    df = database.load_table(name, source, version=TABLES_VERSION)
+    return loader() if df is None else df
+
+
+COX_DF = _load_table("cox")
+GEAR_DF = _load_table("gear")
+NPC_DF = _load_table("npc")
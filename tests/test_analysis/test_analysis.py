@@ -1,29 +1,70 @@
 import logging
-
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from itertools import combinations, product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from osrs_tools.analysis import AnalysisResult
+from osrs_tools.analysis.best_in_slot import GearDatabase, galahad_the_pure
+from osrs_tools.analysis.pareto import lancelot_the_brave, non_dominated
 from osrs_tools.analysis.pvm_axes import PvmAxes, PvmAxesEquipmentStyle
-from osrs_tools.analysis.utils import bedevere_the_wise, tabulate_enhanced
+from osrs_tools.analysis.sensitivity import arthur_king_of_the_britons
+from osrs_tools.analysis.sinks import CsvSink, NpySink, ParquetSink, write_bedevere_the_wise
+from osrs_tools.analysis.utils import (
+    AnalysisError,
+    bedevere_the_wise,
+    iter_bedevere_the_wise,
+    robin_the_brave,
+    tabulate_enhanced,
+)
 from osrs_tools.boost import Overload
 from osrs_tools.boost.boost import Boost
 from osrs_tools.boost.boosts import SuperCombatPotion
 from osrs_tools.character.monster import Monster
-from osrs_tools.character.monster.cox import Tekton
+from osrs_tools.character.monster.cox import IceDemon, LizardmanShaman, Tekton
 from osrs_tools.character.player import Player
-from osrs_tools.data import DataMode, Slots, Styles
-from osrs_tools.gear import Equipment
+from osrs_tools.combat import PvMCalc
+from osrs_tools.data import DT, DataMode, Skills, Slots, Styles
+from osrs_tools.gear import Equipment, common_gear
 from osrs_tools.gear.common_gear import (
     AbyssalWhip,
+    AncestralHat,
+    ArcaneSpiritShield,
     AvernicDefender,
+    BarrowsGloves,
+    BerserkerNecklace,
     BerserkerRingI,
+    BrimstoneRing,
+    FerociousGloves,
     GhraziRapier,
+    GodCapeI,
     InquisitorsArmourSet,
     InquisitorsMace,
+    MysticSmokeStaff,
+    OccultNecklace,
     OsmumtensFang,
+    PrimordialBoots,
+    SalveAmuletEI,
+    SanguinestiStaff,
+    ScytheOfVitur,
+    SeersRingI,
+    TormentedBracelet,
+    TridentOfTheSwamp,
 )
 from osrs_tools.gear.gear import EquipableError
-from osrs_tools.prayer import Piety
+from osrs_tools.gear.registry import GearRegistry, Lazy
+from osrs_tools.prayer import Augury, Piety
 from osrs_tools.prayer.prayers import Prayers
-from osrs_tools.style.all_weapon_styles import SpikedWeaponsStyles, StabSwordStyles, WhipStyles
+from osrs_tools.spell import PoweredSpells, StandardSpells
+from osrs_tools.style.all_weapon_styles import PoweredStaffStyles, SpikedWeaponsStyles, StabSwordStyles, WhipStyles
+from osrs_tools.strategy import CombatStrategy
 from osrs_tools.style.style import PlayerStyle
+from osrs_tools.tracked_value import Level
+from osrs_tools.utils import GEAR_DF
 
 logging.basicConfig(level=logging.INFO)
 
@@ -100,6 +141,373 @@ def test_bedevere_the_wise():
         f.writelines(table)
 
 
+def test_bedevere_the_wise_parallel():
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(AbyssalWhip)
+
+    styles = [WhipStyles[Styles.FLICK], WhipStyles[Styles.LASH], WhipStyles[Styles.DEFLECT]]
+    boosts: list[Boost] = [Overload, SuperCombatPotion]
+    ax = PvmAxes.create(player, Monster.dummy(), style=styles, prayers=Piety, boosts=boosts)
+
+    serial = bedevere_the_wise(ax, DataMode.DPT)
+    assert np.array_equal(bedevere_the_wise(ax, DataMode.DPT, workers=2), serial)
+
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as executor:
+        assert np.array_equal(bedevere_the_wise(ax, DataMode.DPT, executor=executor, chunksize=1), serial)
+
+    # threads would share one copy of the players & cache
+    with ThreadPoolExecutor(2) as executor, pytest.raises(AnalysisError):
+        bedevere_the_wise(ax, DataMode.DPT, executor=executor, chunksize=1)
+
+
+def test_bedevere_the_wise_labelled():
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(AbyssalWhip)
+
+    styles = [WhipStyles[Styles.FLICK], WhipStyles[Styles.LASH], WhipStyles[Styles.DEFLECT]]
+    boosts: list[Boost] = [Overload, SuperCombatPotion]
+    prayers = [Prayers(prayers=[Piety]), Prayers(prayers=[])]
+    ax = PvmAxes.create(player, Monster.dummy(), style=styles, prayers=prayers, boosts=boosts)
+
+    res = bedevere_the_wise(ax, DataMode.DPT)
+    assert isinstance(res, AnalysisResult)
+    assert res.dims == ("style", "prayers", "boosts")
+    assert res.shape == (3, 2, 2)
+    assert res.coords["style"] == styles
+
+    # labels & positions agree
+    np.testing.assert_array_equal(res.sel(style="lash", boosts=Overload).data, res.data[1, :, 0])
+    assert res[:, 0].dims == ("style", "boosts")
+    assert res[1:, 0].coords["style"] == styles[1:]
+
+    # piety & overload are always best
+    best = res.best("boosts")
+    assert best.dims == ("style", "prayers")
+    assert all(_b is Overload for _b in res.argbest("boosts").flat)
+    np.testing.assert_array_equal(best.data, res.data[:, :, 0])
+
+    series = res.to_pandas()
+    assert series.index.names == ["style", "prayers", "boosts"]
+    assert np.shares_memory(series.to_numpy(), res.data)
+    assert series[("lash", "Piety", Overload.name)] == res.data[1, 0, 0]
+
+    np.testing.assert_array_equal(res[1] / res[0], res.data[1] / res.data[0])
+
+
+def test_bedevere_the_wise_activates_once_per_strategy(monkeypatch):
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(AbyssalWhip)
+
+    styles = [WhipStyles[Styles.FLICK], WhipStyles[Styles.LASH]]
+    targets = [Tekton.simple(1), IceDemon.simple(1), LizardmanShaman.simple(1)]
+    ax = PvmAxes.create(player, targets, style=styles, prayers=Piety, boosts=Overload)
+
+    activations = []
+    activate = CombatStrategy.activate
+
+    def counting_activate(self, **kwargs):
+        activations.append(self.style)
+        return activate(self, **kwargs)
+
+    monkeypatch.setattr(CombatStrategy, "activate", counting_activate)
+    res = bedevere_the_wise(ax, DataMode.DPT)
+
+    assert res.dims == ("target", "style")
+    assert activations == styles
+
+    # each cell matches a grid with that cell's target alone
+    for idx, target in enumerate(targets):
+        single = PvmAxes.create(player, target, style=styles, prayers=Piety, boosts=Overload)
+        np.testing.assert_array_equal(bedevere_the_wise(single, DataMode.DPT).data, res.data[idx])
+
+
+def _streaming_axes():
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(AbyssalWhip)
+
+    styles = [WhipStyles[Styles.FLICK], WhipStyles[Styles.LASH], WhipStyles[Styles.DEFLECT]]
+    targets = [Tekton.simple(1), IceDemon.simple(1)]
+    return PvmAxes.create(player, targets, style=styles, prayers=Piety, boosts=Overload)
+
+
+def test_iter_bedevere_the_wise():
+    ax = _streaming_axes()
+    res = bedevere_the_wise(ax, DataMode.DPT)
+
+    records = list(iter_bedevere_the_wise(ax, DataMode.DPT))
+    assert sorted(_r.index for _r in records) == sorted(ax.squeezed_indices)
+
+    for index, params, value in records:
+        assert value == res.data[index]
+        assert params["style"] is ax.style[index[1]]
+
+    skipped = list(iter_bedevere_the_wise(ax, DataMode.DPT, skip={(0, 0), (1, 2)}))
+    assert len(skipped) == len(records) - 2
+
+
+def test_sinks_resume(tmp_path):
+    ax = _streaming_axes()
+    res = bedevere_the_wise(ax, DataMode.DPT)
+
+    # an interrupted csv run, with a partially written last line
+    csv_path = tmp_path / "grid.csv"
+
+    with CsvSink(csv_path, ax, DataMode.DPT, flush_every=2) as sink:
+        for record, _ in zip(iter_bedevere_the_wise(ax, DataMode.DPT), range(3)):
+            sink.write(record)
+
+    with open(csv_path, mode="a", encoding="UTF-8") as f:
+        f.write("1,2,ice dem")
+
+    completed = CsvSink(csv_path, ax, DataMode.DPT).completed()
+    assert sum(_i in completed for _i in np.ndindex(res.data.shape)) == 3
+
+    assert write_bedevere_the_wise(ax, CsvSink(csv_path, ax, DataMode.DPT), DataMode.DPT) == 3
+    assert write_bedevere_the_wise(ax, CsvSink(csv_path, ax, DataMode.DPT), DataMode.DPT) == 0
+
+    df = pd.read_csv(csv_path, float_precision="round_trip")
+    assert len(df) == res.data.size
+    assert all(res.data[_t, _s] == _v for _t, _s, _v in zip(df["target_index"], df["style_index"], df["value"]))
+
+    npy_path = tmp_path / "grid.npy"
+    sink = NpySink(npy_path, ax, DataMode.DPT, flush_every=1)
+    first = next(iter_bedevere_the_wise(ax, DataMode.DPT))
+    sink.write(first)
+    sink.close()
+
+    completed = NpySink(npy_path, ax, DataMode.DPT).completed()
+    assert first.index in completed
+    assert sum(_i in completed for _i in np.ndindex(res.data.shape)) == 1
+
+    assert write_bedevere_the_wise(ax, NpySink(npy_path, ax, DataMode.DPT), DataMode.DPT) == res.data.size - 1
+    np.testing.assert_array_equal(NpySink(npy_path, ax, DataMode.DPT).result().data, res.data)
+
+
+def test_parquet_sink_resume(tmp_path):
+    pytest.importorskip("pyarrow")
+    ax = _streaming_axes()
+    res = bedevere_the_wise(ax, DataMode.DPT)
+    path = tmp_path / "grid"
+
+    with ParquetSink(path, ax, DataMode.DPT, flush_every=2) as sink:
+        for record, _ in zip(iter_bedevere_the_wise(ax, DataMode.DPT), range(3)):
+            sink.write(record)
+
+    completed = ParquetSink(path, ax, DataMode.DPT).completed()
+    assert sum(_i in completed for _i in np.ndindex(res.data.shape)) == 3
+
+    assert write_bedevere_the_wise(ax, ParquetSink(path, ax, DataMode.DPT), DataMode.DPT) == res.data.size - 3
+    assert write_bedevere_the_wise(ax, ParquetSink(path, ax, DataMode.DPT), DataMode.DPT) == 0
+
+    df = ParquetSink(path, ax, DataMode.DPT).read()
+    assert len(df) == res.data.size
+    assert all(res.data[_t, _s] == _v for _t, _s, _v in zip(df["target_index"], df["style_index"], df["value"]))
+
+
+def test_robin_the_brave():
+    player = Player()
+    player.eqp = Equipment().equip(AbyssalWhip, BerserkerRingI)
+    player.style = WhipStyles[Styles.LASH]
+    target = Tekton.simple(1)
+
+    switches = [AvernicDefender, FerociousGloves, PrimordialBoots, SalveAmuletEI, OsmumtensFang, InquisitorsMace]
+    results = robin_the_brave(player, target, switches, 2, top_k=3)
+
+    # brute force every set of at most two switches
+    brute_force = []
+    CombatStrategy(player, prayers=Prayers(prayers=[Piety]), boosts=Overload).activate()
+
+    for n in range(3):
+        for gear_set in combinations(switches, n):
+            if len({_g.slot for _g in gear_set}) < n:
+                continue
+
+            player.eqp = Equipment().equip(AbyssalWhip, BerserkerRingI).equip(*gear_set)
+            styles = player.wpn.styles
+            player.style = WhipStyles[Styles.LASH] if WhipStyles[Styles.LASH] in styles else styles.default
+            brute_force.append(PvMCalc(player, target).get_damage().per_tick)
+
+    assert [_r.value for _r in results] == sorted(brute_force, reverse=True)[:3]
+    assert all(len(_r.gear) <= 2 for _r in results)
+
+
+@pytest.mark.parametrize(
+    "weapon, style, spell",
+    [
+        (TridentOfTheSwamp, PoweredStaffStyles[Styles.ACCURATE], PoweredSpells.TRIDENT_OF_THE_SWAMP.value),
+        (MysticSmokeStaff, None, StandardSpells.FIRE_SURGE.value),
+    ],
+)
+def test_robin_the_brave_magic(weapon, style, spell):
+    player = Player()
+    player.eqp = Equipment().equip(weapon, BrimstoneRing)
+    player.style = style or player.wpn.styles.default
+    player.autocast = spell
+    target = Tekton.simple(1)
+
+    switches = [OccultNecklace, TormentedBracelet, SeersRingI, ArcaneSpiritShield, AncestralHat, GodCapeI]
+    results = robin_the_brave(player, target, switches, 2, prayers=Augury, boosts=None, top_k=3)
+
+    brute_force = []
+    CombatStrategy(player, prayers=Prayers(prayers=[Augury]), boosts=None).activate()
+
+    for n in range(3):
+        for gear_set in combinations(switches, n):
+            if len({_g.slot for _g in gear_set}) < n:
+                continue
+
+            player.eqp = Equipment().equip(weapon, BrimstoneRing).equip(*gear_set)
+            brute_force.append(PvMCalc(player, target).get_damage().per_tick)
+
+    assert [_r.value for _r in results] == pytest.approx(sorted(brute_force, reverse=True)[:3])
+
+
+def test_galahad_the_pure():
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(GhraziRapier, AvernicDefender)
+    player.style = StabSwordStyles[Styles.LUNGE]
+    target = Tekton.simple(1)
+
+    results = galahad_the_pure(player, target, weapons=[GhraziRapier, ScytheOfVitur], top_k=3)
+
+    # the preset must never beat a search that includes it
+    CombatStrategy(player, prayers=Prayers(prayers=[Piety]), boosts=Overload).activate()
+    preset = PvMCalc(player, target).get_damage().per_tick
+
+    assert len(results) == 3
+    assert [_r.value for _r in results] == sorted((_r.value for _r in results), reverse=True)
+    assert results[0].value >= preset
+
+    for loadout in results:
+        assert loadout.style in loadout.equipment.weapon.styles
+        assert not (loadout.equipment.weapon.two_handed and loadout.equipment.shield is not None)
+
+
+def _missing_item(name: str):
+    raise KeyError(name)
+
+
+class _BrokenGear(GearRegistry):
+    AbyssalWhip = Lazy(_missing_item, "abyssal whip")
+
+
+def _buggy_item(name: str):
+    raise TypeError(name)
+
+
+class _BuggyGear(GearRegistry):
+    AbyssalWhip = Lazy(_buggy_item, "abyssal whip")
+
+
+def test_gear_database_falls_back_to_rows(monkeypatch, caplog):
+    monkeypatch.setattr(common_gear, "COMMON_GEAR", _BrokenGear())
+    gear_df = GEAR_DF.loc[GEAR_DF["name"].isin(["abyssal whip", "amulet of torture"])]
+    database = GearDatabase.from_dataframe(gear_df)
+
+    assert [_g.name for _g in database.gear[Slots.WEAPON]] == ["abyssal whip"]
+    assert [_g.name for _g in database.gear[Slots.NECK]] == ["amulet of torture"]
+    assert "abyssal whip" in caplog.text
+
+    # bugs aren't mistaken for missing items
+    monkeypatch.setattr(common_gear, "COMMON_GEAR", _BuggyGear())
+
+    with pytest.raises(TypeError):
+        GearDatabase.from_dataframe(gear_df)
+
+
+def test_non_dominated():
+    rng = np.random.default_rng(0)
+    points = rng.integers(0, 20, (3000, 3))
+
+    ge = np.all(points[None, :, :] >= points[:, None, :], axis=2)
+    gt = np.any(points[None, :, :] > points[:, None, :], axis=2)
+    strictly_dominated = (ge & gt).any(axis=1)
+    _, first = np.unique(points, axis=0, return_index=True)
+
+    expected = np.zeros(len(points), dtype=bool)
+    expected[first] = True
+    expected &= ~strictly_dominated
+
+    assert (non_dominated(points) == expected).all()
+
+
+def test_lancelot_the_brave():
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(GhraziRapier, AvernicDefender)
+    player.style = StabSwordStyles[Styles.LUNGE]
+    target = Tekton.simple(1)
+
+    pool = [ScytheOfVitur, InquisitorsMace, *InquisitorsArmourSet, BerserkerNecklace, SalveAmuletEI, BarrowsGloves]
+    results = lancelot_the_brave(player, target, pool, defence_types=DT.MAGIC)
+
+    # brute force every loadout
+    CombatStrategy(player, prayers=Prayers(prayers=[Piety]), boosts=Overload).activate()
+    base = copy(player.eqp)
+    options = {}
+
+    for g in pool:
+        options.setdefault(g.slot, [base[g.slot]]).append(g)
+
+    objectives = []
+
+    for gear_set in product(*options.values()):
+        player.eqp = copy(base).equip(*gear_set)
+
+        if player.eqp.weapon.two_handed and player.eqp.shield is not None:
+            continue
+
+        styles = player.wpn.styles
+        player.style = StabSwordStyles[Styles.LUNGE] if StabSwordStyles[Styles.LUNGE] in styles else styles.default
+        dps = PvMCalc(player, target).get_damage().per_second
+        objectives.append((dps, int(player.eqp.defensive_bonus[DT.MAGIC]), player.eqp.prayer_bonus))
+
+    objectives = np.array(objectives)
+    expected = objectives[non_dominated(objectives)]
+    found = np.array([(_r.value, _r.defence, _r.prayer) for _r in results])
+
+    assert sorted(map(tuple, found)) == sorted(map(tuple, expected))
+    assert [_r.value for _r in results] == sorted((_r.value for _r in results), reverse=True)
+
+
+def test_arthur_king_of_the_britons():
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(GhraziRapier, AvernicDefender)
+    player.style = StabSwordStyles[Styles.LUNGE]
+    CombatStrategy(player, prayers=Prayers(prayers=[Piety]), boosts=Overload).activate()
+    target = Tekton.simple(1)
+
+    results = {_r.stat: _r for _r in arthur_king_of_the_britons(player, target)}
+    assert set(results) == {"attack level", "strength level", "accuracy bonus", "strength bonus"}
+    base = PvMCalc(player, target).get_damage()
+
+    # +1 visible level agrees with a full calculation
+    for skill, stat in ((Skills.ATTACK, "attack level"), (Skills.STRENGTH, "strength level")):
+        levels = player.lvl
+        player.lvl = copy(levels)
+        player.lvl[skill] = Level(int(levels[skill]) + 1)
+        damage = PvMCalc(player, target).get_damage()
+        player.lvl = levels
+
+        assert results[stat].dps_delta == pytest.approx(damage.per_second - base.per_second)
+        assert results[stat].max_hit_breakpoint == (damage.max_hit > base.max_hit)
+
+    assert not results["accuracy bonus"].max_hit_breakpoint
+    assert results["accuracy bonus"].accuracy_breakpoint
+    assert results["accuracy bonus"].to_next_max_hit is None
+    assert not results["strength bonus"].accuracy_breakpoint
+    assert results["strength bonus"].to_next_max_hit is not None
+    assert PvMCalc(player, target).get_damage().per_second == base.per_second
+
+
+def test_arthur_king_of_the_britons_without_autocast():
+    player = Player()
+    player.eqp = Equipment().equip(SanguinestiStaff, BrimstoneRing)
+    player.style = PoweredStaffStyles[Styles.ACCURATE]
+
+    with pytest.raises(AnalysisError):
+        arthur_king_of_the_britons(player, Tekton.simple(1))
+
+
 def test_style_crunch():
     player = Player()
     player.eqp = Equipment().equip_bis_melee().equip(AvernicDefender)
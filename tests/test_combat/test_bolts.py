@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.combat import PvMCalc
+from osrs_tools.combat.bolts import BoltEffects, bolt_damage
+from osrs_tools.data import MonsterTypes, Styles
+from osrs_tools.gear import ArmadylCrossbow, OnyxDragonBoltsE, ZaryteCrossbow
+from osrs_tools.gear.common_gear import RubyDragonBoltsE
+from osrs_tools.gear.equipment import Equipment
+from osrs_tools.style.all_weapon_styles import CrossbowStyles
+
+
+def test_diamond_bolts():
+    dam = bolt_damage(BoltEffects.DIAMOND.value, 5, 40, 0.5, 112, 1000)
+    pmf = dam.total_pmf
+
+    assert dam.max_hit == 46
+    assert pmf.sum() == pytest.approx(1)
+    assert pmf[0] == pytest.approx(0.9 * (0.5 + 0.5 / 41) + 0.1 / 47)
+    assert dam.mean_hit == pytest.approx(0.9 * 0.5 * 20 + 0.1 * 23)
+
+
+def test_ruby_bolts_zaryte_and_cap():
+    effect = BoltEffects.RUBY.value
+    dam = bolt_damage(effect, 5, 40, 1.0, 112, 1000, zaryte=True)
+    assert dam.max_hit == 110
+
+    dam = bolt_damage(effect, 5, 40, 1.0, 112, 30, kandarin_hard_diary=True)
+    assert dam.max_hit == 30
+    assert dam.hitsplats[0].probability[6] == pytest.approx(0.066 + 0.934 / 41)
+
+
+def test_flat_bolts_and_immunity():
+    opal = bolt_damage(BoltEffects.OPAL.value, 5, 40, 0.0, 99, 1000)
+    assert opal.max_hit == 49
+    assert opal.probability_nonzero_damage == pytest.approx(0.05)
+
+    pearl = BoltEffects.PEARL.value
+    assert bolt_damage(pearl, 5, 40, 0.5, 99, 1000, [MonsterTypes.FIERY]).max_hit == 46
+    assert bolt_damage(pearl, 5, 40, 0.5, 99, 1000).max_hit == 44
+
+    dragonstone = BoltEffects.DRAGONSTONE.value
+    assert bolt_damage(dragonstone, 5, 40, 0.5, 99, 1000, [MonsterTypes.DRACONIC]).max_hit == 40
+    assert bolt_damage(dragonstone, 5, 40, 0.5, 99, 1000).max_hit == 59
+
+
+def test_crossbow_pvm_calc():
+    monster = Monster.dummy()
+    monster.special_attributes = []
+
+    player = Player()
+    player.eqp = Equipment().equip_bis_ranged().equip(ArmadylCrossbow, OnyxDragonBoltsE)
+    player.style = CrossbowStyles[Styles.RAPID]
+    normal = PvMCalc(player, monster).get_damage()
+    special = PvMCalc(player, monster).get_damage(special_attack=True)
+
+    assert normal.max_hit == np.floor(32 * 1.2)
+    assert special.mean_hit > normal.mean_hit
+
+    player.eqp.equip(ZaryteCrossbow, RubyDragonBoltsE)
+    assert PvMCalc(player, monster).get_damage(special_attack=True).probability_nonzero_damage == 1
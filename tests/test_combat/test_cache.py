@@ -0,0 +1,177 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+
+import pytest
+
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.combat import (
+    DamageCache,
+    DiskDamageCache,
+    FingerprintError,
+    PvMCalc,
+    code_version,
+    fingerprint,
+    stable_hash,
+)
+from osrs_tools.combat.cache_cli import main
+from osrs_tools.data import Styles
+from osrs_tools.gear import AbyssalTentacle, BrimstoneRing
+from osrs_tools.style.all_weapon_styles import WhipStyles
+from osrs_tools.tracked_value import Level
+
+
+def _whip_player() -> Player:
+    player = Player()
+    player.eqp += AbyssalTentacle
+    player.style = WhipStyles[Styles.LASH]
+    return player
+
+
+def test_fingerprint_is_canonical():
+    player = _whip_player()
+    clone = deepcopy(player)
+
+    assert fingerprint(player) == fingerprint(clone)
+    assert hash(fingerprint(player)) == hash(fingerprint(clone))
+
+    clone.eqp += BrimstoneRing
+    assert fingerprint(player) != fingerprint(clone)
+
+
+def _scale(factor: float):
+    return lambda x: factor * x
+
+
+class _Scaler:
+    def __call__(self, x: float) -> float:
+        return x
+
+
+def test_fingerprint_callables():
+    assert fingerprint(_scale(1)) == fingerprint(_scale(1))
+    assert fingerprint(_scale(1)) != fingerprint(_scale(2))
+    assert fingerprint(partial(round, ndigits=1)) != fingerprint(partial(round, ndigits=2))
+    assert fingerprint(lambda x, y=1: x) != fingerprint(lambda x, y=2: x)
+    assert fingerprint(_whip_player) == fingerprint(_whip_player)
+
+    with pytest.raises(FingerprintError):
+        fingerprint(_Scaler())
+
+
+def test_cached_get_damage():
+    player = _whip_player()
+    monster = Monster.dummy()
+    cache = DamageCache()
+
+    expected = PvMCalc(player, monster).get_damage()
+    first = PvMCalc(player, monster, cache).get_damage()
+    second = PvMCalc(player, monster, cache).get_damage()
+
+    assert first is second
+    assert first.max_hit == expected.max_hit
+    assert first.per_tick == expected.per_tick
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+    player.eqp += BrimstoneRing
+    PvMCalc(player, monster, cache).get_damage()
+    assert cache.info().misses == 2
+    assert len(cache) == 2
+
+
+def test_cache_eviction_and_invalidation():
+    player = _whip_player()
+    monster = Monster.dummy()
+    cache = DamageCache(maxsize=2)
+
+    for defence in range(3):
+        monster.levels.defence = Level(defence)
+        PvMCalc(player, monster, cache).get_damage()
+
+    assert cache.info().evictions == 1
+    assert len(cache) == 2
+    assert cache.invalidate(defender=monster) == 1
+    assert cache.invalidate(attacker=player) == 1
+    assert len(cache) == 0
+
+
+def test_stable_hash():
+    player = _whip_player()
+
+    assert stable_hash(fingerprint(player)) == stable_hash(fingerprint(deepcopy(player)))
+    assert stable_hash(frozenset(["a", "b", 1.5])) == stable_hash(frozenset([1.5, "b", "a"]))
+    assert stable_hash((1, "1")) != stable_hash(("1", 1))
+
+
+def test_disk_cache_persists(tmp_path):
+    player = _whip_player()
+    monster = Monster.dummy()
+    path = tmp_path / "cells.sqlite"
+
+    with DiskDamageCache(path) as cache:
+        expected = PvMCalc(player, monster, cache).get_damage()
+        assert cache.info().misses == 1
+
+    with DiskDamageCache(path) as cache:
+        cached = PvMCalc(player, monster, cache).get_damage()
+        assert cache.info().hits == 1
+        assert cached.per_tick == expected.per_tick
+        assert cached.max_hit == expected.max_hit
+
+    # a new data version misses & leaves the old entry stale
+    with DiskDamageCache(path, version="edited") as cache:
+        PvMCalc(player, monster, cache).get_damage()
+        assert cache.info().misses == 1
+        assert cache.info().stale == 1
+        assert cache.prune(stale=True) == 1
+        assert len(cache) == 1
+
+
+def test_disk_cache_eviction(tmp_path):
+    player = _whip_player()
+    monster = Monster.dummy()
+    path = tmp_path / "cells.sqlite"
+
+    with DiskDamageCache(path, max_entries=2) as cache:
+        for defence in range(3):
+            monster.levels.defence = Level(defence)
+            PvMCalc(player, monster, cache).get_damage()
+            assert len(cache) <= 2
+
+        assert cache.evictions >= 1
+        assert cache.evict(max_entries=1) == len(cache) - 1
+        assert len(cache) == 1
+
+        # the totals kept by triggers match the table
+        assert cache._size() == cache.connection.execute("SELECT COUNT(*), SUM(size) FROM cells").fetchone()
+
+    assert main(["prune", str(path), "--max-entries", "1"]) == 0
+    assert main(["clear", str(path)]) == 0
+
+    with DiskDamageCache(path) as cache:
+        assert len(cache) == 0
+
+
+def test_code_version(tmp_path):
+    (tmp_path / "calc.py").write_text("MAX_HIT = 1\n")
+    before = code_version(tmp_path)
+    (tmp_path / "calc.py").write_text("MAX_HIT = 2\n")
+
+    assert code_version(tmp_path) != before
+    assert code_version() == code_version()
+
+
+def test_disk_cache_threads(tmp_path):
+    player = _whip_player()
+    monster = Monster.dummy()
+
+    with DiskDamageCache(tmp_path / "cells.sqlite") as cache:
+        key = cache.key(player, monster)
+        cache.put(key, PvMCalc(player, monster).get_damage())
+
+        with ThreadPoolExecutor(4) as pool:
+            values = list(pool.map(lambda _: cache.get(key), range(8)))
+
+        assert all(_v is not None and _v.per_tick == values[0].per_tick for _v in values)
@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+from osrs_tools.combat.damage import Damage, DamageError, Hitsplat, HitsplatBatch, KillTimeDistribution, UniformHitsplat
+
+
+def test_kill_time_deterministic():
+    hs = Hitsplat(np.arange(0, 6), np.asarray([0, 0, 0, 0, 0, 1.0]))
+    dam = Damage(4, [hs])
+    ktd = KillTimeDistribution(dam, 10)
+
+    assert ktd.attacks_quantile(0.5) == 2
+    assert ktd.ticks_quantile(0.9) == 8
+    assert ktd.mean_ticks == pytest.approx(8)
+
+
+def test_kill_time_geometric():
+    dam = Damage.basic_constructor(5, 1, 1.0)
+    ktd = dam.kill_time_distribution(1)
+    n = ktd.attacks[:10]
+
+    assert np.allclose(ktd.probability[:10], 0.5**n)
+    assert ktd.mean_attacks == pytest.approx(2)
+    assert ktd.ticks_quantile(0.5) == 5
+
+
+def test_kill_time_overkill_and_multiple_hitsplats():
+    hs = Hitsplat.basic_constructor(10, 0.8)
+    dam = Damage(5, [hs, hs])
+    ktd = KillTimeDistribution(dam, 30)
+
+    rng = np.random.default_rng(0)
+    trials = rng.integers(0, 11, size=(20_000, 60)) * (rng.random((20_000, 60)) < 0.8)
+    trials = trials.reshape(20_000, 30, 2).sum(axis=2)
+    attacks = np.argmax(trials.cumsum(axis=1) >= 30, axis=1) + 1
+
+    assert ktd.mean_attacks == pytest.approx(attacks.mean(), rel=0.02)
+    assert ktd.cdf[-1] == pytest.approx(1)
+    assert ktd.mean_attacks > 30 / dam.mean_hit
+
+
+def test_kill_time_no_damage():
+    dam = Damage.basic_constructor(4, 10, 0.0)
+
+    with pytest.raises(DamageError):
+        KillTimeDistribution(dam, 10)
+
+
+def test_total_pmf_scythe():
+    hs = [Hitsplat.basic_constructor(mh, 0.9) for mh in (40, 20, 10)]
+    dam = Damage(5, hs)
+    pmf = dam.total_pmf
+
+    assert pmf.size == 71
+    assert pmf.sum() == pytest.approx(1)
+    assert np.dot(np.arange(pmf.size), pmf) == pytest.approx(dam.mean_hit)
+    assert dam.variance == pytest.approx(sum(Damage(5, [h]).variance for h in hs))
+    assert dam.quantile(0) == 0
+    assert dam.quantile(1) == 70
+
+
+def test_total_pmf_fft_matches_direct():
+    hs = [Hitsplat.basic_constructor(60, 0.75) for _ in range(11)]
+    dam = Damage(4, hs)
+    direct = hs[0].pmf
+
+    for h in hs[1:]:
+        direct = np.convolve(direct, h.pmf)
+
+    assert dam.total_pmf.size == direct.size
+    assert np.allclose(dam.total_pmf, direct, atol=1e-12)
+
+
+def test_hitsplat_batch_matches_basic_constructor():
+    max_hits = np.asarray([0, 1, 25, 48, 70])
+    accuracies = np.asarray([0.5, 1.0, 0.0, 0.66, 0.91])
+    caps = np.asarray([10, 10, 10, 50, 30])
+    batch = Hitsplat.basic_batch(max_hits, accuracies, caps)
+
+    assert isinstance(batch, HitsplatBatch)
+    assert batch.probability.shape == (5, 49)
+    assert np.allclose(batch.probability.sum(axis=1), 1)
+
+    for idx, hs in enumerate(batch):
+        expected = Hitsplat.basic_constructor(int(max_hits[idx]), float(accuracies[idx]), int(caps[idx]))
+
+        assert np.array_equal(hs.damage, expected.damage)
+        assert np.allclose(hs.probability, expected.probability)
+        assert batch.mean_hit[idx] == pytest.approx(expected.mean_hit)
+        assert batch.probability_nonzero_damage[idx] == pytest.approx(expected.probability_nonzero_damage)
+
+
+def test_seeded_sampler():
+    hs = Hitsplat.basic_constructor(30, 0.7, 20)
+    a = hs.sample(200_000, rng=7)
+    b = hs.sample(200_000, rng=7)
+
+    assert np.array_equal(a, b)
+    assert a.max() <= 20
+    assert np.allclose(np.bincount(a, minlength=21) / a.size, hs.probability, atol=5e-3)
+
+    dam = Damage(5, [hs, hs, hs])
+    hits = dam.sample(10, rng=np.random.default_rng(1))
+
+    assert hits.shape == (10, 3)
+    assert dam.random_hit(4).shape == (12,)
+    assert dam.sample_total(100_000, rng=3).mean() == pytest.approx(dam.mean_hit, rel=0.02)
+
+
+@pytest.mark.parametrize(
+    "high, accuracy, cap, low",
+    [(40, 0.8, None, 0), (40, 0.8, 25, 0), (47, 0.6, 30, 7), (47, 1.0, 5, 7), (1, 0.5, None, 0)],
+)
+def test_uniform_hitsplat_closed_form(high, accuracy, cap, low):
+    hs = UniformHitsplat(high, accuracy, cap, low)
+    dense = hs.to_hitsplat()
+    damage = np.arange(dense.damage.size)
+    mean = np.dot(damage, dense.probability)
+
+    assert hs.mean_hit == pytest.approx(dense.mean_hit)
+    assert hs.max_hit == dense.max_hit
+    assert hs.min_hit == dense.damage[dense.probability > 0].min()
+    assert hs.probability_nonzero_damage == pytest.approx(1 - dense.probability[0])
+    assert hs.variance == pytest.approx(np.dot((damage - mean) ** 2, dense.probability))
+
+    cdf = np.cumsum(dense.probability)
+
+    for q in (0.0, 0.1, 0.25, 0.5, 0.9, 1.0):
+        assert hs.quantile(q) == min(int(np.searchsorted(cdf, q - 1e-9)), cdf.size - 1)
+
+
+def test_uniform_hitsplat_is_lazy():
+    dam = Damage.basic_constructor(4, 50, 0.7, 30)
+
+    assert isinstance(dam.hitsplats[0], UniformHitsplat)
+    assert "probability" not in vars(dam.hitsplats[0])
+    assert dam.max_hit == 30
+    assert dam.per_tick == pytest.approx(Hitsplat.basic_constructor(50, 0.7, 30).mean_hit / 4)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from osrs_tools.boost.boosts import Overload
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.combat import CalcPlan, CalcPlanError, PlanKind, PvMCalc
+from osrs_tools.data import Styles
+from osrs_tools.gear import AbyssalTentacle, DragonClaws, DragonWarhammer
+from osrs_tools.gear.common_gear import AvernicDefender, BrimstoneRing, OsmumtensFang, ScytheOfVitur, TumekensShadow
+from osrs_tools.gear.equipment import Equipment
+from osrs_tools.prayer.all_prayers import Piety
+from osrs_tools.spell.spells import PoweredSpells
+from osrs_tools.style.all_weapon_styles import (
+    BluntStyles,
+    ClawStyles,
+    PoweredStaffStyles,
+    ScytheStyles,
+    StabSwordStyles,
+    WhipStyles,
+)
+
+
+def _melee_player(weapon, style):
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(weapon)
+    player.style = style
+    player.boost(Overload)
+    player.pray(Piety)
+    return player
+
+
+def _assert_matches(plan, dam, index=()):
+    ev = plan.evaluate()
+    assert ev.mean_hit[index] == pytest.approx(dam.mean_hit)
+    assert ev.damage(index).max_hit == dam.max_hit
+    np.testing.assert_allclose(ev.damage(index).total_pmf, dam.total_pmf)
+
+
+def test_plan_matches_pvm_calc():
+    monster = Monster.dummy()
+    configurations = [
+        (AbyssalTentacle, WhipStyles[Styles.LASH], PlanKind.STANDARD),
+        (ScytheOfVitur, ScytheStyles[Styles.CHOP], PlanKind.SCYTHE),
+        (OsmumtensFang, StabSwordStyles[Styles.LUNGE], PlanKind.FANG),
+    ]
+
+    for weapon, style, kind in configurations:
+        player = _melee_player(weapon, style)
+
+        if weapon == OsmumtensFang:
+            player.eqp.equip(AvernicDefender)
+
+        plan = CalcPlan.compile(player, monster)
+        assert plan.kind is kind
+        _assert_matches(plan, PvMCalc(player, monster).get_damage())
+
+
+def test_plan_special_attack():
+    player = _melee_player(DragonWarhammer, BluntStyles[Styles.POUND])
+    monster = Monster.dummy()
+
+    plan = CalcPlan.compile(player, monster, special_attack=True)
+    _assert_matches(plan, PvMCalc(player, monster).get_damage(special_attack=True))
+
+    with pytest.raises(CalcPlanError):
+        CalcPlan.compile(_melee_player(DragonClaws, ClawStyles[Styles.SLASH]), monster, special_attack=True)
+
+
+def test_plan_magic():
+    player = Player()
+    player.eqp = Equipment().equip_bis_mage().equip(BrimstoneRing, TumekensShadow)
+    player.style = PoweredStaffStyles[Styles.ACCURATE]
+    player.autocast = PoweredSpells.TUMEKENS_SHADOW.value
+    monster = Monster.dummy()
+
+    plan = CalcPlan.compile(player, monster)
+    assert plan.base_damage is not None
+    _assert_matches(plan, PvMCalc(player, monster).get_damage())
+
+
+def test_plan_vectorized():
+    player = _melee_player(AbyssalTentacle, WhipStyles[Styles.LASH])
+    monster = Monster.dummy()
+    plan = CalcPlan.compile(player, monster)
+
+    levels = np.arange(90, 126)
+    defence_rolls = np.arange(0, 40_000, 5_000)
+    ev = plan.evaluate(plan.accuracy_level_transform(levels)[:, None], defence_roll=defence_rolls[None, :])
+    assert ev.shape == (levels.size, defence_rolls.size)
+
+    # the boosted visible attack level reproduces the compiled effective level
+    row = int(np.flatnonzero(levels == int(player.visible_attack))[0])
+    assert plan.accuracy_level_transform(int(player.visible_attack)) == plan.accuracy_level
+
+    for col, defence_roll in enumerate(defence_rolls):
+        expected = plan.evaluate(defence_roll=defence_roll)
+        assert ev.accuracy[row, col] == pytest.approx(expected.accuracy)
+
+    # accuracy increases with level & decreases with defence
+    assert np.all(np.diff(ev.accuracy, axis=0) >= 0)
+    assert np.all(np.diff(ev.accuracy, axis=1) <= 0)
+
+    strength_levels = plan.strength_level_transform(levels)
+    np.testing.assert_array_equal(np.diff(plan.evaluate(strength_level=strength_levels).max_hit) >= 0, True)
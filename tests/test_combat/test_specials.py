@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from osrs_tools.character.monster import Monster
+from osrs_tools.character.player import Player
+from osrs_tools.combat import PvMCalc
+from osrs_tools.combat.specials import SPECIAL_ATTACKS, SpecialAttackContext
+from osrs_tools.data import Styles
+from osrs_tools.gear import AbyssalDagger, DragonClaws, DragonDagger, DragonWarhammer
+from osrs_tools.gear.equipment import Equipment
+from osrs_tools.style.all_weapon_styles import ClawStyles, StabSwordStyles
+
+
+def _special_damage(weapon, style):
+    player = Player()
+    player.eqp = Equipment().equip_bis_melee().equip(weapon)
+    player.style = style
+    return PvMCalc(player, Monster.dummy()).get_damage(special_attack=True)
+
+
+def _independent_variance(dam):
+    return sum(np.dot(np.arange(hs.pmf.size) ** 2, hs.pmf) - hs.mean_hit**2 for hs in dam.hitsplats)
+
+
+def test_correlated_probability_nonzero_damage():
+    ctx = SpecialAttackContext(Player(), Monster.dummy(), 0.5, 30, 4, [])
+    abyssal = SPECIAL_ATTACKS.build(AbyssalDagger, ctx)
+    claws = SPECIAL_ATTACKS.build(DragonClaws, ctx)
+
+    assert abyssal.probability_nonzero_damage == pytest.approx(0.5 * (1 - 1 / 31**2))
+    # claws only deal nothing if all four miss and the 0-0-1-1 roll fails
+    assert claws.probability_nonzero_damage == pytest.approx(1 - 0.5**4 / 2)
+
+
+def test_registry():
+    assert DragonClaws in SPECIAL_ATTACKS
+    assert DragonWarhammer not in SPECIAL_ATTACKS
+
+
+def test_dragon_claws():
+    dam = _special_damage(DragonClaws, ClawStyles[Styles.SLASH])
+    total = dam.total_pmf
+
+    assert len(dam.hitsplats) == 4
+    assert total.sum() == pytest.approx(1)
+    assert np.dot(np.arange(total.size), total) == pytest.approx(dam.mean_hit)
+    # the total is correlated, it can't be the convolution of the marginals
+    assert dam.variance > _independent_variance(dam)
+    assert dam.probability_nonzero_damage == pytest.approx(1 - total[0])
+
+
+def test_daggers():
+    dds = _special_damage(DragonDagger, StabSwordStyles[Styles.LUNGE])
+    assert len(dds.hitsplats) == 2
+
+    abyssal = _special_damage(AbyssalDagger, StabSwordStyles[Styles.LUNGE])
+    accuracy = abyssal.hitsplats[0].accuracy
+
+    assert abyssal.total_pmf[0] == pytest.approx(1 - accuracy + accuracy / (abyssal.hitsplats[0].max_hit + 1) ** 2)
+    assert abyssal.mean_hit == pytest.approx(2 * abyssal.hitsplats[0].mean_hit)
+    # both hits land or neither does
+    assert abyssal.probability_nonzero_damage == pytest.approx(1 - abyssal.total_pmf[0])
+    assert abyssal.probability_nonzero_damage < accuracy
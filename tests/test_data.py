@@ -0,0 +1,45 @@
+"""Test that the osrsbox databases load lazily
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from osrs_tools import data
+
+# seconds, parsing the osrsbox item & monster json alone takes longer
+IMPORT_BUDGET = 1.0
+
+_IMPORT_SCRIPT = """
+import time
+
+start = time.perf_counter()
+import osrs_tools.data
+
+print(time.perf_counter() - start)
+print(*sorted({"ITEMS", "PRAYERS", "MONSTERS"} & set(vars(osrs_tools.data))))
+"""
+
+
+def test_import_time():
+    out = subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT], capture_output=True, text=True, check=True)
+    elapsed, *loaded = out.stdout.splitlines()
+
+    assert loaded == [""]
+    assert float(elapsed) < IMPORT_BUDGET
+
+
+def test_lazy_databases():
+    prayers = data.PRAYERS
+    assert data.PRAYERS is prayers
+    assert vars(data)["PRAYERS"] is prayers
+    assert "MONSTERS" in dir(data)
+
+    with pytest.raises(AttributeError):
+        _ = data.NOT_A_DATABASE
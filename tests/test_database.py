@@ -0,0 +1,71 @@
+"""Test the compiled tables against the resource CSVs
+
+###############################################################################
+# email:    noahgill409@gmail.com                                             #
+# created:                                                                    #
+###############################################################################
+"""
+
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from osrs_tools import database, utils
+
+
+def test_compiled_tables_match_csvs(tmp_path):
+    utils.compile_tables(tmp_path)
+
+    for name, (source, loader) in utils.TABLES.items():
+        df = database.load_table(name, source, tmp_path, utils.TABLES_VERSION)
+        expected = loader()
+
+        pd.testing.assert_frame_equal(df, expected)
+
+        for column in expected.columns[expected.dtypes == object]:
+            assert list(map(type, df[column])) == list(map(type, expected[column]))
+
+
+def test_stale_tables(tmp_path):
+    source, loader = utils.TABLES["cox"]
+    csv = shutil.copy(source, tmp_path)
+    database.compile_tables({"cox": (loader(), csv)}, tmp_path, "1")
+
+    assert database.load_table("cox", csv, tmp_path, "1") is not None
+    assert database.load_table("cox", csv, tmp_path, "2") is None
+    assert database.load_table("npc", csv, tmp_path, "1") is None
+
+    with open(csv, "a") as f:
+        f.write("\n")
+
+    assert database.load_table("cox", csv, tmp_path, "1") is None
+    assert database.load_table("cox", csv, tmp_path / "missing", "1") is None
+
+
+def test_load_columns_are_views(tmp_path):
+    utils.compile_tables(tmp_path)
+    source, loader = utils.TABLES["gear"]
+    expected = loader()
+    columns = database.load_columns("gear", source, tmp_path, utils.TABLES_VERSION, ["crush attack", "prayer"])
+
+    assert list(columns) == ["index", "crush attack", "prayer"]
+    np.testing.assert_array_equal(columns["crush attack"], expected["crush attack"])
+    np.testing.assert_array_equal(columns["index"], expected.index)
+
+    for values in columns.values():
+        assert isinstance(values, np.memmap) and not values.flags.writeable
+
+    with pytest.raises(database.DatabaseError):
+        database.load_columns("gear", source, tmp_path, utils.TABLES_VERSION, ["name"])
+
+    assert database.load_columns("gear", source, tmp_path, "2") is None
+
+
+def test_tables_version_follows_loaders(monkeypatch):
+    assert utils._tables_version() == utils.TABLES_VERSION
+
+    source, loader = utils.TABLES["cox"]
+    monkeypatch.setitem(utils.TABLES, "cox", (source, lambda: loader().head()))
+    assert utils._tables_version() != utils.TABLES_VERSION
@@ -0,0 +1,67 @@
+import pickle
+
+import numpy as np
+
+from osrs_tools.data import DT, Slots
+from osrs_tools.gear import Gear, GearColumns, Weapon
+from osrs_tools.gear.columns import BONUS_COLUMNS, SLOTS, gear_columns
+from osrs_tools.utils import GEAR_DF
+
+
+def test_columns_match_gear():
+    columns = gear_columns()
+    names = ["abyssal whip", "amulet of torture", "twisted bow", "elysian spirit shield"]
+    gear = [Weapon.from_bb("abyssal whip"), Gear.from_bb("amulet of torture")]
+    gear += [Weapon.from_bb("twisted bow"), Gear.from_bb("elysian spirit shield")]
+    rows = [int(np.flatnonzero(columns.names == _n)[0]) for _n in names]
+    from_gear = GearColumns.from_gear(gear)
+
+    for dt in BONUS_COLUMNS:
+        if dt is DT.MAGIC:  # magic damage is a modifier, not a strength bonus
+            expected = [[int(_g.aggressive_bonus.magic_attack.value), 0] for _g in gear]
+        else:
+            expected = [[int(_v) for _v in _g.aggressive_bonus[dt]] for _g in gear]
+
+        assert columns[rows].aggressive_bonus(dt).tolist() == expected
+
+    np.testing.assert_array_equal(columns[rows].aggressive, from_gear.aggressive)
+    np.testing.assert_array_equal(columns[rows].defensive, from_gear.defensive)
+    np.testing.assert_array_equal(columns[rows].prayer, from_gear.prayer)
+    np.testing.assert_array_equal(columns[rows].slot, from_gear.slot)
+    np.testing.assert_array_equal(columns[rows].attack_speed, from_gear.attack_speed)
+    np.testing.assert_array_equal(columns[rows].weapon_type, from_gear.weapon_type)
+    np.testing.assert_array_equal(columns[rows].two_handed, [False, False, True, False])
+    assert columns.gear(rows[0]).name == "abyssal whip"
+
+
+def test_top_k_per_slot():
+    columns = gear_columns()
+    weights = {"crush attack": 1, "melee strength": 1}
+    top = columns.top_k_per_slot(weights, k=3)
+
+    assert set(top) == set(columns.slots())
+
+    for slot, best in top.items():
+        rows = GEAR_DF.loc[GEAR_DF["slot"] == slot.value]
+        expected = (rows["crush attack"] + rows["melee strength"]).sort_values(ascending=False, kind="stable")
+        assert best.ids.tolist() == expected.index[:3].tolist()
+
+
+def test_select():
+    columns = gear_columns()
+    two_handed = columns.select(Slots.WEAPON, two_handed=True)
+    whips = columns.select(weapon_type="whips")
+
+    assert len(two_handed) and two_handed.two_handed.all()
+    assert (two_handed.slot == SLOTS.index(Slots.WEAPON)).all()
+    assert "abyssal whip" in whips.names
+    assert not columns.select(Slots.HEAD).two_handed.any()
+
+
+def test_pickle():
+    columns = gear_columns()
+    loaded = pickle.loads(pickle.dumps(columns))
+
+    assert len(pickle.dumps(columns)) < 200_000
+    np.testing.assert_array_equal(loaded.aggressive, columns.aggressive)
+    np.testing.assert_array_equal(loaded.names, columns.names)
@@ -0,0 +1,39 @@
+import pytest
+
+from osrs_tools import gear
+from osrs_tools.gear import Gear, Weapon
+from osrs_tools.gear.common_gear import COMMON_GEAR, CommonGear
+from osrs_tools.gear.registry import Alias, GearRegistry, Lazy, LazyList
+
+
+class _Registry(GearRegistry):
+    Whip = Lazy(Weapon.from_bb, "abyssal whip")
+    Torture = Lazy(Gear.from_bb, "amulet of torture")
+    Lash = Alias("Whip")
+    Kit = LazyList("Whip", "Torture")
+
+
+def test_registry_is_lazy():
+    registry = _Registry()
+    assert registry.built() == []
+    assert registry.names() == ["Whip", "Torture", "Lash", "Kit"]
+
+    assert registry.Lash is registry.Whip
+    assert registry.built() == ["Whip", "Lash"]
+    assert registry.Kit == [registry.Whip, registry.Torture]
+    assert registry.by_source_name("amulet of torture") is registry.Torture
+    assert registry.by_source_name("not an item") is None
+
+
+def test_common_gear():
+    # every name resolves, e.g. no typos in aliases & sets
+    for name, value in CommonGear().items():
+        assert value is not None, name
+
+    assert gear.Bowfa is gear.BowOfFaerdhinen
+    assert gear.TwistedBow is COMMON_GEAR.TwistedBow
+    assert gear.BandosSet[0] is gear.NeitiznotFaceguard
+    assert "TwistedBow" in dir(gear)
+
+    with pytest.raises(AttributeError):
+        _ = gear.NotAnItem
@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+from osrs_tools.tracked_value import (
+    DamageModifier,
+    DamageValue,
+    EquipmentStat,
+    Level,
+    LevelModifier,
+    tracking_enabled,
+    untracked,
+)
+
+
+def test_untracked():
+    level = Level(99, "attack")
+    modifier = LevelModifier(1.2, "piety")
+
+    tracked = level * modifier + 8
+    assert "piety" in tracked.comment
+
+    with untracked():
+        assert not tracking_enabled()
+        fast = level * modifier + 8
+        damage = DamageValue(50) * DamageModifier(1.15)
+
+    assert tracking_enabled()
+    assert isinstance(fast, Level) and fast == tracked
+    assert fast.comment == "126"
+    assert str(fast) == "Level(126)"
+    assert isinstance(damage, DamageValue) and damage == 57
+
+
+def test_untracked_restores_on_error():
+    try:
+        with untracked():
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert tracking_enabled()
+
+
+def test_interning():
+    assert EquipmentStat(0) is EquipmentStat.zero()
+    assert Level(99) is Level(99)
+    assert Level(99) is not Level(99, "maximum")
+    assert Level(99) is not EquipmentStat(99)
+    assert Level(200) is not Level(200)
+    assert pickle.loads(pickle.dumps(Level(5))) is Level(5)
+
+
+def test_immutable():
+    level = Level(99)
+
+    with pytest.raises(AttributeError):
+        level._value = 1
+
+    with pytest.raises(AttributeError):
+        level.extra = 1
+
+    assert Level(99) == 99
+
+
+def test_lazy_comment():
+    total = EquipmentStat(0)
+
+    for bonus in range(1, 6):
+        total = total + EquipmentStat(bonus, f"item {bonus}")
+
+    assert isinstance(total._comment, tuple)
+    assert "item 5" in total.comment and "item 1" in total.comment
+    assert isinstance(total._comment, str)
+
+    # deep chains don't recurse without bound when rendered
+    for _ in range(5_000):
+        total = total + EquipmentStat(1, "x")
+
+    assert total.comment.count("x") == 5_000
+
+    restored = pickle.loads(pickle.dumps(total))
+    assert restored == total and restored.comment == total.comment
@@ -11,3 +11,25 @@ from osrs_tools import utils
 
 def test_load_all():
     _ = utils
+
+
+def test_gear_index():
+    index = utils.gear_index()
+
+    for name in ("abyssal whip", "tumeken's shadow", ""):
+        expected = utils.GEAR_DF.loc[utils.GEAR_DF["name"] == name]
+        assert utils.lookup_gear(name).equals(expected)
+
+    assert utils.lookup_gear("Tumekens  Shadow")["name"].tolist() == ["tumeken's shadow"]
+    assert utils.lookup_gear("bgs")["name"].tolist() == ["bandos godsword"]
+    assert len(utils.lookup_gear("not an item")) == 0
+    assert "dragon-hunter lance" in index
+    assert utils.lookup_gear("abyssal whip", utils.GEAR_DF)["name"].tolist() == ["abyssal whip"]
+
+
+def test_search():
+    assert utils.search_gear("scythe of vit")[0] == "scythe of vitur"
+    assert utils.search_gear("twisted bwo")[0] == "twisted bow"
+    assert all(_n.startswith("great olm") for _n in utils.search_monsters("great olm", limit=3))
+    assert len(utils.search_gear("dragon", limit=5)) == 5
+    assert utils.get_cox_monster_base_stats_by_name("Olm")["name"].tolist() == ["great olm"]